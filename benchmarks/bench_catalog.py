@@ -0,0 +1,74 @@
+"""Whole-catalog sweeps: section tables, capacity tables and section selection."""
+
+import numpy as np
+
+from harness import benchmark
+from steelas.data.io import MemberLibrary, import_section_library
+from steelas.member.capacity import capacity_table, member_capacities
+from steelas.member.member import SteelMember, SteelSection
+from steelas.member.selection import select_lightest
+from steelas.member.table import SectionTable
+
+LIBRARIES = {"open": MemberLibrary.OpenSections, "hollow": MemberLibrary.HollowSections}
+LENGTHS = np.arange(0, 12001, 500)
+
+
+@benchmark("catalog.section_table", setup=LIBRARIES.get, params=list(LIBRARIES))
+def section_table(library):
+    """solve a section library from its CSV file (warm CSV cache)"""
+    SectionTable.from_library(library, compiled=False)
+
+
+@benchmark("catalog.compiled_table", setup=LIBRARIES.get, params=list(LIBRARIES))
+def compiled_table(library):
+    """load a compiled section library"""
+    SectionTable.from_library(library)
+
+
+def _section_dicts(library):
+    return import_section_library(LIBRARIES[library]).to_dict("records")
+
+
+@benchmark("catalog.member_objects", setup=_section_dicts, params=list(LIBRARIES))
+def member_objects(sections):
+    """one SteelMember per section of a library, with effective lengths"""
+    for d in sections:
+        SteelMember(SteelSection.from_section_dict(d), l_ex=4000, l_ey=4000, l_eb=4000)
+
+
+def _table(library):
+    return SectionTable.from_library(LIBRARIES[library])
+
+
+@benchmark("catalog.member_capacities", setup=_table, params=list(LIBRARIES))
+def member_capacities_sweep(table):
+    """capacities of every section at 25 effective lengths"""
+    n = len(table)
+    rows = np.repeat(np.arange(n), len(LENGTHS))
+    l_e = np.tile(LENGTHS, n)
+    member_capacities(table, l_ex=l_e, l_ey=l_e, l_eb=l_e, rows=rows)
+
+
+@benchmark("catalog.capacity_table", setup=_table, params=["open"])
+def capacity_table_sweep(table):
+    capacity_table(table, LENGTHS, axis="b")
+
+
+def _demands(_):
+    rng = np.random.default_rng(0)
+    n = 1000
+    return {
+        "sections": SectionTable.from_library(MemberLibrary.OpenSections),
+        "N_star": -rng.uniform(0, 2000, n),
+        "M_star": rng.uniform(0, 800, n),
+        "V_star": rng.uniform(0, 500, n),
+        "l_ex": rng.uniform(2000, 10000, n),
+        "l_ey": rng.uniform(1000, 5000, n),
+        "l_eb": rng.uniform(1000, 5000, n),
+    }
+
+
+@benchmark("catalog.select_lightest", setup=_demands, params=[1000])
+def select_lightest_sweep(demands):
+    """lightest open section for 1000 demand cases"""
+    select_lightest(**demands)
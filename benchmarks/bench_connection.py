@@ -0,0 +1,144 @@
+"""Connections: FEP and WSP over the ASI reference connections, design search, and
+eccentric bolt groups (elastic tables and ICR solutions)."""
+
+import numpy as np
+
+from harness import benchmark
+from steelas.component.bolt import Bolt, BoltGroup2D, eccentric_capacity_table
+from steelas.component.icr import (
+    bolt_group_layout,
+    icr_coefficients,
+    icr_solutions,
+    solve_icr,
+)
+from steelas.component.plate import Plate
+from steelas.component.weld import Weld
+from steelas.connection.featured_member import FeaturedMember
+from steelas.connection.FEP import FEPConnection
+from steelas.connection.WSP import WSPConnection
+from steelas.connection.search import search_connection
+from steelas.connection.table import (
+    ConnectionTable,
+    parse_bolt_group,
+    parse_plate,
+    parse_weld,
+)
+from steelas.member.member import SteelMember, SteelSection
+
+CONNECTIONS = {"FEP": FEPConnection, "WSP": WSPConnection}
+ERRORS = (ValueError, NotImplementedError, ZeroDivisionError)
+
+
+def _connection_inputs(conn_type: str) -> tuple[list[dict], dict]:
+    """
+    the object model inputs of every ASI reference connection that the object model can
+    evaluate, with the unfeatured members built once per section
+    """
+    table = ConnectionTable.from_library(conn_type)
+    members, rows = {}, []
+    for i in range(len(table)):
+        if table["error"][i] != "":
+            continue
+        section = table["section"][i]
+        if section not in members:
+            members[section] = SteelMember(SteelSection.from_name(section))
+        p = parse_bolt_group(table["bolt_group"][i])
+        gauges = list(p["gauges"])
+        kwargs = {"a": table["a"][i], "a_ev_e": table["a_ev_e"][i]}
+        if conn_type == "WSP":
+            gauges.pop(0)
+            kwargs.update(a_eh_e1=table["a_eh_e1"][i], s_g1=table["s_g1"][i])
+        rows.append(
+            {
+                "member": {
+                    "unfeatured_member": members[section],
+                    "features": table["cope_type"][i],
+                    **{k: table[k][i] for k in ["d_ct", "d_cb", "L_c", "r_c"]},
+                },
+                "bolt_group": dict(
+                    n_p=p["n_p"],
+                    n_g=p["n_g"],
+                    s_p=p["s_p"],
+                    s_g=gauges[0] if gauges else 0,
+                ),
+                "bolt": p["bolt"],
+                "plate": parse_plate(table["plate"][i]),
+                "weld": parse_weld(table["weld"][i]),
+                "connection": kwargs,
+            }
+        )
+    return rows, CONNECTIONS[conn_type]
+
+
+def _build(row: dict, conn_class):
+    return conn_class(
+        featured_member=FeaturedMember(**row["member"]),
+        bolt_group=BoltGroup2D(bolt=Bolt(**row["bolt"]), **row["bolt_group"]),
+        plate=Plate(**row["plate"]),
+        weld=Weld(**row["weld"]),
+        **row["connection"],
+    )
+
+
+def _evaluable_inputs(conn_type: str):
+    """_connection_inputs, without rows the object model raises on"""
+    rows, conn_class = _connection_inputs(conn_type)
+    ok = []
+    for row in rows:
+        try:
+            _build(row, conn_class)
+            ok.append(row)
+        except ERRORS:
+            pass
+    return ok, conn_class
+
+
+@benchmark("connection.objects", setup=_evaluable_inputs, params=list(CONNECTIONS))
+def connection_objects(state):
+    """one FEPConnection/WSPConnection per ASI reference connection"""
+    rows, conn_class = state
+    for row in rows:
+        _build(row, conn_class)
+
+
+@benchmark("connection.table", params=list(CONNECTIONS))
+def connection_table(conn_type):
+    """all ASI reference connections, evaluated as a ConnectionTable"""
+    ConnectionTable.from_library(conn_type)
+
+
+def _search_inputs(conn_type):
+    member = SteelMember(SteelSection.from_name("460UB82.1 (GR300)"))
+    fm = FeaturedMember(unfeatured_member=member, features="SWC", d_ct=65, L_c=120)
+    search_connection(fm, 300, conn_type=conn_type)  # component libraries
+    return fm, conn_type
+
+
+@benchmark("connection.search", setup=_search_inputs, params=list(CONNECTIONS))
+def connection_search(state):
+    fm, conn_type = state
+    search_connection(fm, 300, conn_type=conn_type)
+
+
+@benchmark("connection.eccentric_capacity_table")
+def eccentric_table():
+    """AUS_bolt_groups.csv eccentric capacities at e = 0, 5, ..., 300 mm"""
+    eccentric_capacity_table(np.arange(0, 301, 5))
+
+
+def _icr_layout(n_p):
+    return bolt_group_layout(BoltGroup2D(n_p=n_p, n_g=2, s_p=70, s_g=90))
+
+
+@benchmark("bolt_group.icr_solve", setup=_icr_layout, params=[10])
+def icr_solve(coords):
+    """one ICR solution of a 2 x 10 bolt group (cold solution pool)"""
+    icr_solutions.clear()
+    solve_icr(coords, 150)
+
+
+@benchmark("bolt_group.icr_batch", setup=_icr_layout, params=[10])
+def icr_batch(coords):
+    """ICR coefficients of a 2 x 10 bolt group at 600 eccentricities (cold pool)"""
+    icr_solutions.clear()
+    icr_coefficients(coords, np.linspace(1, 600, 600))
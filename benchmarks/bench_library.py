@@ -0,0 +1,63 @@
+"""Library import: package import, CSV parsing and section lookup."""
+
+import os
+import subprocess
+import sys
+
+import steelas
+from harness import benchmark
+from steelas.data.io import clear_library_cache, get_section, library_registry
+from steelas.data.io import load_library
+
+LIBRARIES = [
+    "AUS_open_sections",
+    "AUS_hollow_sections",
+    "AUS_tee_sections",
+    "ASI_FEP_connection",
+    "ASI_WSP_connection",
+]
+
+_IMPORT_SCRIPT = """
+import time
+t0 = time.perf_counter()
+import steelas.connection.FEP, steelas.connection.WSP, steelas.member.table
+t = time.perf_counter() - t0
+import sys
+assert "pandas" not in sys.modules, "pandas imported by the calculation modules"
+print(t)
+"""
+
+
+@benchmark("library.import_package", self_timed=True)
+def import_package():
+    """import time of the connection and member modules, in a new interpreter"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.path.dirname(os.path.dirname(steelas.__file__))
+    out = subprocess.run(
+        [sys.executable, "-c", _IMPORT_SCRIPT],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(out.stdout.split()[-1])
+
+
+@benchmark("library.read_csv", params=LIBRARIES)
+def read_csv(name):
+    """parse a library CSV file (cold library cache)"""
+    clear_library_cache(name)
+    load_library(name)
+
+
+@benchmark("library.name_index")
+def name_index():
+    """build the section name index over all section libraries (warm CSV cache)"""
+    library_registry.clear_index()
+    get_section("460UB82.1 (GR300)")
+
+
+@benchmark("library.get_section")
+def section_lookup():
+    """look up one section by name (warm name index)"""
+    get_section("460UB82.1 (GR300)")
@@ -0,0 +1,81 @@
+"""Object model: section geometry, slenderness, members and coped members."""
+
+from harness import benchmark
+from steelas.connection.featured_member import FeaturedMember
+from steelas.data.io import load_library
+from steelas.member.geometry import SectionGeometry
+from steelas.member.material import SteelMaterial
+from steelas.member.member import SteelMember, SteelSection
+from steelas.member.slenderness import SteelSlenderness
+
+SECTION_LIBRARIES = ["AUS_open_sections", "AUS_hollow_sections", "AUS_tee_sections"]
+SEC_TYPES = ["WB", "WC", "UB", "UC", "PFC", "RHS", "SHS", "CHS", "BT", "CT"]
+MEMBER = "460UB82.1 (GR300)"
+
+
+def section_row(sec_type: str) -> dict:
+    """the first library row of a section type"""
+    for name in SECTION_LIBRARIES:
+        for r in load_library(name).to_dict("records"):
+            if r["sec_type"] == sec_type:
+                return r
+    raise ValueError(f"no {sec_type} sections in {SECTION_LIBRARIES}")
+
+
+def _geometry(sec_type):
+    return SectionGeometry.from_dict(**section_row(sec_type))
+
+
+def _geometry_and_material(sec_type):
+    r = section_row(sec_type)
+    return SectionGeometry.from_dict(**r), SteelMaterial.from_dict(**r)
+
+
+@benchmark("geometry.solve_shape", setup=_geometry, params=SEC_TYPES)
+def solve_shape(geom):
+    geom.solve_shape()
+
+
+@benchmark("slenderness.construct", setup=_geometry_and_material, params=SEC_TYPES)
+def construct_slenderness(state):
+    geom, mat = state
+    SteelSlenderness(geom=geom, mat=mat)
+
+
+@benchmark("section.from_name", setup=lambda: MEMBER)
+def section_from_name(name):
+    SteelSection.from_name(name)
+
+
+def _member_inputs(case):
+    lengths = {"lengths": dict(l_ex=4000, l_ey=4000, l_eb=4000), "no_lengths": {}}
+    return SteelSection.from_name(MEMBER), lengths[case]
+
+
+@benchmark("member.construct", setup=_member_inputs, params=["no_lengths", "lengths"])
+def construct_member(state):
+    section, lengths = state
+    SteelMember(section=section, **lengths)
+
+
+@benchmark("member.update", setup=lambda: SteelMember(SteelSection.from_name(MEMBER)))
+def update_member(member):
+    """re-solve after an effective length change (cached section results)"""
+    member.update(l_eb=member.l_eb + 1)
+
+
+COPES = {
+    "O": dict(features="O"),
+    "SWC": dict(features="SWC", d_ct=65, L_c=120, r_c=10),
+    "DWC": dict(features="DWC", d_ct=65, d_cb=35, L_c=120, r_c=10),
+}
+
+
+def _featured_inputs(features):
+    return SteelMember(SteelSection.from_name(MEMBER)), COPES[features]
+
+
+@benchmark("featured_member.construct", setup=_featured_inputs, params=list(COPES))
+def construct_featured_member(state):
+    member, cope = state
+    FeaturedMember(unfeatured_member=member, **cope)
@@ -0,0 +1,83 @@
+"""
+Checks the import time of the steelas calculation path against its budget.
+
+Usage:
+    python benchmarks/check_import.py               # 150 ms budget, best of 5
+    python benchmarks/check_import.py --budget 200
+
+The connection and member modules are imported in a new interpreter with Python's
+-X importtime option, and the cumulative time of the steelas imports is taken as the
+best of --repeat runs. The exit status is 1 if pandas was imported, or if the import
+time is over --budget milliseconds (see docs/install.md).
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SRC = os.path.join(os.path.dirname(HERE), "src")
+
+MODULES = ["steelas.connection.FEP", "steelas.connection.WSP", "steelas.member.table"]
+BUDGET_MS = 150
+
+_SCRIPT = f"""
+import sys
+import {", ".join(MODULES)}
+print("pandas" in sys.modules)
+"""
+
+
+def import_time() -> tuple[float, bool]:
+    """
+    cumulative import time of MODULES in a new interpreter (ms), and whether pandas
+    was imported
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = SRC
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _SCRIPT],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    for line in out.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package, indented by level
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() in MODULES:
+            total += int(parts[1])
+    return total / 1000, out.stdout.split()[-1] == "True"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Check the steelas import time budget."
+    )
+    parser.add_argument(
+        "--budget", type=float, default=BUDGET_MS, help="budget in milliseconds"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="runs, best is taken")
+    args = parser.parse_args(argv)
+
+    runs = [import_time() for _ in range(args.repeat)]
+    t = min(t for t, _ in runs)
+    pandas = any(p for _, p in runs)
+    print(f"import time {t:.1f} ms (budget {args.budget:g} ms)")
+
+    status = 0
+    if pandas:
+        print("FAIL: pandas is imported by the calculation modules")
+        status = 1
+    if t > args.budget:
+        print("FAIL: import time is over budget")
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+"""
+Benchmark registry, timer and result comparison.
+
+Benchmarks are plain functions registered with the benchmark() decorator in the
+bench_*.py modules. Each benchmark is timed in repeats of a calibrated number of calls,
+so that a repeat takes at least min_time seconds, and reported per call. Results are
+saved as JSON and compared against a baseline file; benchmarks slower than the baseline
+by more than a threshold ratio are flagged as regressions.
+
+Classes:
+    Benchmark: A registered benchmark.
+
+Functions:
+    benchmark(): Registers a benchmark function.
+    run_benchmark(): Times one benchmark.
+    run(): Times the registered benchmarks and returns a result dict.
+    compare(): Compares results against a baseline.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable
+
+
+@dataclass
+class Benchmark:
+    """
+    A registered benchmark.
+
+    Attributes:
+        name (str): Unique name, 'group.case' or 'group.case[param]'.
+        fn (Callable): The timed function, called with the setup() result if there is one.
+        setup (Callable | None): Untimed setup, called once before timing.
+        self_timed (bool): If True, fn returns its own elapsed time in seconds (e.g. for
+            work done in a subprocess) and is called once per repeat.
+    """
+
+    name: str
+    fn: Callable
+    setup: Callable | None = None
+    self_timed: bool = False
+
+    @property
+    def group(self) -> str:
+        return self.name.split(".", 1)[0]
+
+
+registry: dict[str, Benchmark] = {}
+
+
+def benchmark(
+    name: str,
+    setup: Callable | None = None,
+    params: list | None = None,
+    self_timed: bool = False,
+):
+    """
+    registers the decorated function as a benchmark. With params, one benchmark is
+    registered per parameter value, named 'name[value]', and setup(value) is passed to
+    the function (or the value itself if there is no setup).
+    """
+
+    def decorator(fn):
+        if params is None:
+            _register(Benchmark(name, fn, setup, self_timed))
+            return fn
+        for p in params:
+            if setup is None:
+                p_setup = lambda p=p: p
+            else:
+                p_setup = lambda p=p: setup(p)
+            _register(Benchmark(f"{name}[{p}]", fn, p_setup, self_timed))
+        return fn
+
+    return decorator
+
+
+def _register(b: Benchmark) -> None:
+    if b.name in registry:
+        raise ValueError(f"duplicate benchmark name {b.name}")
+    registry[b.name] = b
+
+
+def run_benchmark(b: Benchmark, repeat: int = 5, min_time: float = 0.2) -> dict:
+    """times a benchmark, returning per-call statistics in seconds"""
+    # library notes printed by the calculations are not part of the output
+    with contextlib.redirect_stdout(io.StringIO()):
+        state = b.setup() if b.setup is not None else None
+        call = (lambda: b.fn(state)) if b.setup is not None else b.fn
+
+        if b.self_timed:
+            number = 1
+            times = [call() for _ in range(repeat)]
+        else:
+            # warm up (first-use caches), then calibrate the calls per repeat
+            call()
+            t0 = time.perf_counter()
+            call()
+            t_call = max(time.perf_counter() - t0, 1e-9)
+            number = max(1, int(min_time / t_call))
+            times = []
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                for _ in range(number):
+                    call()
+                times.append((time.perf_counter() - t0) / number)
+
+    return {
+        "group": b.group,
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def select(pattern: str | None = None) -> list[Benchmark]:
+    """registered benchmarks whose names contain pattern (all if None)"""
+    return [b for name, b in registry.items() if pattern is None or pattern in name]
+
+
+def run(
+    benchmarks: list[Benchmark],
+    repeat: int = 5,
+    min_time: float = 0.2,
+    progress: Callable[[str, dict], None] | None = None,
+) -> dict:
+    """times benchmarks and returns the results with environment metadata"""
+    results = {}
+    for b in benchmarks:
+        results[b.name] = run_benchmark(b, repeat=repeat, min_time=min_time)
+        if progress is not None:
+            progress(b.name, results[b.name])
+    return {"meta": environment(), "benchmarks": results}
+
+
+def environment() -> dict:
+    """machine, interpreter and source revision the results were measured with"""
+    import numpy as np
+    import pandas as pd
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = ""
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "executable": sys.executable,
+    }
+
+
+def save(results: dict, path: str) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+
+
+def load(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(
+    results: dict, baseline: dict, threshold: float = 1.25, stat: str = "min"
+) -> dict:
+    """
+    compares per-call times of the benchmarks in both results. A benchmark is a
+    regression if current / baseline > threshold, and an improvement if the ratio is
+    below 1 / threshold.
+
+    Returns:
+        dict: 'rows' (name, baseline, current, ratio) for the common benchmarks, and the
+            names of 'regressions', 'improvements', 'new' and 'missing' benchmarks.
+    """
+    current, base = results["benchmarks"], baseline["benchmarks"]
+    rows, regressions, improvements = [], [], []
+    for name in current:
+        if name not in base:
+            continue
+        ratio = current[name][stat] / base[name][stat]
+        rows.append((name, base[name][stat], current[name][stat], ratio))
+        if ratio > threshold:
+            regressions.append(name)
+        elif ratio < 1 / threshold:
+            improvements.append(name)
+    return {
+        "rows": rows,
+        "regressions": regressions,
+        "improvements": improvements,
+        "new": [k for k in current if k not in base],
+        "missing": [k for k in base if k not in current],
+    }
+
+
+def format_time(t: float) -> str:
+    for unit, scale in [("s", 1), ("ms", 1e-3), ("us", 1e-6)]:
+        if t >= scale:
+            return f"{t / scale:.3g} {unit}"
+    return f"{t / 1e-9:.3g} ns"
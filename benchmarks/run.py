@@ -0,0 +1,142 @@
+"""
+Runs the steelas benchmarks and compares them against a baseline.
+
+Usage:
+    python benchmarks/run.py                  # run all, compare with baseline.json
+    python benchmarks/run.py -k connection    # benchmarks whose name contains 'connection'
+    python benchmarks/run.py --save-baseline  # run, and store the results as the baseline
+    python benchmarks/run.py --list
+
+Results are written to benchmarks/results/<commit>-<time>.json. If a baseline exists
+(benchmarks/baseline.json, or --baseline PATH), each benchmark's per-call time is
+compared with it, and the exit status is 1 if any benchmark is slower by more than
+--threshold (default 1.25x).
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import importlib
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# benchmark the working tree, not an installed copy
+sys.path.insert(0, os.path.join(os.path.dirname(HERE), "src"))
+sys.path.insert(0, HERE)
+
+import harness  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(HERE, "baseline.json")
+RESULTS_DIR = os.path.join(HERE, "results")
+
+
+def load_benchmarks() -> None:
+    for path in sorted(glob.glob(os.path.join(HERE, "bench_*.py"))):
+        importlib.import_module(os.path.splitext(os.path.basename(path))[0])
+
+
+def print_comparison(c: dict, threshold: float) -> None:
+    width = max([len(r[0]) for r in c["rows"]], default=0)
+    print(f"\n{'benchmark':{width}}  {'baseline':>10}  {'current':>10}  ratio")
+    for name, base, current, ratio in c["rows"]:
+        flag = ""
+        if name in c["regressions"]:
+            flag = "  REGRESSION"
+        elif name in c["improvements"]:
+            flag = "  improved"
+        print(
+            f"{name:{width}}  {harness.format_time(base):>10}  "
+            f"{harness.format_time(current):>10}  {ratio:5.2f}{flag}"
+        )
+    for name in c["new"]:
+        print(f"{name:{width}}  (not in baseline)")
+    for name in c["missing"]:
+        print(f"{name:{width}}  (not run)")
+    print(
+        f"\n{len(c['regressions'])} regressions (> {threshold:g}x), "
+        f"{len(c['improvements'])} improvements (< {1 / threshold:.2f}x)"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the steelas benchmarks.")
+    parser.add_argument("-k", dest="pattern", help="run benchmarks containing PATTERN")
+    parser.add_argument("--list", action="store_true", help="list benchmarks and exit")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repeats")
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="minimum seconds per repeat"
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="one short repeat per benchmark"
+    )
+    parser.add_argument("-o", "--output", help="results file (default results/)")
+    parser.add_argument(
+        "--baseline", default=DEFAULT_BASELINE, help="baseline results file"
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="store the results as baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="slowdown ratio flagged as a regression",
+    )
+    parser.add_argument(
+        "--stat",
+        choices=["min", "median", "mean"],
+        default="min",
+        help="per-call statistic compared with the baseline",
+    )
+    args = parser.parse_args(argv)
+
+    load_benchmarks()
+    benchmarks = harness.select(args.pattern)
+    if args.list:
+        for b in benchmarks:
+            print(b.name)
+        return 0
+    if not benchmarks:
+        print(f"no benchmarks match {args.pattern}")
+        return 2
+
+    repeat, min_time = args.repeat, args.min_time
+    if args.quick:
+        repeat, min_time = 1, 0.02
+
+    def progress(name, r):
+        print(
+            f"{name:45} {harness.format_time(r[args.stat]):>10}"
+            f"  ({r['repeat']} x {r['number']})",
+            flush=True,
+        )
+
+    results = harness.run(
+        benchmarks, repeat=repeat, min_time=min_time, progress=progress
+    )
+
+    output = args.output
+    if output is None:
+        meta = results["meta"]
+        stamp = meta["timestamp"].replace(":", "").replace("-", "")[:15]
+        output = os.path.join(RESULTS_DIR, f"{meta['commit'] or 'local'}-{stamp}.json")
+    harness.save(results, output)
+    print(f"\nresults written to {output}")
+
+    status = 0
+    if not args.save_baseline and os.path.exists(args.baseline):
+        c = harness.compare(
+            results, harness.load(args.baseline), args.threshold, args.stat
+        )
+        print_comparison(c, args.threshold)
+        status = 1 if c["regressions"] else 0
+    if args.save_baseline:
+        harness.save(results, args.baseline)
+        print(f"baseline written to {args.baseline}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,7 @@ from steelas.member.geometry import SectionGeometry
 from steelas.member.material import SteelMaterial
 from steelas.member.slenderness import SteelSlenderness
 from steelas.data.io import MemberLibrary, get_section_from_library
+from steelas.data.precision import round_sig
 
 
 #########################
@@ -20,7 +21,7 @@ mat = SteelMaterial.from_dict(**sec_params)
 slenderness = SteelSlenderness(geom=geom, mat=mat)
 slenderness.report()
 
-print(f"Form factor for {slenderness.name} = {slenderness.k_f}")
+print(f"Form factor for {slenderness.name} = {round_sig(slenderness.k_f, 3)}")
 print("(ANS = 0.948, 7th Ed. Hot Rolled and Structural Steel Products)")
 
 # create a steel section directly with geometric, material, and slenderness properties.
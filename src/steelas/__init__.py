@@ -4,3 +4,5 @@ Created on Sat Mar 27 17:05:31 2021
 
 @author: joega
 """
+
+from steelas.profiling import Profile, profile
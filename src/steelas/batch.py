@@ -0,0 +1,140 @@
+"""
+Parallel batch runner.
+
+Runs large member capacity and connection capacity schedules on a process pool. Jobs are
+split into contiguous chunks, each evaluated with the vectorized engines
+(steelas.member.capacity.member_capacities and steelas.connection.table.ConnectionTable).
+The section catalog (member jobs) or the parsed section libraries (connection jobs) are
+prepared once in the parent process and handed to each worker once, through the pool
+initializer, so tasks only carry their chunk of the schedule.
+
+Functions:
+    run(): Evaluates a schedule of member or connection jobs, in input order.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+import os
+import numpy as np
+
+from steelas.data.io import MemberLibrary, library_cache
+from steelas.data.precision import round_frame
+from steelas.member.table import SectionTable
+from steelas.member.capacity import member_capacities
+from steelas.connection.table import ConnectionTable
+
+JOB_KINDS = ["member", "FEP", "WSP"]
+# member job columns, and their defaults
+MEMBER_JOB_DEFAULTS = {"l_ex": 0, "l_ey": 0, "l_eb": 0, "alpha_m": 1}
+
+# per-process state, set by _init_worker (or directly when running in-process)
+_worker = SimpleNamespace(table=None, library=None)
+
+
+def _init_worker(
+    table: SectionTable | None, library: MemberLibrary | str, libraries: dict
+):
+    _worker.table = table
+    _worker.library = library
+    library_cache.restore(libraries)
+
+
+def _run_chunk(kind: str, chunk: dict) -> dict:
+    """evaluates one chunk of jobs with the worker's catalog"""
+    if kind == "member":
+        return member_capacities(_worker.table, **chunk)
+    return ConnectionTable.from_frame(chunk, kind, _worker.library).columns
+
+
+def _chunks(jobs: dict, n: int, chunk_size: int):
+    for start in range(0, n, chunk_size):
+        yield {k: v[start : start + chunk_size] for k, v in jobs.items()}
+
+
+def _member_jobs(jobs, table: SectionTable) -> dict:
+    """table rows and effective lengths of member jobs with a 'section' name column"""
+    index = {name: i for i, name in enumerate(table["name"])}
+    names = np.asarray(jobs["section"], dtype=object)
+    missing = [name for name in dict.fromkeys(names) if name not in index]
+    if missing:
+        raise ValueError(f"Error: no sections with name equal to {missing[0]}")
+    n = len(names)
+    out = {"rows": np.array([index[name] for name in names], dtype=int)}
+    for k, default in MEMBER_JOB_DEFAULTS.items():
+        v = jobs[k] if k in jobs else default
+        out[k] = np.broadcast_to(np.asarray(v, dtype=float), (n,))
+    return out
+
+
+def run(
+    jobs,
+    kind: str = "member",
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    library: MemberLibrary | str = MemberLibrary.OpenSections,
+    table: SectionTable | None = None,
+    sig_figs: int | None = None,
+):
+    """
+    Evaluates a schedule of member or connection jobs on a process pool.
+
+    Member jobs have a 'section' column of section names and optional l_ex, l_ey, l_eb
+    (mm) and alpha_m columns; results have the member_capacities columns. Connection jobs
+    ('FEP' or 'WSP') have the ASI connection columns (member, bolt_group, plate, weld, a,
+    and optionally name and the cope dimensions); results have the ConnectionTable
+    columns.
+
+    Args:
+        jobs: DataFrame or dict of equal-length arrays, one row per job.
+        kind: 'member', 'FEP' or 'WSP'.
+        workers: number of worker processes (default os.cpu_count()). With workers=1 the
+            chunks are evaluated in this process.
+        chunk_size: jobs per task (default about 4 tasks per worker).
+        library: section library the members are taken from.
+        table: a SectionTable of library, if already built (member jobs only).
+        sig_figs: significant figures of the returned values (default unrounded).
+
+    Returns:
+        pandas.DataFrame: one row per job, in input order.
+    """
+    import pandas as pd
+
+    if kind not in JOB_KINDS:
+        raise ValueError(f"unknown job kind {kind}")
+    workers = workers or os.cpu_count() or 1
+
+    if kind == "member":
+        if table is None:
+            table = SectionTable.from_library(library)
+        jobs = _member_jobs(jobs, table)
+        n = len(jobs["rows"])
+    else:
+        table = None
+        jobs = {k: np.asarray(jobs[k]) for k in jobs}
+        n = len(jobs["member"])
+        # parse the libraries used by ConnectionTable once, to hand to the workers
+        library_cache.get(library)
+        library_cache.get("AUS_coped_sections")
+    if n == 0:
+        return pd.DataFrame()
+    if chunk_size is None:
+        chunk_size = max(1, -(-n // (4 * workers)))
+
+    chunks = _chunks(jobs, n, chunk_size)
+    if workers == 1:
+        _init_worker(table, library, {})
+        results = [_run_chunk(kind, chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(table, library, library_cache.snapshot()),
+        ) as executor:
+            results = list(
+                executor.map(_run_chunk, [kind] * -(-n // chunk_size), chunks)
+            )
+
+    columns = {k: np.concatenate([r[k] for r in results]) for k in results[0]}
+    return round_frame(pd.DataFrame(columns), sig_figs)
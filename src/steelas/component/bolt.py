@@ -1,23 +1,38 @@
 """
 Structural steel `Bolt` Component Class.
 
-This module defines classes for representing single structural steel bolt and bolt groups in a 2-column arrangement. 
+This module defines classes for representing single structural steel bolt and bolt groups in a 2-column arrangement.
 It includes properties for geometry, material, and capacities calculations based on Australian standards and ASI design handbooks.
+
+The eccentricity factors and eccentric capacities of BoltGroup2D are also provided as functions of arrays of bolt group
+geometry and eccentricity (broadcast against each other), for evaluating a bolt group catalog over many eccentricities
+in one call.
+
+Functions:
+    I_bp(), Z_b(), Z_ev(), Z_eh(): Bolt group polar moment and eccentricity factors, over arrays.
+    phiV_df_ecc(), phiV_bv_ecc(): Eccentric bolt group capacities, over arrays.
+    eccentric_capacity_table(): Eccentric capacity (or factor) table for a bolt group catalog.
 """
 
 # allows user classes in type hints
 from __future__ import annotations
 
-from math import pi, floor, log10
+from math import pi
 import json
 from dataclasses import dataclass, field
+import numpy as np
 
+from steelas.component.interning import interned, interned_constr, set_derived
+from steelas.data.io import load_library
+from steelas.data.precision import round_frame
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, frozen=True, slots=True)
 class Bolt:
     """
     Represents a single structural bolt, encapsulating both geometric data and capacity calculations
-    according to specified standards (e.g., AS4100:1998, AS1275:1985).
+    according to specified standards (e.g., AS4100:1998, AS1275:1985). Bolts are immutable; use
+    Bolt.interned() to share one instance between all users of the same bolt.
 
     Attributes: Attributes
         d_f (float):
@@ -36,7 +51,7 @@ class Bolt:
         phiV_f (float): Design shear strength of the bolt in kN, calculated based on shear capacity factors.
         phiN_tf (float): Design tension strength of the bolt in kN, calculated based on tension capacity factors.
         constr (str): Constructor string in JSON format storing initial bolt configuration for easy reconstruction.
-        sig_figs (int): Number of significant figures for rounding numerical outputs. Defaults to 3 and is used internally for output formatting.
+        sig_figs (int): Number of significant figures of reported values, defaults to 3.
     """
 
     # data(input)
@@ -60,39 +75,30 @@ class Bolt:
     # constructor
     constr: str = field(init=False)
 
-    # round values to a number of significant figures
+    # significant figures of reported values (calculations are not rounded)
     sig_figs: int = field(repr=False, default=3)
 
     def __post_init__(self):
 
         des = "(TI)" if self.threads_included else "(TX)"
-        self.name = f"M{self.d_f} {self.bolt_cat} " + des
-        self.constr = json.dumps(
-            {
-                "d_f": self.d_f,
-                "bolt_cat": self.bolt_cat,
-                "threads_included": self.threads_included,
-            }
+        set_derived(
+            self,
+            name=f"M{self.d_f} {self.bolt_cat} " + des,
+            constr=json.dumps(
+                {
+                    "d_f": self.d_f,
+                    "bolt_cat": self.bolt_cat,
+                    "threads_included": self.threads_included,
+                }
+            ),
+            bolt_des=f"M{self.d_f}",
+            d_h=self.d_f + (2 if self.d_f <= 24 else 3),  # AS4100:1998 CL 14.3.5.2
+            # AS4100:1998 Table 9.6.2 machine flame cut, sawn or planed edge plates
+            a_e_min=1.5 * self.d_f,
+            s_p_min=2.5 * self.d_f,  # AS4100:1998 CL 9.6.1
+            phiV_f=self.phi_shear * (self.V_fn if self.threads_included else self.V_fx),
+            phiN_tf=self.phi_tension * self.N_tf,
         )
-        self.bolt_des = f"M{self.d_f}"
-
-        self.d_h = self.d_f + (2 if self.d_f <= 24 else 3)  # AS4100:1998 CL 14.3.5.2
-        self.a_e_min = (
-            1.5 * self.d_f
-        )  # AS4100:1998 Table 9.6.2 machine flame cut, sawn or planed edge plates
-        self.s_p_min = 2.5 * self.d_f  # AS4100:1998 CL 9.6.1
-
-        self.phiV_f = self.phi_shear * (
-            self.V_fn if self.threads_included else self.V_fx
-        )
-        self.phiN_tf = self.phi_tension * self.N_tf
-
-        if self.sig_figs:
-            for k, v in list(self.__dict__.items()):
-                if type(v) is float:
-                    setattr(
-                        self, k, round(v, self.sig_figs - int(floor(log10(abs(v)))) - 1)
-                    )
 
     @property
     def phi_shear(self) -> float:
@@ -181,7 +187,7 @@ class Bolt:
         for k, v in kwargs.items():
             # note - @property items are in hasattr but not in __annotations__)
             if hasattr(o, k) and (k in cls.__annotations__):
-                setattr(o, k, v)
+                object.__setattr__(o, k, v)
         return o
 
     @classmethod
@@ -194,10 +200,17 @@ class Bolt:
             constructor_str (str): A JSON string representation of the Bolt's configuration.
 
         Returns:
-            Bolt: An instance of the Bolt class, initialized based on the JSON string.
+            Bolt: The interned Bolt instance for the configuration in the JSON string.
         """
-        attr_dict = json.loads(constructor_str)
-        return Bolt(**attr_dict)
+        return interned_constr(cls, constructor_str)
+
+    @classmethod
+    def interned(cls, **kwargs) -> Bolt:
+        """
+        Returns the shared Bolt instance for the given attributes, e.g.
+        Bolt.interned(d_f=20, bolt_cat="8.8/S"), constructing it on first use.
+        """
+        return interned(cls, **kwargs)
 
 
 @dataclass(kw_only=True)
@@ -212,7 +225,7 @@ class BoltGroup2D:
         bolt (Bolt | str): A Bolt instance or a constructor string representing the bolt used in the group, defaults to a default Bolt instance.
         s_p (int): Center-to-center spacing between bolts in a row (pitch) in mm, defaults to 70.
         s_g (int): Center-to-center spacing between bolts in a column (gauge) in mm, defaults to 70.
-        sig_figs (int): Number of significant figures to use for rounding calculated values, defaults to 3.
+        sig_figs (int): Number of significant figures of reported values, defaults to 3.
 
     Calculated Attributes (Not directly set by user):
         name (str): Automatically generated name for the bolt group based on its configuration.
@@ -235,7 +248,7 @@ class BoltGroup2D:
     d_i_min: float = field(init=False)  # minimum depth given by min. edge distance
     phiV_df: float = field(init=False)
 
-    # round values to a number of significant figures
+    # significant figures of reported values (calculations are not rounded)
     sig_figs: int = field(repr=False, default=3)
 
     def __post_init__(self):
@@ -249,7 +262,11 @@ class BoltGroup2D:
             {
                 "n_p": self.n_p,
                 "n_g": self.n_g,
-                "bolt": json.loads(self.bolt.constr),
+                "bolt": {
+                    "d_f": self.bolt.d_f,
+                    "bolt_cat": self.bolt.bolt_cat,
+                    "threads_included": self.bolt.threads_included,
+                },
                 "s_p": self.s_p,
                 "s_g": self.s_g,
             }
@@ -259,13 +276,6 @@ class BoltGroup2D:
         self.d_i_min = 2 * self.a_e_min + self.d_hp  # NOTE delete?
         self.phiV_df = self._phiV_df()
 
-        if self.sig_figs:
-            for k, v in list(self.__dict__.items()):
-                if type(v) is float:
-                    setattr(
-                        self, k, round(v, self.sig_figs - int(floor(log10(abs(v)))) - 1)
-                    )
-
     # ---------geom constraint-----------------
     @property  # duplicate
     def a_e_min(self):  # a_ev or a_eh
@@ -498,6 +508,150 @@ class BoltGroup2D:
         )
 
 
+# --------------------------------
+#   Bolt group arrays
+# --------------------------------
+
+# eccentric capacity table values: BoltGroup2D method name -> description
+ECCENTRIC_TABLE_VALUES = {
+    "phiV_df_ecc": "bolt group shear capacity with eccentricity (kN)",
+    "Z_b": "bolt shear eccentricity factor",
+    "Z_ev": "vertical bearing/tear-out eccentricity factor",
+    "Z_eh": "horizontal bearing/tear-out eccentricity factor",
+}
+
+
+def I_bp(n_p, n_g, s_p, s_g) -> np.ndarray:
+    """bolt group polar moment of bolt positions, BoltGroup2D.I_bp over arrays"""
+    n_p, n_g, s_p, s_g = map(np.asarray, (n_p, n_g, s_p, s_g))
+    return n_g * n_p / 12 * (s_p**2 * (n_p**2 - 1) + s_g**2 * (n_g**2 - 1))
+
+
+def Z_b(n_p, s_p, s_g, e) -> np.ndarray:
+    """bolt shear eccentricity factor, BoltGroup2D.Z_b over arrays (1 where e = 0)"""
+    n_p, s_p, s_g, e = map(np.asarray, (n_p, s_p, s_g, e))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s_pg = s_g / ((n_p - 1) * s_p)
+        Z_1 = 2 * e / s_g / (1 + 1 / 3 * ((n_p + 1) / (n_p - 1)) * (1 / s_pg) ** 2)
+        Z_b = 1 / ((1 + Z_1) ** 2 + (Z_1 / s_pg) ** 2) ** 0.5
+        return np.where(n_p != 1, Z_b, 1 / (1 + 2 * e / s_g))
+
+
+def Z_ev(n_p, n_g, s_p, s_g, e) -> np.ndarray:
+    """vertical eccentricity factor, BoltGroup2D.Z_ev over arrays (1 where e = 0)"""
+    n_p, s_g, e = map(np.asarray, (n_p, s_g, e))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Z_ev = 1 / (1 + n_p * e * s_g / I_bp(n_p, n_g, s_p, s_g))
+        return np.where(n_p != 1, Z_ev, s_g / (s_g + 2 * e))
+
+
+def Z_eh(n_p, n_g, s_p, s_g, e) -> np.ndarray:
+    """
+    horizontal eccentricity factor, BoltGroup2D.Z_eh over arrays (inf where e = 0, where
+    the scalar method raises ZeroDivisionError)
+    """
+    n_p, s_p, e = map(np.asarray, (n_p, s_p, e))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Z_eh = I_bp(n_p, n_g, s_p, s_g) / (e * (n_p - 1) * s_p * n_p)
+        return np.where(n_p != 1, Z_eh, 0)
+
+
+def phiV_df_ecc(n_p, n_g, s_p, s_g, phiV_f, e) -> np.ndarray:
+    """bolt group shear capacity with eccentricity (kN), BoltGroup2D.phiV_df_ecc over arrays"""
+    n_b = np.asarray(n_p) * np.asarray(n_g)
+    return np.round(Z_b(n_p, s_p, s_g, e) * n_b * np.asarray(phiV_f), 2)
+
+
+def phiV_bv_ecc(n_p, n_g, s_p, s_g, phiV_f, phiV_bf, phiV_ev, phiV_eh, e) -> np.ndarray:
+    """
+    eccentric bolt group capacity (kN), the least of bolt shear and ply bearing/tear-out,
+    BoltGroup2D.phiV_bv_ecc over arrays
+    """
+    return np.minimum.reduce(
+        [
+            phiV_df_ecc(n_p, n_g, s_p, s_g, phiV_f, e),
+            Z_b(n_p, s_p, s_g, e) * phiV_bf,
+            Z_ev(n_p, n_g, s_p, s_g, e) * phiV_ev,
+            Z_eh(n_p, n_g, s_p, s_g, e) * phiV_eh,
+        ]
+    )
+
+
+def eccentric_capacity_table(
+    eccentricities,
+    bolt_groups=None,
+    value: str = "phiV_df_ecc",
+    path: str | None = None,
+    sig_figs: int | None = None,
+):
+    """
+    Builds an eccentric bolt group capacity table, with one row per bolt group and one
+    column per eccentricity, in one array evaluation.
+
+    Args:
+        eccentricities: eccentricities e in mm (table columns).
+        bolt_groups: DataFrame (or dict of arrays) of bolt groups with the
+            AUS_bolt_groups.csv columns n_p, n_g, s_p, s_g and bolt (a Bolt constructor
+            string), default AUS_bolt_groups.csv.
+        value: 'phiV_df_ecc' (default), 'Z_b', 'Z_ev' or 'Z_eh'.
+        path: optional output file. Files ending in '.parquet' are written with
+            DataFrame.to_parquet (requires pyarrow or fastparquet), others as CSV.
+        sig_figs: significant figures of the returned and written values (default
+            unrounded).
+
+    Returns:
+        pd.DataFrame: values indexed by bolt group name, columns e in mm.
+    """
+    import pandas as pd
+
+    if value not in ECCENTRIC_TABLE_VALUES:
+        raise ValueError(
+            f"unknown eccentric table value {value}, use one of {list(ECCENTRIC_TABLE_VALUES)}"
+        )
+    if bolt_groups is None:
+        bolt_groups = load_library("AUS_bolt_groups")
+    n_p, n_g, s_p, s_g = [
+        np.asarray(bolt_groups[k])[:, np.newaxis] for k in ["n_p", "n_g", "s_p", "s_g"]
+    ]
+    bolts = [Bolt.from_constr(b) for b in bolt_groups["bolt"]]
+    phiV_f = np.array([b.phiV_f for b in bolts])[:, np.newaxis]
+    e = np.asarray(eccentricities, dtype=float)[np.newaxis, :]
+
+    match value:
+        case "phiV_df_ecc":
+            values = phiV_df_ecc(n_p, n_g, s_p, s_g, phiV_f, e)
+        case "Z_b":
+            values = Z_b(n_p, s_p, s_g, e)
+        case "Z_ev":
+            values = Z_ev(n_p, n_g, s_p, s_g, e)
+        case "Z_eh":
+            values = Z_eh(n_p, n_g, s_p, s_g, e)
+
+    # BoltGroup2D names
+    names = [
+        f"{n_p_i} x {n_g_i} ({s_p_i}p x {s_g_i}g) {b.name}"
+        for n_p_i, n_g_i, s_p_i, s_g_i, b in zip(
+            n_p[:, 0], n_g[:, 0], s_p[:, 0], s_g[:, 0], bolts
+        )
+    ]
+    df = pd.DataFrame(
+        values,
+        index=pd.Index(names, name="name"),
+        columns=pd.Index(e[0], name="e"),
+    )
+    df = round_frame(df, sig_figs)
+    df.attrs["value"] = value
+    if path is not None:
+        if str(path).endswith(".parquet"):
+            # parquet needs string column names; the returned table keeps its eccentricities
+            out = df.copy(deep=False)
+            out.columns = out.columns.astype(str)
+            out.to_parquet(path)
+        else:
+            df.to_csv(path)
+    return df
+
+
 def main():
     b = Bolt(d_f=12, bolt_cat="8.8/S", threads_included=False)
     print(b, "\n")
@@ -0,0 +1,270 @@
+"""
+Instantaneous centre of rotation (ICR) analysis of eccentrically loaded bolt groups.
+
+BoltGroup2D uses the elastic eccentricity factors of ASI Design Guide 4 (Z_b, Z_ev, Z_eh)
+for 2-column groups. This module solves the ultimate strength of bolt groups of any
+layout with the instantaneous centre of rotation method (Crawford & Kulak 1971, AISC
+Steel Construction Manual Part 7), e.g. for non-standard groups or for checking the
+elastic method.
+
+The bolt load-deformation relationship is R = R_ult (1 - exp(-MU DELTA))^LAMBDA, with the
+deformation of each bolt proportional to its distance from the instantaneous centre and
+DELTA_MAX at the furthest bolt. Bolt forces are normalised by the force at DELTA_MAX,
+so that the coefficient C (group capacity / single bolt capacity) equals the number of
+bolts for a concentric load, and C / n_b is comparable with BoltGroup2D.Z_b.
+
+The instantaneous centre is found with a Newton iteration on the two force equilibrium
+residuals, evaluated with NumPy over all bolts and all requested eccentricities at once.
+Converged solutions are held in a bounded pool keyed by (layout, load angle, solver
+settings, e).
+
+Classes:
+    ICRSolution: Instantaneous centre and capacity coefficient of a loaded bolt group.
+
+Functions:
+    solve_icr(): Solves one bolt group and eccentricity.
+    icr_coefficients(): Capacity coefficients C of one bolt group for many eccentricities.
+    bolt_group_layout(): Bolt coordinates of a BoltGroup2D.
+    icr_factor(): ICR counterpart of BoltGroup2D.Z_b, C / n_b.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import numpy as np
+
+from steelas.component.interning import ComponentPool
+
+# bolt load-deformation relationship, AISC Steel Construction Manual Part 7
+DELTA_MAX = 8.64  # mm (0.34 in), deformation of the furthest bolt
+MU = 10 / 25.4  # 1/mm (10 /in)
+LAMBDA = 0.55
+_R_MAX = (1 - np.exp(-MU * DELTA_MAX)) ** LAMBDA
+
+# solved (layout, angle, tol, max_iter, e) -> converged ICRSolution
+icr_solutions = ComponentPool(maxsize=4096)
+
+
+@dataclass(frozen=True, slots=True)
+class ICRSolution:
+    """
+    Instantaneous centre and capacity coefficient of a bolt group under an eccentric load.
+
+    Attributes:
+        C (float): Capacity coefficient, group capacity / single bolt capacity.
+        n_b (int): Number of bolts.
+        x_o, y_o (float): Instantaneous centre, relative to the bolt group centroid in
+            the bolt coordinate axes (mm); inf for a concentric load.
+        iterations (int): Newton iterations of this solution.
+        converged (bool): True if the equilibrium residuals are within tolerance.
+    """
+
+    C: float
+    n_b: int
+    x_o: float
+    y_o: float
+    iterations: int
+    converged: bool
+
+    @property
+    def Z(self) -> float:
+        """C / n_b, the ICR counterpart of the elastic eccentricity factor Z_b"""
+        return self.C / self.n_b
+
+
+def _layout(coords) -> np.ndarray:
+    coords = np.asarray(coords, dtype=float)
+    if coords.ndim != 2 or coords.shape[1] != 2 or len(coords) == 0:
+        raise ValueError("bolt coordinates must be an (n, 2) array, n >= 1")
+    return coords
+
+
+def _load_frame(angle: float) -> np.ndarray:
+    """rotation from the bolt axes to axes with the load acting in -y"""
+    a = np.radians(angle)
+    # angle is measured from the downward vertical, anticlockwise
+    return np.array([[np.cos(a), np.sin(a)], [-np.sin(a), np.cos(a)]])
+
+
+def _residuals(p: np.ndarray, c: np.ndarray, e: np.ndarray):
+    """
+    force equilibrium residuals (g_y, g_x) and load P, for a load P in -y along x = e and
+    bolt forces resisting a clockwise rotation about c. p (k, n, 2), c (k, 2), e (k,).
+    """
+    r = p - c[:, np.newaxis, :]
+    d = np.hypot(r[..., 0], r[..., 1])
+    d_max = d.max(axis=1, keepdims=True)
+    R = (1 - np.exp(-MU * DELTA_MAX * d / d_max)) ** LAMBDA / _R_MAX
+    # unit force directions (-r_y, r_x) / d, zero for a bolt at the centre
+    with np.errstate(divide="ignore", invalid="ignore"):
+        R_d = np.where(d > 0, R / d, 0)
+    P = (R * d).sum(axis=1) / (e - c[:, 0])
+    g_y = (R_d * r[..., 0]).sum(axis=1) - P
+    g_x = -(R_d * r[..., 1]).sum(axis=1)
+    return g_y, g_x, P
+
+
+def _solve(p: np.ndarray, e: np.ndarray, tol: float, max_iter: int):
+    """
+    solves the instantaneous centres for bolt coordinates p (k, n, 2) in the load frame,
+    centred on the centroid, and eccentricities e > 0 (k,)
+    """
+    k, n = p.shape[:2]
+    scale = max(float(np.abs(p).max()), 1.0)
+    h = 1e-7 * scale
+
+    # elastic solution: r_o = I_p / (n e), on the side of the centroid opposite the load
+    I_p = (p**2).sum(axis=(1, 2))
+    c = np.zeros((k, 2))
+    c[:, 0] = -I_p / (n * e)
+
+    pp = np.concatenate([p, p, p])
+    ee = np.concatenate([e, e, e])
+    iterations = np.zeros(k, dtype=int)
+    for _ in range(max_iter):
+        # residuals at c and at c + h in x and y, in one evaluation
+        cc = np.concatenate([c, c + [h, 0], c + [0, h]])
+        g_y, g_x, P = _residuals(pp, cc, ee)
+        g = np.stack([g_y[:k], g_x[:k]], axis=1)
+        converged = np.abs(g).max(axis=1) <= tol * n
+        if converged.all():
+            break
+        J = (
+            np.stack(
+                [
+                    np.stack(
+                        [g_y[k : 2 * k] - g_y[:k], g_y[2 * k :] - g_y[:k]], axis=1
+                    ),
+                    np.stack(
+                        [g_x[k : 2 * k] - g_x[:k], g_x[2 * k :] - g_x[:k]], axis=1
+                    ),
+                ],
+                axis=1,
+            )
+            / h
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = -np.linalg.solve(J, g[..., np.newaxis])[..., 0]
+        step[converged | ~np.isfinite(step).all(axis=1)] = 0
+        iterations += ~converged
+        # keep the centre on the far side of the load line
+        limit = 0.5 * (e - c[:, 0])
+        step[:, 0] = np.minimum(step[:, 0], limit)
+        c = c + step
+
+    g_y, g_x, P = _residuals(p, c, e)
+    converged = np.maximum(np.abs(g_y), np.abs(g_x)) <= tol * n
+    return P, c, iterations, converged
+
+
+def _solve_batch(
+    coords: np.ndarray, e: np.ndarray, angle: float, tol: float, max_iter: int
+) -> list[ICRSolution]:
+    n = len(coords)
+    rotation = _load_frame(angle)
+    p = (coords - coords.mean(axis=0)) @ rotation.T
+    solutions = [None] * len(e)
+
+    # a single bolt has no rotational stiffness, and carries its capacity at any e
+    concentric = (e == 0) | (n == 1)
+    for i in np.flatnonzero(concentric):
+        solutions[i] = ICRSolution(float(n), n, np.inf, np.inf, 0, True)
+
+    rows = np.flatnonzero(~concentric)
+    if len(rows):
+        # negative eccentricities are solved for the layout mirrored about the load
+        sign = np.where(e[rows] < 0, -1.0, 1.0)
+        p_k = np.repeat(p[np.newaxis], len(rows), axis=0)
+        p_k[..., 0] *= sign[:, np.newaxis]
+        P, c, iterations, converged = _solve(p_k, np.abs(e[rows]), tol, max_iter)
+        c[:, 0] *= sign
+        # back to the bolt coordinate axes
+        c = c @ rotation
+        for j, i in enumerate(rows):
+            solutions[i] = ICRSolution(
+                float(P[j]),
+                n,
+                float(c[j, 0]),
+                float(c[j, 1]),
+                int(iterations[j]),
+                bool(converged[j]),
+            )
+    return solutions
+
+
+def _solutions(
+    coords, eccentricities, angle: float, tol: float, max_iter: int
+) -> list[ICRSolution]:
+    """
+    pooled solutions, solving the missing eccentricities in one batch. Solutions that did
+    not converge are not pooled.
+    """
+    coords = _layout(coords)
+    settings = (coords.shape, coords.tobytes(), float(angle), float(tol), int(max_iter))
+    e = np.atleast_1d(np.asarray(eccentricities, dtype=float)).ravel()
+    keys = [(settings, float(e_i)) for e_i in e]
+    found = [icr_solutions.get(key) for key in keys]
+
+    missing = list(dict.fromkeys(key for key, s in zip(keys, found) if s is None))
+    if missing:
+        icr_solutions.misses += len(missing)
+        e_missing = np.array([key[1] for key in missing])
+        solved = _solve_batch(coords, e_missing, angle, tol, max_iter)
+        for key, s in zip(missing, solved):
+            if s.converged:
+                icr_solutions.put(key, s)
+        solved = dict(zip(missing, solved))
+        found = [s if s is not None else solved[key] for key, s in zip(keys, found)]
+    return found
+
+
+def solve_icr(
+    coords, e: float, angle: float = 0, tol: float = 1e-10, max_iter: int = 50
+) -> ICRSolution:
+    """
+    Solves the instantaneous centre of rotation of a bolt group.
+
+    Args:
+        coords: (n, 2) bolt coordinates (mm), in any origin.
+        e: eccentricity (mm), the distance from the bolt group centroid to the line of
+            action of the load, positive for a load line in the +x direction from the
+            centroid (for angle 0).
+        angle: load angle in degrees, anticlockwise from a downward vertical load.
+        tol: tolerance on the equilibrium residuals, per bolt, in single bolt capacities.
+        max_iter: maximum Newton iterations.
+
+    Returns:
+        ICRSolution: capacity coefficient C and instantaneous centre.
+    """
+    return _solutions(coords, e, angle, tol, max_iter)[0]
+
+
+def icr_coefficients(
+    coords, eccentricities, angle: float = 0, tol: float = 1e-10, max_iter: int = 50
+) -> np.ndarray:
+    """
+    Capacity coefficients C of a bolt group for an array of eccentricities (mm), solved
+    in one batch (see solve_icr for the arguments). Returns an array shaped like
+    eccentricities.
+    """
+    solutions = _solutions(coords, eccentricities, angle, tol, max_iter)
+    C = np.array([s.C for s in solutions])
+    return C.reshape(np.shape(eccentricities))
+
+
+def bolt_group_layout(bolt_group) -> np.ndarray:
+    """(n_b, 2) bolt coordinates of a BoltGroup2D, centred on the group, columns first"""
+    x = (np.arange(bolt_group.n_g) - (bolt_group.n_g - 1) / 2) * bolt_group.s_g
+    y = (np.arange(bolt_group.n_p) - (bolt_group.n_p - 1) / 2) * bolt_group.s_p
+    X, Y = np.meshgrid(x, y, indexing="ij")
+    return np.column_stack([X.ravel(), Y.ravel()])
+
+
+def icr_factor(bolt_group, e, angle: float = 0) -> np.ndarray:
+    """
+    C / n_b of a BoltGroup2D, the ICR counterpart of BoltGroup2D.Z_b, for an eccentricity
+    or array of eccentricities (mm). The bolt group capacity is
+    icr_factor(...) * n_b * bolt.phiV_f.
+    """
+    C = icr_coefficients(bolt_group_layout(bolt_group), e, angle)
+    return C / bolt_group.n_b
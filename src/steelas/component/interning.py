@@ -0,0 +1,152 @@
+"""
+Interned (hash-consed) components.
+
+Catalog runs construct the same small immutable objects many times, e.g. the same
+Bolt(d_f=20, bolt_cat='8.8/S') for every connection row, or the same flange
+PlateComponent for the bending and compression checks of a section. The component pool
+maps a canonical constructor key to one shared, already solved instance, constructed on
+first use. Keys are the class and its __init__ arguments (with defaults filled in), or the
+class and a JSON constructor string (constr), so that from_constr() skips the JSON parse
+for strings it has seen before. The pool is bounded, evicting the least recently used
+instances, and counts hits and misses.
+
+Interned classes must be frozen dataclasses, e.g. @dataclass(frozen=True, slots=True).
+
+Classes:
+    ComponentPool: Bounded LRU pool of shared component instances.
+
+Functions:
+    interned(): Returns the shared instance of a class for the given arguments.
+    interned_constr(): Returns the shared instance of a class for a constructor string.
+    set_derived(): Sets derived attributes of a frozen dataclass.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import MISSING, fields
+from functools import lru_cache
+import json
+
+
+class ComponentPool:
+    """
+    Bounded pool of shared component instances, with least recently used eviction.
+
+    Attributes:
+        maxsize (int): Maximum number of keys held.
+        hits (int): Lookups that returned a pooled instance.
+        misses (int): Lookups that constructed a new instance.
+        evictions (int): Keys evicted to stay within maxsize.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._items: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key):
+        """returns the instance for key (None if not pooled), counting a hit"""
+        obj = self._items.get(key)
+        if obj is not None:
+            self._items.move_to_end(key)
+            self.hits += 1
+        return obj
+
+    def put(self, key, obj) -> None:
+        """adds an instance, evicting the least recently used keys beyond maxsize"""
+        self._items[key] = obj
+        self._items.move_to_end(key)
+        self._evict()
+
+    def _evict(self) -> None:
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        """pool size and lookup counters"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._items),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def resize(self, maxsize: int) -> None:
+        """changes maxsize, evicting the least recently used keys if needed"""
+        self.maxsize = maxsize
+        self._evict()
+
+    def clear(self) -> None:
+        """removes all instances and resets the counters"""
+        self._items.clear()
+        self.hits = self.misses = self.evictions = 0
+
+
+component_pool = ComponentPool()
+
+
+@lru_cache(maxsize=None)
+def _init_defaults(cls) -> dict[str, object]:
+    """defaults of the __init__ arguments of a dataclass (MISSING if required)"""
+    return {f.name: f.default for f in fields(cls) if f.init}
+
+
+def _key(cls, inputs: dict) -> tuple | None:
+    """the arguments with defaults filled in, or None if they are invalid or unhashable"""
+    defaults = _init_defaults(cls)
+    if not inputs.keys() <= defaults.keys():
+        return None
+    key = [cls]
+    for name, default in defaults.items():
+        v = inputs.get(name, default)
+        if v is MISSING:
+            return None
+        # type is part of the key, as e.g. d_f=20 and d_f=20.0 give different names.
+        # nan as None, as nan != nan (e.g. nan values read from a CSV row)
+        key.append((type(v), None if isinstance(v, float) and v != v else v))
+    key = tuple(key)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def interned(cls, **inputs):
+    """returns the shared instance of cls(**inputs), constructing it on first use"""
+    key = _key(cls, inputs)
+    if key is None:
+        # invalid or unhashable arguments, raised (or not pooled) by the constructor
+        return cls(**inputs)
+    obj = component_pool.get(key)
+    if obj is None:
+        component_pool.misses += 1
+        obj = cls(**inputs)
+        component_pool.put(key, obj)
+    return obj
+
+
+def interned_constr(cls, constructor_str: str):
+    """returns the shared instance of cls for a JSON constructor string (constr)"""
+    key = (cls, constructor_str)
+    obj = component_pool.get(key)
+    if obj is None:
+        obj = interned(cls, **json.loads(constructor_str))
+        component_pool.put(key, obj)
+    return obj
+
+
+def set_derived(obj, **values) -> None:
+    """sets derived attributes of a frozen dataclass, in its __post_init__"""
+    for k, v in values.items():
+        object.__setattr__(obj, k, v)
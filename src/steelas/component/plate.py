@@ -8,18 +8,21 @@ material properties, and various capacity calculations based on Australian stand
 #allows user classes in type hints
 from __future__ import annotations 
 
-from math import pi, floor, log10
+from math import pi
 import numpy as np
 import json
 from dataclasses import dataclass, field
 
+from steelas.component.interning import interned, interned_constr, set_derived
 from steelas.member.material import calc_mat_prop
+from steelas.shape.arrays import round_to
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Plate():
     """
     A class to represent a structural steel plate, encapsulating dimensions, material grade, and providing
-    methods to calculate its structural capacities.
+    methods to calculate its structural capacities. Plates are immutable; use Plate.interned() to share
+    one instance between all users of the same plate.
 
     Attributes: Attributes
         b_i (int): Width of the plate in mm. Defaults to 200.
@@ -33,7 +36,7 @@ class Plate():
         plate_grade (str): Material grade of the plate derived from the `plate` attribute.
         f_ui (int): Ultimate tensile strength of the plate material in MPa.
         f_yi (int): Yield strength of the plate material in MPa.
-        sig_figs (int): Number of significant figures for rounding calculated values.
+        sig_figs (int): Number of significant figures of reported values.
     """
     b_i: int = 200
     t_i: int = 10
@@ -46,25 +49,24 @@ class Plate():
     f_ui: int = field(init = False)
     f_yi: int = field(init = False)
 
-    #round values to a number of significant figures
+    # significant figures of reported values (calculations are not rounded)
     sig_figs: int = field(repr=False, default = 3)
 
 
     def __post_init__(self):
-        self.name = f'{self.b_i}mm x {self.t_i}mm {self.plate}'
-        self.constr = json.dumps({"b_i": self.b_i, "t_i": self.t_i, "plate": self.plate})
-        self.plate_type = self.plate[:-6]
-        self.plate_grade = self.plate[-5:]
-                
+        plate_type, plate_grade = self.plate[:-6], self.plate[-5:]
         try:
-            self.f_yi, self.f_ui = calc_mat_prop(self.plate_type, self.plate_grade, self.t_i)
+            f_yi, f_ui = calc_mat_prop(plate_type, plate_grade, self.t_i)
         except ValueError:
-            self.f_yi, self.f_ui = np.nan, np.nan
-        
-        if self.sig_figs:
-            for k, v in list(self.__dict__.items()):
-                if type(v) is float:
-                    setattr(self, k, round(v, self.sig_figs-int(floor(log10(abs(v))))-1) )    
+            f_yi, f_ui = np.nan, np.nan
+
+        set_derived(self,
+                    name=f'{self.b_i}mm x {self.t_i}mm {self.plate}',
+                    constr=json.dumps({"b_i": self.b_i, "t_i": self.t_i, "plate": self.plate}),
+                    plate_type=plate_type,
+                    plate_grade=plate_grade,
+                    f_yi=f_yi,
+                    f_ui=f_ui)
     
 
 
@@ -109,12 +111,12 @@ class Plate():
         """plate shear capacity, AS4100:1998 CL 5.11.3, 5.11.4; ASI Handbook1 CL 5.4"""
         V_v = 0.5 * self.f_yi * d_i * self.t_i/1e3 #kN
         #source: AS4100:1998 CL 5.11.1
-        return round(self.phi_shear * V_v, 2)
+        return round_to(self.phi_shear * V_v, 2)
     
     def phiM_si(self, d_i): # can inherit from member_class.py
         """plate moment capacity, AS4100 CL 5.2.1; ASI Handbook 1 CL 5.4"""
         M_si = self.f_yi * self.t_i * d_i**2/4
-        return round(self.phi_bearing * M_si, 2)
+        return round_to(self.phi_bearing * M_si, 2)
 
     def phiM_si_ecc(self, d_i,e):
         """plate moment capacity with eccentricity"""
@@ -155,7 +157,7 @@ class Plate():
     def phiV_bs(self, l_t, l_v): #!!! also apply to member
         """plate block shear capacity, ANSI/AISC 360-16 J4.3; ASI Handbook section 5.4"""
         V_bs = (self.A_nt(l_t) * self.f_ui + 0.6 * self.A_gv(l_v) * self.f_yi)/1e3 #kN
-        return round(self.phi_block_shear * V_bs, 2)
+        return round_to(self.phi_block_shear * V_bs, 2)
     
     
     @classmethod
@@ -173,7 +175,7 @@ class Plate():
         o = cls()
         for k, v in kwargs.items():
             if hasattr(o, k):
-                setattr(o, k, v)
+                object.__setattr__(o, k, v)
         return o  
         
     @classmethod
@@ -186,10 +188,17 @@ class Plate():
             constructor_str (str): JSON string representation of the Plate's configuration.
 
         Returns:
-            Plate: An initialized Plate object based on the JSON string.
+            Plate: The interned Plate object for the configuration in the JSON string.
+        """
+        return interned_constr(cls, constructor_str)
+
+    @classmethod
+    def interned(cls, **kwargs) -> Plate:
+        """
+        Returns the shared Plate instance for the given attributes, e.g.
+        Plate.interned(b_i=200, t_i=10), constructing it on first use.
         """
-        attr_dict = json.loads(constructor_str)
-        return Plate(**attr_dict)
+        return interned(cls, **kwargs)
     
 
 
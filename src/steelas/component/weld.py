@@ -8,15 +8,17 @@ geometry, material properties, and various capacity calculations based on Austra
 #allows user classes in type hints
 from __future__ import annotations 
 
-from math import floor, log10
 import json
 from dataclasses import dataclass, field
 
-@dataclass(kw_only=False)
+from steelas.component.interning import interned, interned_constr, set_derived
+
+@dataclass(kw_only=False, frozen=True, slots=True)
 class Weld():
     """
     Represents a structural steel weld, encapsulating its dimensions, type, category, class, and
-    providing methods for capacity calculations.
+    providing methods for capacity calculations. Welds are immutable; use Weld.interned() to share
+    one instance between all users of the same weld.
 
     Attributes: Attributes
         t_w (int): Leg size of the fillet weld in mm.
@@ -28,7 +30,7 @@ class Weld():
         phiv_w (float): Design capacity of the weld per unit length in kN/mm, calculated post-initialization.
         name (str): Descriptive name of the weld, combining its dimensions, type, category, and class.
         constr (str): Constructor string in JSON format storing the weld's initial configuration.
-        sig_figs (int): Number of significant figures for rounding calculated values.
+        sig_figs (int): Number of significant figures of reported values.
 
     The class includes properties to derive critical weld parameters like design throat thickness,
     nominal weld capacity, and capacity factors based on standards such as AS4100:1998.
@@ -44,20 +46,15 @@ class Weld():
     #data (output)
     name: str = field(init=False)
     constr: str = field(init=False)
-    #round values to a number of significant figures
+    # significant figures of reported values (calculations are not rounded)
     sig_figs: int = field(repr=False, default = 3)
 
     def __post_init__(self):
-        self.name = f'{self.t_w}mm {self.weld_type} {self.weld_cat} {self.weld_class}'
-        self.constr = json.dumps({"t_w": self.t_w, "weld_type": self.weld_type,
-                                 "weld_cat": self.weld_cat, "weld_class": self.weld_class})
-
-        self.phiv_w = self.phi * self.v_w
-
-        if self.sig_figs:
-            for k, v in list(self.__dict__.items()):
-                if type(v) is float:
-                    setattr(self, k, round(v, self.sig_figs-int(floor(log10(abs(v))))-1) )    
+        set_derived(self,
+                    name=f'{self.t_w}mm {self.weld_type} {self.weld_cat} {self.weld_class}',
+                    constr=json.dumps({"t_w": self.t_w, "weld_type": self.weld_type,
+                                       "weld_cat": self.weld_cat, "weld_class": self.weld_class}),
+                    phiv_w=self.phi * self.v_w)
     
 
     @property
@@ -125,7 +122,7 @@ class Weld():
         o = cls()
         for k, v in kwargs.items():
             if hasattr(o, k):
-                setattr(o, k, v)
+                object.__setattr__(o, k, v)
         return o
 
     @classmethod
@@ -138,10 +135,17 @@ class Weld():
             constructor_str (str): JSON string representation of the Weld's configuration.
 
         Returns:
-            Weld: An initialized Weld object based on the JSON string.
+            Weld: The interned Weld object for the configuration in the JSON string.
+        """
+        return interned_constr(cls, constructor_str)
+
+    @classmethod
+    def interned(cls, **kwargs) -> Weld:
+        """
+        Returns the shared Weld instance for the given attributes, e.g.
+        Weld.interned(t_w=6, weld_cat='SP'), constructing it on first use.
         """
-        attr_dict = json.loads(constructor_str)
-        return Weld(**attr_dict)
+        return interned(cls, **kwargs)
 
 
 
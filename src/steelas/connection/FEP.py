@@ -10,13 +10,14 @@ The checks include analyses for weld to web in shear, bolt shear plus plate bear
 supported member web shear, supported member shear, and bending checks for coped members in eccentric load connections.
 """
 from dataclasses import dataclass, field
-from math import isnan, log10, floor
+from math import isnan
 from typing import Callable
 
 from steelas.component.bolt import BoltGroup2D
 from steelas.component.weld import Weld
 from steelas.component.plate import Plate
 from steelas.connection.featured_member import FeaturedMember
+from steelas.profiling import instrumented
 
 @dataclass
 class Connection():
@@ -46,7 +47,7 @@ class FEPConnection():
         
         d_i (float): Derived attribute for the effective depth of the connection.
         a_eh_e (float): Horizontal edge distance, derived attribute.
-        sig_figs (int): Number of significant figures for rounding calculations, defaults to 4.
+        sig_figs (int): Number of significant figures of reported values, defaults to 4.
 
         
         V_a (float): Weld to web in shear capacity, from the supported member to the weld.
@@ -86,9 +87,10 @@ class FEPConnection():
     V_des_ASI: float = field(init=False)
     V_des_all: float = field(init=False)
 
-    # round values to a number of significant figures
+    # significant figures of reported values (calculations are not rounded)
     sig_figs: int = 4
 
+    @instrumented("FEPConnection.__post_init__")
     def __post_init__(self):
         self.d_i = self.bolt_group.d_hp + 2 * self.a_ev_e
         # a_e3 horizontal edge distance, bolt hole centre to edge
@@ -220,13 +222,6 @@ class FEPConnection():
 
         self.V_des_all = self._V_des_all()
 
-        # round to sig figs
-        if self.sig_figs:
-            for k, v in list(self.__dict__.items()):
-                if isinstance(v, (float, int)) and (not isnan(v)) and (v != 0):
-                    setattr(self, k, round(v, self.sig_figs -
-                            int(floor(log10(abs(v))))-1))
-
     def _V_des_ASI(self):
         return min(self.V_a, self.V_b, self.V_c, self.V_d, self.V_e, self.V_f)
 
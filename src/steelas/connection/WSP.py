@@ -10,13 +10,14 @@ This class performs a series of structural capacity calculations and detailing c
 
 import numpy as np
 from dataclasses import dataclass, field
-from math import isnan, log10, floor, isinf
+from math import isnan
 from typing import Callable
 
 from steelas.component.bolt import BoltGroup2D
 from steelas.component.weld import Weld
 from steelas.component.plate import Plate
 from steelas.connection.featured_member import FeaturedMember
+from steelas.profiling import instrumented
 
 
 @dataclass
@@ -36,7 +37,7 @@ class WSPConnection():
         detailing_OK (bool): Flag indicating if the connection detailing checks pass.
         d_i (float): Derived attribute for the effective depth of the connection.
         a_eh_e (float): Horizontal edge distance, derived attribute.
-        sig_figs (int): Number of significant figures for rounding calculations, defaults to 4.
+        sig_figs (int): Number of significant figures of reported values, defaults to 4.
 
         V_a (float): Weld to web in shear capacity, from the supporting member to the weld.
         V_b (float): Bolt shear plus plate bearing and member bearing capacity, from the supported member to bolts to plate.
@@ -80,9 +81,10 @@ class WSPConnection():
     V_des_ASI: float = field(init = False)
     V_des_all: float = field(init = False)
 
-    # round values to a number of significant figures
+    # significant figures of reported values (calculations are not rounded)
     sig_figs: int = 4
 
+    @instrumented("WSPConnection.__post_init__")
     def __post_init__(self):
         self.d_i = self.bolt_group.d_hp + 2 * self.a_ev_e
         self.e = self.s_g1 + 0.5 * self.bolt_group.s_g
@@ -218,14 +220,6 @@ class WSPConnection():
         self.V_des_ASI = self._V_des_ASI()
 
         self.V_des_all = self._V_des_all()
-
-        # round to sig figs
-        if self.sig_figs:
-            for k, v in list(self.__dict__.items()):
-                #NOTE - isinf(v) for V_g = inf for uncoped sections
-                if isinstance(v, (float, int)) and (not isnan(v)) and (v != 0) and (not isinf(v)):
-                    setattr(self, k, round(v, self.sig_figs -
-                            int(floor(log10(abs(v))))-1))
    
     def _V_g(self):
         if self.featured_member.cope_type in ['SWC','DWC']:
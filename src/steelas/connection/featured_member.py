@@ -6,15 +6,30 @@ module. It is designed to represent steel members with additional features that
 such as coping. The module provides functionalities to apply these features to a base SteelMember object and
 recalculate its structural capacities accordingly.
 
+Coped members are solved once per parent section and cope (cope_type, d_ct, d_cb), and held in the coped_members
+pool; featured members with the same parent section and cope get a shallow copy of the pooled member.
+
 Classes:
     FeaturedMember: Extends SteelMember with additional features like coping and recalculates structural properties.
+
+Functions:
+    coped_geometry(): Returns the geometry of a coped section, derived from the parent section geometry.
 """
 
 from __future__ import annotations 
 from dataclasses import dataclass, field
-from math import isnan, floor, log10
+from steelas.component.interning import ComponentPool
+from steelas.member.geometry import SectionGeometry
 from steelas.member.member import SteelSection, SteelMember
-from copy import deepcopy
+from copy import copy
+from steelas.shape.arrays import round_to
+from steelas.profiling import instrumented
+
+# SectionGeometry inputs; the section properties are solved from these
+GEOMETRY_INPUTS = ['name', 'section', 'sec_type', 'd', 'b', 't_f', 't_w', 't', 'r_1', 'r_2', 'alpha', 'r_o', 'sig_figs']
+
+# solved coped members, shared by featured members with the same parent section and cope
+coped_members = ComponentPool(maxsize=1024)
 
 @dataclass(kw_only = True)
 class FeaturedMember():
@@ -35,10 +50,10 @@ class FeaturedMember():
         r_c (float): Radius of the cope in mm.
         name (str): Name or identifier for the featured member.
         section_name (str): Name of the steel section used.
-        member (SteelMember): A deep copy of unfeatured_member, modified with specified features.
+        member (SteelMember): A copy of unfeatured_member, or of the coped member for SWC and DWC copes.
         phiM_ss (float): Modified moment capacity considering the features, in kN*m.
         phiV_ws (float): Modified shear capacity considering the features, in kN.
-        sig_figs (int): Number of significant figures for rounding off calculations.
+        sig_figs (int): Number of significant figures of reported values.
     """
     unfeatured_member: SteelMember = field(repr = False)
     
@@ -60,9 +75,10 @@ class FeaturedMember():
     phiM_ss: float = 0
     phiV_ws: float = 0
 
-    # round values to a number of significant figures
+    # significant figures of reported values (calculations are not rounded)
     sig_figs: int = field(repr = False, default = 3)
 
+    @instrumented("FeaturedMember.__post_init__")
     def __post_init__(self):
         N_to_kN = 1/1e3
         Nmm_to_kn_m = 1/1e6
@@ -71,11 +87,13 @@ class FeaturedMember():
         self._name_me()
         self.section_name = self.unfeatured_member.name
 
-        #by default member as equal to unfeatured member (e.g. for no features)
-        self.member = deepcopy(self.unfeatured_member)
         if self.cope_type in ['SWC', 'DWC']:
             #if coped, define new member based on coping type
             self._cope_me()
+        else:
+            #by default member as equal to unfeatured member (e.g. for no features)
+            #a shallow copy, so member inputs can be changed without changing unfeatured_member
+            self.member = copy(self.unfeatured_member)
 
 
         # section bending capacity ignoring slenderness (for connection capacity evaluations)        
@@ -84,13 +102,6 @@ class FeaturedMember():
         
         self.phiV_ws = self._V_ws()  #already scaled from V_v
 
-        # round to sig figs
-        if self.sig_figs:
-            for k, v in list(self.__dict__.items()):
-                if isinstance(v, (float, int)) and (not isnan(v)) and (v != 0):
-                    setattr(self, k, round(v, self.sig_figs -
-                            int(floor(log10(abs(v))))-1))
-
     def _name_me(self):
         """udpates name and cope_type based on the listed features"""
         match self.features:
@@ -103,35 +114,21 @@ class FeaturedMember():
         self.name =  self.unfeatured_member.name + ' ' + self.features
         return self
 
+    @instrumented("FeaturedMember._cope_me")
     def _cope_me(self):
         """update coped section to new section type"""
-        
-        geom = self.member.section.geom
-        if self.cope_type == 'SWC':
-            if geom.sec_type == 'UB':
-                geom.sec_type = 'BT'
-            elif geom.sec_type == 'UC':
-                geom.sec_type = 'BC'
-            else:
-                raise ValueError(f'unknown coped section type for original section type {geom.sec_type}')
-            self.name = self.member.name + ' SWC'
-            new_d = geom.d - self.d_ct
-            #geom.solve_me?
-        elif self.cope_type == 'DWC':
-            if geom.sec_type in ['UB' , 'UC']:
-                geom.sec_type = 'RectPlate'
-            self.name = self.member.name + ' DWC'
-            new_d = geom.d - self.d_ct - self.d_cb            
-            geom.b = geom.t_w
-        
-        #self.sec_type = geom.sec_type
-        mat = self.member.section.mat
-        geom.d = new_d
-        geom.name = self.name
-        geom = geom.from_dict(**geom.__dict__)
-        geom.solve_shape()
-        ss = SteelSection(geom=geom, mat=mat, slenderness = None)
-        self.member = SteelMember(ss)
+        self.name = self.unfeatured_member.name + ' ' + self.cope_type
+        section = self.unfeatured_member.section
+        key = (self.cope_type, self.d_ct, self.d_cb, self.name,
+               _values(section.geom, GEOMETRY_INPUTS), _values(section.mat, list(section.mat.__dict__)))
+        member = coped_members.get(key)
+        if member is None:
+            coped_members.misses += 1
+            geom = coped_geometry(section.geom, self.cope_type, self.d_ct, self.d_cb, self.name)
+            member = SteelMember(SteelSection(geom=geom, mat=section.mat, slenderness = None))
+            coped_members.put(key, member)
+        #a shallow copy, so member inputs can be changed without changing the shared member
+        self.member = copy(member)
 
     def _M_ss(self) -> float:
         """section bending capacity ignoring slenderness (for coped section capacity evaluation)"""
@@ -247,10 +244,40 @@ class FeaturedMember():
     def phiV_bs(self, l_t, l_v): #!!! also apply to member
         """holed web block shear capacity, ANSI/AISC 360-16 J4.3; ASI Handbook section 5.4"""
         V_bs = (0.5*self.A_nt(l_t) * self.member.section.f_u + 0.6 * self.A_gv(l_v) * self.member.section.f_yw)/1e3 #kN
-        return round(0.75 * V_bs, 2)
+        return round_to(0.75 * V_bs, 2)
     
 
 
+def coped_geometry(geom: SectionGeometry, cope_type: str, d_ct: float, d_cb: float = 0, name: str = '') -> SectionGeometry:
+    """
+    returns the solved geometry of a coped section, derived from the parent (uncoped) geometry:
+    a tee (BT) for single web copes (SWC) of UB sections, or a web plate (RectPlate) for double web copes (DWC)
+    """
+    inputs = {k: getattr(geom, k) for k in GEOMETRY_INPUTS}
+    if cope_type == 'SWC':
+        if geom.sec_type == 'UB':
+            inputs['sec_type'] = 'BT'
+        elif geom.sec_type == 'UC':
+            inputs['sec_type'] = 'BC'
+        else:
+            raise ValueError(f'unknown coped section type for original section type {geom.sec_type}')
+        inputs['d'] = geom.d - d_ct
+    elif cope_type == 'DWC':
+        if geom.sec_type in ['UB' , 'UC']:
+            inputs['sec_type'] = 'RectPlate'
+        inputs['d'] = geom.d - d_ct - d_cb
+        inputs['b'] = geom.t_w
+    else:
+        raise ValueError(f'cope type {cope_type} is unknown')
+    inputs['name'] = name
+    return SectionGeometry(**inputs)
+
+
+def _values(obj, keys: list[str]) -> tuple:
+    """attribute values as a hashable key (nan as None, so that equal sections compare equal)"""
+    return tuple(None if v != v else v for v in (getattr(obj, k) for k in keys))
+
+
 def main():
     section_dict = {'name': '610UB125 (GR300)', 'section': '610UB125', 'sec_type': 'UB', 'mat_type': 'HotRolledSection', 'grade': 'GR300', 'd': 611.6, 'b': 229, 't_f': 19.6, 't_w': 11.9, 'r_1': 14.0}
     ss = SteelSection.from_section_dict(section_dict)
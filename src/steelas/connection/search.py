@@ -0,0 +1,223 @@
+"""
+Connection design search.
+
+Finds the cheapest FEP or WSP connection for a featured member and design shear force,
+from the bolt group, plate and weld libraries (AUS_bolt_groups.csv, AUS_plates.csv and
+AUS_welds.csv). The design space is the cartesian product of the three libraries. It is
+narrowed in stages with the detailing checks that depend on one more component at a
+time (bolt group: a_ev_e, d_i_min, d_i_max and flange clearances; plate: a_eh_e; weld:
+t_w_min), and only the surviving combinations are evaluated for capacity, in order of
+cost, until a passing design is found.
+
+Functions:
+    search_connection(): Returns the cheapest passing connection and search counters.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import SimpleNamespace
+import numpy as np
+
+from steelas.component.bolt import BoltGroup2D
+from steelas.component.plate import Plate
+from steelas.component.weld import Weld
+from steelas.connection.featured_member import FeaturedMember
+from steelas.connection.FEP import FEPConnection
+from steelas.connection.WSP import WSPConnection
+from steelas.connection.table import (
+    _BoltGroupArrays,
+    _PlateArrays,
+    _WeldArrays,
+    _gather,
+    _solve_FEP,
+    _solve_WSP,
+)
+from steelas.data.io import load_library
+
+
+@dataclass
+class SearchResult:
+    """
+    Result of a connection design search.
+
+    Attributes:
+        connection (FEPConnection | WSPConnection | None): The cheapest passing design,
+            or None if no combination passes.
+        V_des (float): Design capacity of the selected connection (kN).
+        stats (dict): Size of the design space, combinations pruned at each stage, and
+            combinations evaluated for capacity.
+    """
+
+    connection: FEPConnection | WSPConnection | None
+    V_des: float = np.nan
+    stats: dict = field(default_factory=dict)
+
+
+@lru_cache(maxsize=1)
+def _component_libraries() -> SimpleNamespace:
+    """solved bolt group, plate and weld libraries, as objects and attribute arrays"""
+    groups = [
+        BoltGroup2D(**r) for r in load_library("AUS_bolt_groups").to_dict("records")
+    ]
+    plates = [
+        Plate.interned(**r) for r in load_library("AUS_plates").to_dict("records")
+    ]
+    welds = [Weld.interned(**r) for r in load_library("AUS_welds").to_dict("records")]
+    bolt = _gather(
+        [g.bolt for g in groups],
+        np.arange(len(groups)),
+        ["d_f", "d_h", "a_e_min", "phiV_f"],
+    )
+    bolt_group = _BoltGroupArrays(
+        bolt=SimpleNamespace(**bolt),
+        **_gather(
+            groups,
+            np.arange(len(groups)),
+            ["n_p", "n_g", "s_p", "s_g", "n_b", "phiV_df"],
+        ),
+    )
+    plate = _PlateArrays(
+        **_gather(plates, np.arange(len(plates)), ["b_i", "t_i", "f_yi", "f_ui"])
+    )
+    weld = _WeldArrays(**_gather(welds, np.arange(len(welds)), ["t_w", "phiv_w"]))
+    return SimpleNamespace(
+        groups=groups,
+        plates=plates,
+        welds=welds,
+        bolt_group=bolt_group,
+        plate=plate,
+        weld=weld,
+    )
+
+
+def _take(arrays: SimpleNamespace, rows: np.ndarray) -> SimpleNamespace:
+    """selects rows from every array attribute (recursing into namespaces)"""
+    values = {}
+    for k, v in arrays.__dict__.items():
+        values[k] = _take(v, rows) if isinstance(v, SimpleNamespace) else v[rows]
+    return type(arrays)(**values)
+
+
+def search_connection(
+    featured_member: FeaturedMember,
+    V_star: float,
+    conn_type: str = "FEP",
+    a: float = 100,
+    a_ev_e: float = 35,
+    a_eh_e1: float = 35,
+    s_g1: float = 55,
+    capacity: str = "V_des_all",
+    chunk_size: int = 256,
+) -> SearchResult:
+    """
+    Finds the cheapest bolt group, plate and weld combination for a connection.
+
+    Passing designs satisfy the FEPConnection/WSPConnection detailing checks and have
+    capacity >= V_star. They are ranked by plate area (b_i x d_i), weld length (2 x d_i),
+    number of bolts, plate thickness and weld size.
+
+    Args:
+        featured_member: the supported member, with its coping.
+        V_star: design shear force in kN.
+        conn_type: 'FEP' or 'WSP'.
+        a: vertical offset to the top bolt (mm).
+        a_ev_e: vertical edge distance, bolt hole centre to plate edge (mm).
+        a_eh_e1: WSP horizontal edge distance, bolt hole centre to member end (mm).
+        s_g1: WSP distance from the welded plate edge to the first bolt column (mm).
+        capacity: 'V_des_all' or 'V_des_ASI'.
+        chunk_size: number of combinations evaluated for capacity at a time.
+
+    Returns:
+        SearchResult: the selected connection and search counters.
+    """
+    if conn_type not in ["FEP", "WSP"]:
+        raise ValueError(f"unknown connection type {conn_type}")
+    lib = _component_libraries()
+    bg, pl, wd = lib.bolt_group, lib.plate, lib.weld
+    n_bg, n_pl, n_wd = len(lib.groups), len(lib.plates), len(lib.welds)
+    stats = {
+        "space": n_bg * n_pl * n_wd,
+        "pruned_member": 0,
+        "pruned_bolt_group": 0,
+        "pruned_plate": 0,
+        "pruned_weld": 0,
+        "evaluated": 0,
+    }
+    unfeatured = featured_member.unfeatured_member.section.geom
+
+    # member checks
+    coped = featured_member.cope_type in ["SWC", "DWC"]
+    if (coped and featured_member.d_ct != a - a_ev_e) or (a - a_ev_e) < unfeatured.t_f:
+        stats["pruned_member"] = stats["space"]
+        return SearchResult(None, stats=stats)
+
+    # bolt group checks
+    d_i = bg.d_hp + 2 * a_ev_e
+    d_i_max = min(unfeatured.d - a + a_ev_e, featured_member.d)
+    ok = a_ev_e >= bg.bolt.a_e_min
+    ok &= (d_i >= 0.5 * unfeatured.d) & (d_i <= d_i_max)
+    ok &= (a - a_ev_e + d_i) <= (unfeatured.d - unfeatured.t_f)
+    i_bg = np.flatnonzero(ok)
+    stats["pruned_bolt_group"] = (n_bg - len(i_bg)) * n_pl * n_wd
+
+    # bolt group x plate checks
+    if conn_type == "FEP":
+        a_eh_e = (pl.b_i[None, :] - bg.d_hg[i_bg, None]) / 2
+    else:
+        a_eh_e = pl.b_i[None, :] - s_g1 - bg.s_g[i_bg, None]
+    j_bg, i_pl = np.nonzero(a_eh_e >= bg.bolt.a_e_min[i_bg, None])
+    i_bg = i_bg[j_bg]
+    stats["pruned_plate"] = (a_eh_e.size - len(i_bg)) * n_wd
+
+    # bolt group x plate x weld checks
+    if conn_type == "WSP":
+        ok = wd.t_w[None, :] >= 0.75 * pl.t_i[i_pl, None]
+    else:
+        ok = np.ones((len(i_pl), n_wd), dtype=bool)
+    j, i_wd = np.nonzero(ok)
+    i_bg, i_pl = i_bg[j], i_pl[j]
+    stats["pruned_weld"] = ok.size - len(i_wd)
+
+    # candidates in order of cost
+    d_i = d_i[i_bg]
+    order = np.lexsort(
+        (wd.t_w[i_wd], pl.t_i[i_pl], bg.n_b[i_bg], 2 * d_i, pl.b_i[i_pl] * d_i)
+    )
+    i_bg, i_pl, i_wd = i_bg[order], i_pl[order], i_wd[order]
+
+    solve = _solve_FEP if conn_type == "FEP" else _solve_WSP
+    for start in range(0, len(i_bg), chunk_size):
+        rows = slice(start, start + chunk_size)
+        n = len(i_bg[rows])
+        c = SimpleNamespace(
+            a=np.full(n, a, dtype=float),
+            a_ev_e=np.full(n, a_ev_e, dtype=float),
+            a_eh_e1=np.full(n, a_eh_e1, dtype=float),
+            s_g1=np.full(n, s_g1, dtype=float),
+            cope_type=np.full(n, featured_member.cope_type, dtype=object),
+            featured_member=featured_member,
+            bolt_group=_take(bg, i_bg[rows]),
+            plate=_take(pl, i_pl[rows]),
+            weld=_take(wd, i_wd[rows]),
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out = solve(c)
+        stats["evaluated"] += len(out[capacity])
+        passed = np.flatnonzero(out["detailing_OK"] & (out[capacity] >= V_star))
+        if len(passed):
+            k = start + passed[0]
+            conn_class = FEPConnection if conn_type == "FEP" else WSPConnection
+            kwargs = {"a": a, "a_ev_e": a_ev_e}
+            if conn_type == "WSP":
+                kwargs.update(a_eh_e1=a_eh_e1, s_g1=s_g1)
+            connection = conn_class(
+                featured_member=featured_member,
+                bolt_group=lib.groups[i_bg[k]],
+                plate=lib.plates[i_pl[k]],
+                weld=lib.welds[i_wd[k]],
+                **kwargs,
+            )
+            return SearchResult(connection, float(out[capacity][passed[0]]), stats)
+    return SearchResult(None, stats=stats)
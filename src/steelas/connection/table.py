@@ -0,0 +1,583 @@
+"""
+Bulk evaluation of FEP and WSP connections.
+
+A ConnectionTable holds the detailing checks and capacities of N connections of one type
+(FEP or WSP) as NumPy columns, e.g. for the ASI reference connections in
+ASI_FEP_connection.csv and ASI_WSP_connection.csv. Component strings are parsed once,
+each distinct bolt group, plate, weld and featured member is solved once with its own
+class, and the connection checks are then evaluated for all rows as array expressions.
+The component methods (Plate.phiV_bs, Weld.V_a_ecc, FeaturedMember.phiV_cm, ...) are
+borrowed by array-valued stand-ins, so the bulk results follow the FEPConnection and
+WSPConnection objects, before their final rounding to significant figures.
+
+Classes:
+    ConnectionTable: Detailing checks and capacities for a schedule of connections.
+
+Functions:
+    parse_member(): Splits an ASI member string into cope type and section name.
+    parse_bolt_group(): Parses an ASI bolt group string.
+    parse_plate(): Parses an ASI plate string.
+    parse_weld(): Parses an ASI weld string.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from types import SimpleNamespace
+import numpy as np
+
+from steelas.component import bolt as bolt_arrays
+from steelas.component.bolt import Bolt, BoltGroup2D
+from steelas.component.plate import Plate
+from steelas.component.weld import Weld
+from steelas.connection.featured_member import FeaturedMember
+from steelas.data.io import MemberLibrary, load_library
+from steelas.data.precision import round_frame
+from steelas.member.member import SteelSection, SteelMember
+from steelas.profiling import instrumented
+
+CONNECTION_LIBRARIES = {"FEP": "ASI_FEP_connection", "WSP": "ASI_WSP_connection"}
+# cope dimensions for sections not listed in AUS_coped_sections.csv
+COPE_DEFAULTS = {"d_cb": 35, "L_c": 120, "r_c": 10}
+CAPACITY_KEYS = {
+    "FEP": ["V_a", "V_b", "V_c", "V_d", "V_e", "V_f", "V_g"],
+    "WSP": ["V_a", "V_b", "V_c", "V_d", "V_e", "V_f", "V_g", "V_h"],
+}
+
+_BOLT_GROUP_PATTERN = re.compile(
+    r"(\d+)x(\d+) \((\d+)px([\d/]+)g\)\s+([\d,]+) M(\d+) (\S+) \((TI|TX)\)"
+)
+_PLATE_PATTERN = re.compile(r"(\d+)mm (\d+)mm (.+)")
+_WELD_PATTERN = re.compile(r"(\d+)mm (\S+) (\S+) (\S+)")
+
+
+def parse_member(member: str) -> tuple[str, str]:
+    """'SWC 460UB82.1 (GR300)' -> ('SWC', '460UB82.1 (GR300)')"""
+    features, name = member.split(" ", 1)
+    return features, name
+
+
+def parse_bolt_group(bolt_group: str) -> dict:
+    """
+    parses an ASI bolt group string, e.g. '9x2 (70px55/70g) 35,35 M20 8.8/S (TI)' ->
+    n_p=9, n_g=2, s_p=70, gauges=[55, 70], edges=[35, 35] and the bolt attributes.
+    """
+    m = _BOLT_GROUP_PATTERN.fullmatch(bolt_group.strip())
+    if m is None:
+        raise ValueError(f"unknown bolt group format: {bolt_group}")
+    n_p, n_g, s_p, gauges, edges, d_f, bolt_cat, threads = m.groups()
+    return {
+        "n_p": int(n_p),
+        "n_g": int(n_g),
+        "s_p": int(s_p),
+        "gauges": [int(g) for g in gauges.split("/")],
+        "edges": [int(a) for a in edges.split(",")],
+        "bolt": {
+            "d_f": int(d_f),
+            "bolt_cat": bolt_cat,
+            "threads_included": threads == "TI",
+        },
+    }
+
+
+def parse_plate(plate: str) -> dict:
+    """'200mm 10mm Plate GR250' -> Plate arguments"""
+    m = _PLATE_PATTERN.fullmatch(plate.strip())
+    if m is None:
+        raise ValueError(f"unknown plate format: {plate}")
+    b_i, t_i, plate_grade = m.groups()
+    return {"b_i": int(b_i), "t_i": int(t_i), "plate": plate_grade}
+
+
+def parse_weld(weld: str) -> dict:
+    """'6mm CFW SP E48XX' -> Weld arguments"""
+    m = _WELD_PATTERN.fullmatch(weld.strip())
+    if m is None:
+        raise ValueError(f"unknown weld format: {weld}")
+    t_w, weld_type, weld_cat, weld_class = m.groups()
+    return {
+        "t_w": int(t_w),
+        "weld_type": weld_type,
+        "weld_cat": weld_cat,
+        "weld_class": weld_class,
+    }
+
+
+@dataclass
+class ConnectionTable:
+    """
+    Detailing checks and capacities of N connections of one type, stored as columns.
+
+    Attributes:
+        conn_type (str): 'FEP' or 'WSP'.
+        columns (dict[str, np.ndarray]): One array of length N per attribute, with the
+            FEPConnection/WSPConnection attribute names (d_i, a_eh_e, V_a, ..., V_des_ASI,
+            V_des_all, govern_cap, detailing_OK). Values are not rounded to significant
+            figures. Capacities are nan (and the 'error' column is set) where the object
+            model cannot evaluate a row, e.g. coping of a section type without a coped
+            shape, or eccentricity factors of a bolt group with zero gauge.
+    """
+
+    conn_type: str
+    columns: dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.columns["name"])
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        return self.columns[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.columns
+
+    def to_frame(self, sig_figs: int | None = None):
+        """returns the table as a pandas DataFrame, optionally rounded to sig_figs"""
+        import pandas as pd
+
+        return round_frame(pd.DataFrame(self.columns), sig_figs)
+
+    @classmethod
+    def from_library(
+        cls, conn_type: str, library: MemberLibrary | str = MemberLibrary.OpenSections
+    ) -> ConnectionTable:
+        """evaluates the ASI reference connections of a type, 'FEP' or 'WSP'"""
+        connections = load_library(CONNECTION_LIBRARIES[conn_type])
+        return cls.from_frame(connections, conn_type, library)
+
+    @classmethod
+    @instrumented("ConnectionTable.from_frame")
+    def from_frame(
+        cls,
+        connections,
+        conn_type: str,
+        library: MemberLibrary | str = MemberLibrary.OpenSections,
+    ) -> ConnectionTable:
+        """
+        evaluates a DataFrame (or dict of arrays) of connections with the ASI connection
+        columns: name, member, bolt_group, plate, weld and a. Optional columns d_ct, d_cb,
+        L_c and r_c set the cope dimensions; otherwise the top cope aligns with the top of
+        the plate (d_ct = a - a_ev_e) and the other dimensions are taken from
+        AUS_coped_sections.csv, or COPE_DEFAULTS for sections not listed there.
+        """
+        if conn_type not in CAPACITY_KEYS:
+            raise ValueError(f"unknown connection type {conn_type}")
+        n = len(connections["member"])
+        columns = {
+            k: np.asarray(connections[k], dtype=object)
+            for k in ["name", "member", "bolt_group", "plate", "weld"]
+            if k in connections
+        }
+        columns.setdefault("name", np.arange(n).astype(str).astype(object))
+        columns["a"] = np.asarray(connections["a"], dtype=float)
+
+        c = SimpleNamespace(a=columns["a"])
+        c.bolt_group = _bolt_group_arrays(columns["bolt_group"], conn_type, c)
+        c.plate = _component_arrays(
+            columns["plate"], lambda s: Plate.interned(**parse_plate(s))
+        )
+        c.weld = _component_arrays(
+            columns["weld"], lambda s: Weld.interned(**parse_weld(s))
+        )
+
+        features, sections = zip(*map(parse_member, columns["member"]))
+        columns["section"] = np.asarray(sections, dtype=object)
+        columns["cope_type"] = np.array(
+            ["O" if f in ["", "O"] else f for f in features], dtype=object
+        )
+        cope = _cope_dimensions(connections, columns, c.a_ev_e)
+        columns.update(cope)
+        c.featured_member, columns["error"] = _featured_member_arrays(
+            columns["section"], columns["cope_type"], cope, library
+        )
+        c.cope_type = columns["cope_type"]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if conn_type == "FEP":
+                columns.update(_solve_FEP(c))
+            else:
+                columns.update(_solve_WSP(c))
+
+        caps = [columns[k] for k in CAPACITY_KEYS[conn_type]]
+        columns["govern_cap"] = _govern_cap(
+            CAPACITY_KEYS[conn_type], caps, columns["V_des_all"]
+        )
+        # detailing checks need the member dimensions
+        columns["detailing_OK"] &= columns["error"] == ""
+        zero_gauge = np.isnan(columns["V_b"]) & (columns["error"] == "")
+        columns["error"][zero_gauge] = "bolt group eccentricity factors undefined"
+        return cls(conn_type, columns)
+
+
+# ----------------
+#   Components
+# ----------------
+
+
+class _PlateArrays(SimpleNamespace):
+    """array-valued stand-in for Plate"""
+
+    phi_shear = Plate.phi_shear
+    phi_bending = Plate.phi_bending
+    phi_bearing = Plate.phi_bearing
+    phi_block_shear = Plate.phi_block_shear
+    phiV_bb = Plate.phiV_bb
+    phiV_bt = Plate.phiV_bt
+    phiV_v = Plate.phiV_v
+    phiM_si = Plate.phiM_si
+    phiM_si_ecc = Plate.phiM_si_ecc
+    A_nt = Plate.A_nt
+    A_gv = Plate.A_gv
+    phiV_bs = Plate.phiV_bs
+
+
+class _WeldArrays(SimpleNamespace):
+    """array-valued stand-in for Weld"""
+
+    V_a = Weld.V_a
+    V_a_ecc = Weld.V_a_ecc
+
+
+class _BoltGroupArrays(SimpleNamespace):
+    """array-valued stand-in for BoltGroup2D"""
+
+    d_hp = BoltGroup2D.d_hp
+    d_hg = BoltGroup2D.d_hg
+    a_ey_bc = BoltGroup2D.a_ey_bc
+    a_ex_bc = BoltGroup2D.a_ex_bc
+    s_pg = BoltGroup2D.s_pg
+    I_bp = BoltGroup2D.I_bp
+    l_vy = BoltGroup2D.l_vy
+    l_ty = BoltGroup2D.l_ty
+
+    def a_ey(self, a_ev_e):
+        return np.minimum(a_ev_e - 1, self.a_ey_bc)
+
+    def a_ex(self, a_eh_e):
+        return np.minimum(a_eh_e - 1, self.a_ex_bc)
+
+    def Z_b(self, e):
+        return bolt_arrays.Z_b(self.n_p, self.s_p, self.s_g, e)
+
+    def Z_eh(self, e):
+        return bolt_arrays.Z_eh(self.n_p, self.n_g, self.s_p, self.s_g, e)
+
+    def Z_ev(self, e):
+        return bolt_arrays.Z_ev(self.n_p, self.n_g, self.s_p, self.s_g, e)
+
+    def phiV_df_ecc(self, e):
+        return bolt_arrays.phiV_df_ecc(
+            self.n_p, self.n_g, self.s_p, self.s_g, self.bolt.phiV_f, e
+        )
+
+    def phiV_bv_ecc(self, phiV_bf, phiV_ev, phiV_eh, e):
+        return bolt_arrays.phiV_bv_ecc(
+            self.n_p,
+            self.n_g,
+            self.s_p,
+            self.s_g,
+            self.bolt.phiV_f,
+            phiV_bf,
+            phiV_ev,
+            phiV_eh,
+            e,
+        )
+
+
+class _FeaturedMemberArrays(SimpleNamespace):
+    """array-valued stand-in for FeaturedMember"""
+
+    e_v = FeaturedMember.e_v
+    phiV_cm = FeaturedMember.phiV_cm
+    A_nt = FeaturedMember.A_nt
+    A_gv = FeaturedMember.A_gv
+    phiV_wp = FeaturedMember.phiV_wp
+    phiV_bs = FeaturedMember.phiV_bs
+
+
+def _unique(values) -> tuple[list, np.ndarray]:
+    """distinct values (in order of first appearance) and the row -> value index"""
+    index = {}
+    inverse = np.array([index.setdefault(v, len(index)) for v in values], dtype=int)
+    return list(index), inverse
+
+
+def _gather(objects: list, inverse: np.ndarray, keys: list[str]) -> dict:
+    """attribute arrays for each row, from the distinct objects"""
+    return {
+        k: np.array([getattr(o, k) for o in objects], dtype=float)[inverse]
+        for k in keys
+    }
+
+
+def _component_arrays(values: np.ndarray, build) -> SimpleNamespace:
+    """builds each distinct component once and returns its attributes per row"""
+    strings, inverse = _unique(values)
+    objects = [build(s) for s in strings]
+    if isinstance(objects[0], Plate):
+        return _PlateArrays(**_gather(objects, inverse, ["b_i", "t_i", "f_yi", "f_ui"]))
+    return _WeldArrays(**_gather(objects, inverse, ["t_w", "phiv_w"]))
+
+
+def _bolt_group_arrays(
+    values: np.ndarray, conn_type: str, c: SimpleNamespace
+) -> _BoltGroupArrays:
+    """
+    solves each distinct bolt group once. Sets the edge distances on c: a_ev_e (FEP), and
+    a_ev_e, a_eh_e1 and s_g1 (WSP, where the first gauge is from the welded plate edge).
+    """
+    strings, inverse = _unique(values)
+    groups, a_ev_e, a_eh_e1, s_g1 = [], [], [], []
+    for s in strings:
+        p = parse_bolt_group(s)
+        gauges = list(p["gauges"])
+        if conn_type == "WSP":
+            s_g1.append(gauges.pop(0))
+            a_eh_e1.append(p["edges"][1])
+        s_g = gauges[0] if gauges else 0
+        a_ev_e.append(p["edges"][0])
+        groups.append(
+            BoltGroup2D(
+                n_p=p["n_p"],
+                n_g=p["n_g"],
+                s_p=p["s_p"],
+                s_g=s_g,
+                bolt=Bolt.interned(**p["bolt"]),
+            )
+        )
+
+    c.a_ev_e = np.array(a_ev_e, dtype=float)[inverse]
+    if conn_type == "WSP":
+        c.a_eh_e1 = np.array(a_eh_e1, dtype=float)[inverse]
+        c.s_g1 = np.array(s_g1, dtype=float)[inverse]
+
+    bolt = _gather(
+        [g.bolt for g in groups], inverse, ["d_f", "d_h", "a_e_min", "phiV_f"]
+    )
+    group = _gather(groups, inverse, ["n_p", "n_g", "s_p", "s_g", "n_b", "phiV_df"])
+    return _BoltGroupArrays(bolt=SimpleNamespace(**bolt), **group)
+
+
+def _cope_dimensions(connections, columns: dict, a_ev_e: np.ndarray) -> dict:
+    """cope dimensions d_ct, d_cb, L_c and r_c per row (0 for uncoped members)"""
+    n = len(columns["a"])
+    coped = columns["cope_type"] != "O"
+    cope = {}
+    if "d_ct" in connections:
+        cope["d_ct"] = np.asarray(connections["d_ct"], dtype=float)
+    else:
+        cope["d_ct"] = columns["a"] - a_ev_e
+
+    lookup = {}
+    coped_library = load_library("AUS_coped_sections")
+    for r in coped_library.to_dict("records"):
+        lookup[(r["features"], r["unfeatured_member"])] = r
+    for k in ["d_cb", "L_c", "r_c"]:
+        if k in connections:
+            cope[k] = np.asarray(connections[k], dtype=float)
+            continue
+        cope[k] = np.zeros(n)
+        for i in np.flatnonzero(coped):
+            key = (columns["cope_type"][i], columns["section"][i])
+            v = float(lookup[key][k]) if key in lookup else COPE_DEFAULTS[k]
+            cope[k][i] = 0 if np.isnan(v) else v
+
+    for k in cope:
+        cope[k] = np.where(coped, cope[k], 0)
+    cope["d_cb"] = np.where(columns["cope_type"] == "DWC", cope["d_cb"], 0)
+    return cope
+
+
+def _featured_member_arrays(
+    sections: np.ndarray, cope_type: np.ndarray, cope: dict, library
+) -> tuple[_FeaturedMemberArrays, np.ndarray]:
+    """
+    solves each distinct featured member once, returning the member attributes used by
+    the connection checks and an error message per row (empty if solved).
+    """
+    keys = list(zip(sections, cope_type, *[cope[k] for k in cope]))
+    distinct, inverse = _unique(keys)
+    members = {}
+    values, errors = [], []
+    for name, features, d_ct, d_cb, L_c, r_c in distinct:
+        try:
+            if name not in members:
+                section = SteelSection.from_library(library, name)
+                members[name] = SteelMember(section=section)
+            unfeatured = members[name]
+            fm = FeaturedMember(
+                unfeatured_member=unfeatured,
+                features=features,
+                d_ct=d_ct,
+                d_cb=d_cb,
+                L_c=L_c,
+                r_c=r_c,
+            )
+            values.append(
+                {
+                    "d": unfeatured.section.geom.d,
+                    "d_w": unfeatured.section.geom.d_w,
+                    "t_f": unfeatured.section.geom.t_f,
+                    "phiV_v": unfeatured.phiV_v,
+                    "d_c": fm.d,
+                    "phiV_v_c": fm.member.phiV_v,
+                    "d_w_c": fm.member.section.geom.d_w,
+                    "t_w_c": fm.member.section.geom.t_w,
+                    "f_u_c": fm.member.section.f_u,
+                    "f_yw_c": fm.member.section.f_yw,
+                    "phiV_ws": fm.phiV_ws,
+                    "phiM_ss": fm.phiM_ss,
+                    "L_c": fm.L_c,
+                }
+            )
+            errors.append("")
+        except (ValueError, NotImplementedError, ZeroDivisionError) as e:
+            values.append({})
+            errors.append(str(e) or type(e).__name__)
+
+    keys = ["d", "d_w", "t_f", "phiV_v", "d_c", "phiV_v_c", "d_w_c", "t_w_c"]
+    keys += ["f_u_c", "f_yw_c", "phiV_ws", "phiM_ss", "L_c"]
+    v = {
+        k: np.array([x.get(k, np.nan) for x in values], dtype=float)[inverse]
+        for k in keys
+    }
+    unfeatured_member = SimpleNamespace(
+        phiV_v=v["phiV_v"],
+        section=SimpleNamespace(
+            geom=SimpleNamespace(d=v["d"], d_w=v["d_w"], t_f=v["t_f"])
+        ),
+    )
+    member = SimpleNamespace(
+        phiV_v=v["phiV_v_c"],
+        section=SimpleNamespace(
+            geom=SimpleNamespace(d_w=v["d_w_c"], t_w=v["t_w_c"]),
+            f_u=v["f_u_c"],
+            f_yw=v["f_yw_c"],
+        ),
+    )
+    fm = _FeaturedMemberArrays(
+        unfeatured_member=unfeatured_member,
+        member=member,
+        d=v["d_c"],
+        phiV_ws=v["phiV_ws"],
+        phiM_ss=v["phiM_ss"],
+        L_c=v["L_c"],
+        d_ct=cope["d_ct"],
+    )
+    return fm, np.array(errors, dtype=object)[inverse]
+
+
+# ----------------
+#   Connections
+# ----------------
+
+
+def _detailing_checks(c: SimpleNamespace, d_i: np.ndarray, a_eh_e: np.ndarray) -> dict:
+    """detailing checks shared by FEPConnection and WSPConnection"""
+    fm, bolt_group = c.featured_member, c.bolt_group
+    unfeatured = fm.unfeatured_member.section.geom
+    a_e_min = bolt_group.bolt.a_e_min
+
+    d_i_min = 0.5 * unfeatured.d
+    d_i_max = np.minimum(unfeatured.d - c.a + c.a_ev_e, fm.d)
+    ok = ~(np.isin(c.cope_type, ["SWC", "DWC"]) & (fm.d_ct != c.a - c.a_ev_e))
+    ok &= ~(c.a_ev_e < a_e_min)
+    ok &= ~(a_eh_e < a_e_min)
+    ok &= ~(d_i < d_i_min)
+    ok &= ~((c.a - c.a_ev_e) < unfeatured.t_f)
+    ok &= ~((c.a - c.a_ev_e + d_i) > (unfeatured.d - unfeatured.t_f))
+    ok &= ~(d_i > d_i_max)
+    return {"d_i_min": d_i_min, "d_i_max": d_i_max, "detailing_OK": ok}
+
+
+def _solve_FEP(c: SimpleNamespace) -> dict:
+    """array counterpart of FEPConnection.__post_init__"""
+    bolt_group, plate, weld, fm = c.bolt_group, c.plate, c.weld, c.featured_member
+    out = {"a_ev_e": c.a_ev_e}
+    out["d_i"] = d_i = bolt_group.d_hp + 2 * c.a_ev_e
+    out["a_eh_e"] = a_eh_e = (plate.b_i - bolt_group.d_hg) / 2
+    gap = plate.t_i
+    out.update(_detailing_checks(c, d_i, a_eh_e))
+
+    out["V_a"] = weld.V_a(d_i)
+    phiV_bb = plate.phiV_bb(bolt_group.n_b, bolt_group.bolt.d_f, plate.t_i, plate.f_ui)
+    phiV_bt = plate.phiV_bt(
+        bolt_group.n_b, bolt_group.a_ey(c.a_ev_e), plate.t_i, plate.f_ui
+    )
+    out["V_b"] = np.minimum.reduce([bolt_group.phiV_df, phiV_bb, phiV_bt])
+    out["V_c"] = 2 * plate.phiV_v(d_i)
+    out["V_d"] = 2 * plate.phiV_bs(bolt_group.l_ty(a_eh_e), bolt_group.l_vy(c.a_ev_e))
+    out["V_e"] = fm.phiV_wp(d_i)
+    out["V_f"] = fm.phiV_ws
+    out["V_g"] = fm.phiV_cm(gap)
+
+    V = np.broadcast_arrays(*[out[k] for k in CAPACITY_KEYS["FEP"]])
+    out["V_des_ASI"] = np.minimum.reduce(V[:6])
+    out["V_des_all"] = np.minimum.reduce(V)
+    return out
+
+
+def _solve_WSP(c: SimpleNamespace) -> dict:
+    """array counterpart of WSPConnection.__post_init__"""
+    bolt_group, plate, weld, fm = c.bolt_group, c.plate, c.weld, c.featured_member
+    member = fm.member.section
+    coped = np.isin(c.cope_type, ["SWC", "DWC"])
+    dwc = c.cope_type == "DWC"
+
+    out = {"a_ev_e": c.a_ev_e, "a_eh_e1": c.a_eh_e1, "s_g1": c.s_g1}
+    out["d_i"] = d_i = bolt_group.d_hp + 2 * c.a_ev_e
+    out["e"] = e = c.s_g1 + 0.5 * bolt_group.s_g
+    out["a_eh_e"] = a_eh_e = plate.b_i - c.s_g1 - bolt_group.s_g
+    gap = c.s_g1 - c.a_eh_e1
+    out["a_e4"] = a_e4 = np.where(coped, c.a - fm.d_ct, np.nan)
+    out["a_e5"] = a_e5 = np.where(dwc, d_i - a_e4 - bolt_group.d_hp, np.nan)
+
+    out.update(_detailing_checks(c, d_i, a_eh_e))
+    out["t_w_min"] = t_w_min = 0.75 * plate.t_i
+    out["detailing_OK"] &= ~(weld.t_w < t_w_min)
+
+    out["V_a"] = weld.V_a_ecc(d_i, e)
+
+    n_b, d_f = bolt_group.n_b, bolt_group.bolt.d_f
+    phiV_bf = np.minimum(
+        plate.phiV_bb(n_b, d_f, plate.t_i, plate.f_ui),
+        plate.phiV_bb(n_b, d_f, member.geom.t_w, member.f_u),
+    )
+    a_ey_b = bolt_group.a_ey(np.where(dwc, np.minimum(a_e4, a_e5), a_e4))
+    phiV_ev = plate.phiV_bt(n_b, bolt_group.a_ey(c.a_ev_e), plate.t_i, plate.f_ui)
+    phiV_ev = np.where(
+        coped,
+        np.minimum(phiV_ev, plate.phiV_bt(n_b, a_ey_b, member.geom.t_w, member.f_u)),
+        phiV_ev,
+    )
+    phiV_eh = np.minimum(
+        plate.phiV_bt(n_b, bolt_group.a_ex(a_eh_e), plate.t_i, plate.f_ui),
+        plate.phiV_bt(n_b, bolt_group.a_ex(c.a_eh_e1), member.geom.t_w, member.f_u),
+    )
+    out["V_b"] = bolt_group.phiV_bv_ecc(
+        phiV_bf / 1000, phiV_ev / 1000, phiV_eh / 1000, e
+    )
+
+    out["V_c"] = plate.phiV_v(d_i)
+    out["V_d"] = plate.phiM_si_ecc(d_i, e)
+    out["V_e"] = plate.phiV_bs(bolt_group.l_ty(a_eh_e), bolt_group.l_vy(c.a_ev_e))
+    out["V_f"] = fm.phiV_ws
+    V_g = fm.phiV_bs(bolt_group.l_ty(c.a_eh_e1), bolt_group.l_vy(a_e4))
+    out["V_g"] = np.where(coped, V_g, np.nan)
+    out["V_h"] = fm.phiV_cm(gap)
+
+    # V_g only applies to coped members
+    V = {k: out[k] for k in CAPACITY_KEYS["WSP"]}
+    V_des = np.minimum.reduce([V[k] for k in ["V_a", "V_b", "V_c", "V_d", "V_e"]])
+    V_des = np.minimum(V_des, V["V_f"])
+    out["V_des_ASI"] = np.where(coped, np.minimum(V_des, V["V_g"]), V_des)
+    out["V_des_all"] = np.minimum(out["V_des_ASI"], V["V_h"])
+    return out
+
+
+def _govern_cap(keys: list[str], caps: list[np.ndarray], V_des: np.ndarray):
+    """name of the first capacity equal to the governing capacity, or None"""
+    govern = np.full(len(V_des), None, dtype=object)
+    for k, v in reversed(list(zip(keys, caps))):
+        govern[v == V_des] = k
+    return govern
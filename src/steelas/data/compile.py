@@ -0,0 +1,172 @@
+"""
+Compiled section libraries.
+
+The library CSV files are the source of truth, but parsing them and solving the section
+properties of every row is repeated by each process that needs a SectionTable. This
+module compiles a library once into a directory of .npy column files (the pre-solved
+geometry, material and slenderness columns of SectionTable) with a meta.json that records
+the checksum of the source CSV. Compiled numeric columns are loaded memory-mapped, so
+processes on one machine share a single page-cache copy of the data.
+
+Compiled libraries are written to 'steelas/data/compiled/', or to the directory given by
+the STEELAS_COMPILED_DIR environment variable, and are rebuilt automatically when the CSV
+checksum (or COMPILED_FORMAT) changes. To compile all member libraries in advance, e.g.
+as a deployment build step, run:
+
+    python -m steelas.data.compile
+
+Functions:
+    compile_library(): Compiles a section library to .npy columns.
+    load_compiled(): Loads a compiled library, rebuilding it if it is out of date.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import numpy as np
+
+from steelas.data.io import MemberLibrary, _library_path
+from steelas.member.table import SectionTable
+
+# bump when the SectionTable columns or their calculation change, to rebuild all files
+COMPILED_FORMAT = 4
+
+
+def compiled_dir() -> str:
+    """directory holding the compiled libraries"""
+    default = os.path.join(os.path.dirname(os.path.abspath(__file__)), "compiled")
+    return os.environ.get("STEELAS_COMPILED_DIR", default)
+
+
+def _library_name(library: MemberLibrary | str) -> str:
+    return os.path.splitext(os.path.basename(_library_path(library)))[0]
+
+
+def library_checksum(library: MemberLibrary | str) -> str:
+    """sha256 of the library CSV file"""
+    with open(_library_path(library), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _read_meta(path: str) -> dict | None:
+    try:
+        with open(os.path.join(path, "meta.json")) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def compile_library(
+    library: MemberLibrary | str, directory: str | None = None
+) -> SectionTable:
+    """
+    solves a SectionTable from the library CSV and writes it to
+    {directory}/{library name}/, one .npy file per column. String columns are stored as
+    fixed-width unicode arrays. Returns the solved table.
+    """
+    table = SectionTable.from_library(library, compiled=False)
+    parent = directory or compiled_dir()
+    name = _library_name(library)
+    os.makedirs(parent, exist_ok=True)
+
+    # the build is written to a temporary directory and moved into place, so that
+    # concurrent readers never see partly written files or another build's meta.json
+    build = tempfile.mkdtemp(prefix=f".{name}-", dir=parent)
+    try:
+        columns = {}
+        for k, v in table.columns.items():
+            if v.dtype == object:
+                np.save(os.path.join(build, f"{k}.npy"), v.astype(str))
+                columns[k] = "str"
+            else:
+                np.save(os.path.join(build, f"{k}.npy"), v)
+                columns[k] = str(v.dtype)
+
+        meta = {
+            "format": COMPILED_FORMAT,
+            "checksum": library_checksum(library),
+            "rows": len(table),
+            "columns": columns,
+        }
+        with open(os.path.join(build, "meta.json"), "w") as f:
+            json.dump(meta, f, indent=1)
+        _publish(build, os.path.join(parent, name))
+    finally:
+        shutil.rmtree(build, ignore_errors=True)
+    return table
+
+
+def _publish(build: str, path: str) -> None:
+    """moves a build directory to path, replacing any previous build"""
+    try:
+        os.replace(build, path)
+        return
+    except OSError:
+        if not os.path.isdir(path):
+            raise
+    # a directory can only replace an empty one: move the previous build aside first.
+    # Files of the previous build that are already memory-mapped remain readable.
+    old = tempfile.mkdtemp(
+        prefix=f".{os.path.basename(path)}-old-", dir=os.path.dirname(path)
+    )
+    try:
+        os.replace(path, old)
+        os.replace(build, path)
+    except OSError:
+        # another process published its build first, which is kept
+        pass
+    finally:
+        shutil.rmtree(old, ignore_errors=True)
+
+
+def load_compiled(
+    library: MemberLibrary | str, directory: str | None = None, rebuild: bool = True
+) -> SectionTable | None:
+    """
+    loads a compiled library, with memory-mapped (read-only) numeric columns. If the
+    compiled files are missing or out of date, the library is compiled first when
+    rebuild is True (and the directory is writable), otherwise None is returned.
+    """
+    path = os.path.join(directory or compiled_dir(), _library_name(library))
+    meta = _read_meta(path)
+    current = (
+        meta is not None
+        and meta.get("format") == COMPILED_FORMAT
+        and meta.get("checksum") == library_checksum(library)
+    )
+    if not current:
+        if not rebuild:
+            return None
+        try:
+            return compile_library(library, directory)
+        except OSError:
+            return None
+
+    columns = {}
+    try:
+        for k, dtype in meta["columns"].items():
+            file = os.path.join(path, f"{k}.npy")
+            if dtype == "str":
+                columns[k] = np.load(file).astype(object)
+            else:
+                columns[k] = np.load(file, mmap_mode="r")
+    except (OSError, ValueError):
+        # replaced by a concurrent rebuild while loading
+        if not rebuild:
+            return None
+        return SectionTable.from_library(library, compiled=False)
+    return SectionTable(columns)
+
+
+def main():
+    for library in MemberLibrary:
+        table = compile_library(library)
+        print(f"compiled {_library_name(library)}: {len(table)} sections")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,36 +1,167 @@
+from __future__ import annotations
+
 import os
-import pandas as pd
+import time
+from dataclasses import dataclass, field
 from enum import StrEnum
 
+from steelas.data.precision import round_sig
+from steelas.profiling import instrumented
+
 
 class MemberLibrary(StrEnum):
     OpenSections = "data/AUS_open_sections.csv"
     HollowSections = "data/AUS_hollow_sections.csv"
 
 
+def _library_path(filename: str | MemberLibrary) -> str:
+    """
+    Returns the absolute path of a library CSV file in 'steelas/data/', or of a library
+    registered with register_library().
+    """
+    if isinstance(filename, MemberLibrary):
+        filename = filename.value
+    elif filename in library_registry:
+        return library_registry.path(filename)
+    else:
+        filename = f"data/{filename}.csv"
+
+    # cwd = os.path.dirname(__file__)
+    dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(dir, filename)
+
+
+@dataclass
+class _LibraryEntry:
+    """A parsed section library held in the library cache."""
+
+    df: pd.DataFrame
+    records: list[dict]
+    load_time: float
+    # lookup column -> {lookup value: row positions}
+    index: dict[str, dict] = field(default_factory=dict)
+
+    def lookup(self, lookup_col: str, lookup_val) -> tuple[int, ...]:
+        """Returns the row positions with lookup_col equal to lookup_val."""
+        if lookup_col not in self.index:
+            col_index = {}
+            for i, v in enumerate(self.df[lookup_col].tolist()):
+                col_index.setdefault(v, []).append(i)
+            self.index[lookup_col] = {k: tuple(v) for k, v in col_index.items()}
+        return self.index[lookup_col].get(lookup_val, ())
+
+
+class LibraryCache:
+    """
+    Process-wide cache of parsed section libraries.
+
+    Each library CSV is parsed once, on first use, and held with a hash index per lookup
+    column so that repeated section lookups are O(1). Cache hits, misses and the total
+    time spent parsing CSV files are recorded for inspection with stats().
+    """
+
+    def __init__(self):
+        self._entries: dict[tuple, _LibraryEntry] = {}
+        self.hits = 0
+        self.misses = 0
+        self.load_time = 0.0
+
+    def get(
+        self, filename: str | MemberLibrary, skiprows: int | list[int] | None = [1]
+    ) -> _LibraryEntry:
+        """Returns the cached library entry, parsing the CSV file on a cache miss."""
+        lib_path = _library_path(filename)
+        key = (lib_path, _skiprows_key(skiprows))
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        t_start = time.perf_counter()
+        # pandas is imported on first use, to keep it off the calculation import path
+        import pandas as pd
+
+        # return csv without unit row
+        df = pd.read_csv(lib_path, skiprows=skiprows)
+        entry = _LibraryEntry(
+            df=df,
+            records=df.to_dict("records"),
+            load_time=time.perf_counter() - t_start,
+        )
+        self.load_time += entry.load_time
+        self._entries[key] = entry
+        return entry
+
+    def invalidate(self, filename: str | MemberLibrary | None = None) -> None:
+        """Removes a library from the cache, or all libraries if filename is None."""
+        if filename is None:
+            self._entries.clear()
+            return
+        lib_path = _library_path(filename)
+        for key in [k for k in self._entries if k[0] == lib_path]:
+            del self._entries[key]
+
+    def snapshot(self) -> dict:
+        """Returns the cached entries, e.g. to hand to worker processes."""
+        return dict(self._entries)
+
+    def restore(self, entries: dict) -> None:
+        """Adds entries from snapshot() to the cache, without parsing any CSV files."""
+        self._entries.update(entries)
+
+    def stats(self) -> dict:
+        """Returns cache hits, misses, total CSV load time (s) and the cached libraries."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "load_time": self.load_time,
+            "libraries": [os.path.basename(k[0]) for k in self._entries],
+        }
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.load_time = 0.0
+
+
+def _skiprows_key(skiprows: int | list[int] | None):
+    """hashable form of the pd.read_csv skiprows argument"""
+    if isinstance(skiprows, (list, tuple)):
+        return tuple(skiprows)
+    return skiprows
+
+
+library_cache = LibraryCache()
+
+
+def clear_library_cache(filename: str | MemberLibrary | None = None) -> None:
+    """Invalidates cached section libraries, e.g. after a library CSV file is edited."""
+    library_cache.invalidate(filename)
+
+
+def library_cache_stats() -> dict:
+    """Returns hit, miss and load time statistics for the section library cache."""
+    return library_cache.stats()
+
+
+@instrumented("import_section_library")
 def import_section_library(
     filename: str | MemberLibrary, skiprows: int | list[int] | None = [1]
 ) -> pd.DataFrame:
     """
     Imports a section library from a CSV file located at 'steelas/data/{filename}.csv'.
 
+    Libraries are parsed once per process and held in the library cache; a copy of the
+    cached DataFrame is returned so that callers may modify it freely.
+
     Returns:
         pd.DataFrame: A DataFrame containing the contents of the section library CSV file.
 
     Raises:
         FileNotFoundError: If the CSV file does not exist.
     """
-
-    if isinstance(filename, MemberLibrary):
-        filename = filename.value
-    else:
-        filename = f"data/{filename}.csv"
-
-    # cwd = os.path.dirname(__file__)
-    dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    lib_path = os.path.join(dir, filename)
-    # return csv without unit row
-    return pd.read_csv(lib_path, skiprows=skiprows)
+    return library_cache.get(filename, skiprows).df.copy()
 
 
 def get_section_from_library(
@@ -42,14 +173,152 @@ def get_section_from_library(
 
     """
 
-    sec_df = import_section_library(library)
-    selected_item = sec_df[sec_df[lookup_col] == lookup_val]
-    if len(selected_item) > 1:
+    entry = library_cache.get(library)
+    rows = entry.lookup(lookup_col, lookup_val)
+    if len(rows) > 1:
         raise ValueError(f"Error: non-unique {lookup_col}: {lookup_val}")
 
-    if len(selected_item) == 0:
+    if len(rows) == 0:
         raise ValueError(f"Error: no sections with {lookup_col} equal to {lookup_val}")
-    return selected_item.iloc[0].to_dict()
+    return dict(entry.records[rows[0]])
+
+
+@dataclass
+class _RegisteredLibrary:
+    """A library known to the library registry."""
+
+    path: str
+    skiprows: int | list[int] | None
+    # rows are sections, with a unique 'name' column
+    sections: bool
+
+
+class LibraryRegistry:
+    """
+    Registry of the section and component libraries.
+
+    Libraries are registered by name with their CSV path and units rows; none is read
+    until it is first used. The rows of section libraries are also indexed by section
+    name across all libraries, on the first lookup by name, so that a section can be
+    found in O(1) without knowing which library it is in.
+    """
+
+    def __init__(self):
+        self._libraries: dict[str, _RegisteredLibrary] = {}
+        # section name -> [(library, row), ...]
+        self._name_index: dict[str, list[tuple[str, int]]] | None = None
+
+    def __contains__(self, name) -> bool:
+        return name in self._libraries
+
+    def register(
+        self,
+        name: str,
+        path: str | None = None,
+        skiprows: int | list[int] | None = [1],
+        sections: bool = True,
+    ) -> None:
+        """
+        Registers a library CSV file (default 'steelas/data/{name}.csv'). skiprows are
+        the rows skipped when reading it, e.g. the units row. Section libraries must
+        have a 'name' column, and are added to the name index.
+        """
+        if path is None:
+            path = _library_path(name)
+        self._libraries[name] = _RegisteredLibrary(
+            os.path.abspath(path), skiprows, sections
+        )
+        if self._name_index is not None:
+            self._name_index = {
+                k: [v for v in rows if v[0] != name]
+                for k, rows in self._name_index.items()
+            }
+            if sections:
+                self._index_library(name)
+
+    def libraries(self, sections: bool | None = None) -> list[str]:
+        """Returns the registered library names (optionally only section libraries)."""
+        return [
+            k
+            for k, v in self._libraries.items()
+            if sections is None or v.sections == sections
+        ]
+
+    def path(self, name: str) -> str:
+        return self._libraries[name].path
+
+    def entry(self, name: str) -> _LibraryEntry:
+        """Returns the cached entry of a registered library, reading it on first use."""
+        if name not in self._libraries:
+            raise ValueError(f"Error: unknown library {name}")
+        return library_cache.get(name, self._libraries[name].skiprows)
+
+    def _index_library(self, name: str) -> None:
+        for i, v in enumerate(self.entry(name).df["name"].tolist()):
+            self._name_index.setdefault(v, []).append((name, i))
+
+    def find(self, section_name: str) -> tuple[str, int]:
+        """Returns the (library, row) of a section, by name."""
+        if self._name_index is None:
+            self._name_index = {}
+            for name in self.libraries(sections=True):
+                self._index_library(name)
+        rows = self._name_index.get(section_name, [])
+        if len(rows) > 1:
+            libraries = [library for library, _ in rows]
+            raise ValueError(f"Error: non-unique name: {section_name} in {libraries}")
+        if len(rows) == 0:
+            raise ValueError(f"Error: no sections with name equal to {section_name}")
+        return rows[0]
+
+    def get(self, section_name: str) -> dict:
+        """Returns the library row of a section, by name."""
+        library, row = self.find(section_name)
+        return dict(self.entry(library).records[row])
+
+    def clear_index(self) -> None:
+        """Discards the name index, e.g. after a registered CSV file is edited."""
+        self._name_index = None
+
+
+library_registry = LibraryRegistry()
+for _name in ["AUS_open_sections", "AUS_hollow_sections", "AUS_tee_sections"]:
+    library_registry.register(_name)
+library_registry.register("AUS_coped_sections", sections=False)
+for _name in [
+    "AUS_plates",
+    "AUS_bolts",
+    "AUS_bolt_groups",
+    "AUS_welds",
+    "ASI_FEP_connection",
+    "ASI_WSP_connection",
+]:
+    library_registry.register(_name, skiprows=None, sections=False)
+
+
+def register_library(
+    name: str,
+    path: str,
+    skiprows: int | list[int] | None = [1],
+    sections: bool = True,
+) -> None:
+    """
+    Registers a user library CSV file, e.g. register_library('my_sections', path).
+    Section libraries (with name, section, sec_type, mat_type, grade and dimension
+    columns) can then be looked up with get_section() and SteelSection.from_name().
+    """
+    library_registry.register(name, path, skiprows, sections)
+
+
+@instrumented("load_library")
+def load_library(name: str) -> pd.DataFrame:
+    """Returns a copy of a registered library, read with its registered skiprows."""
+    return library_registry.entry(name).df.copy()
+
+
+def get_section(name: str) -> dict:
+    """Returns the library row of a section from any registered section library."""
+    return library_registry.get(name)
 
 
 nomenclature_AS4100 = {
@@ -63,9 +332,14 @@ def report(
     exclude_attribute_names: list[str] | None = None,
     report_type: str = "print",
     with_name: bool = True,
+    sig_figs: int | None = None,
     # with_nomenclature: bool = False,
     # with_clause: bool = False,
 ) -> None:
+    # values are calculated at full precision and rounded here, to sig_figs
+    # (default obj.sig_figs)
+    if sig_figs is None:
+        sig_figs = getattr(obj, "sig_figs", None)
     # convert single-value attribute to list
     if attribute_names is None:
         attribute_names = list(obj.__annotations__.keys())
@@ -90,7 +364,7 @@ def report(
             # get attribute val from self, self.sec, or self.mat
             att_val = None
             if hasattr(obj, att):
-                att_val = getattr(obj, att)
+                att_val = round_sig(getattr(obj, att), sig_figs)
             if att_val is not None:
                 prefix = ""
                 # if att in nomenclature_AS4100:
@@ -0,0 +1,54 @@
+"""
+Significant figure rounding for reported values.
+
+Calculations are carried out at full precision; sig_figs is applied only at the
+reporting boundary, i.e. when an object is reported with report() or a table is exported
+with to_frame(sig_figs=...).
+
+Functions:
+    round_sig(): Rounds a number or array to a number of significant figures.
+    round_frame(): Rounds the float columns of a DataFrame to significant figures.
+"""
+
+from __future__ import annotations
+
+from math import floor, isinf, isnan, log10
+import numpy as np
+
+
+def round_sig(x, sig_figs: int | None):
+    """
+    Rounds x to sig_figs significant figures. Float arrays are rounded element-wise;
+    zero, nan and inf values, booleans and non-numeric values are returned unchanged, as
+    is everything when sig_figs is 0 or None.
+    """
+    if not sig_figs:
+        return x
+    if isinstance(x, np.ndarray):
+        if x.dtype.kind != "f":
+            return x
+        finite = np.isfinite(x) & (x != 0)
+        decimals = np.zeros(x.shape, dtype=int)
+        decimals[finite] = sig_figs - 1 - np.floor(np.log10(np.abs(x[finite])))
+        out = x.copy()
+        for d in np.unique(decimals[finite]):
+            rows = finite & (decimals == d)
+            out[rows] = np.round(x[rows], d)
+        return out
+    if isinstance(x, bool) or not isinstance(x, (float, int)):
+        return x
+    if x == 0 or isnan(x) or isinf(x):
+        return x
+    return round(x, sig_figs - int(floor(log10(abs(x)))) - 1)
+
+
+def round_frame(frame, sig_figs: int | None):
+    """returns a copy of a DataFrame with its float columns rounded to sig_figs"""
+    frame = frame.copy()
+    if not sig_figs:
+        return frame
+    for k in frame.columns:
+        values = frame[k].to_numpy()
+        if values.dtype.kind == "f":
+            frame[k] = round_sig(values, sig_figs)
+    return frame
@@ -0,0 +1,346 @@
+"""
+Vectorized AS4100 member capacities for catalogs of sections.
+
+This module evaluates the SteelMember capacity calculations (AS4100 Cl 5.2, 5.6, 5.11,
+6.2, 6.3.3 and 7.2) over arrays of sections and effective lengths, without constructing a
+SteelMember per section/length combination. Sections are provided as a SectionTable.
+
+Functions:
+    member_capacities(): Section and member capacities for arrays of sections and lengths.
+    capacity_curve(): Member capacity of one section over a grid of effective lengths.
+    capacity_table(): Member capacity design table for a catalog of sections.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from steelas.data.precision import round_frame
+from steelas.member.table import SectionTable, MATERIAL_CONSTANTS
+
+N_to_kN = 1 / 1e3
+Nmm_to_kN_m = 1 / 1e6
+
+# section types with a reference buckling moment, AS4100 Cl 5.6.1
+OPEN_SECTIONS = ["UB", "UC", "WB", "WC", "PFC"]
+HOLLOW_SECTIONS = ["RHS", "SHS", "CHS"]
+
+# SteelMember attributes returned by member_capacities, in SteelMember order
+CAPACITY_KEYS = [
+    "M_sx",
+    "M_bx",
+    "M_sy",
+    "V_v",
+    "N_s",
+    "N_cx",
+    "N_cy",
+    "N_t",
+    "phiN_t",
+    "phiN_c",
+    "phiN_s",
+    "phiV_v",
+    "phiM_sx",
+    "phiM_sy",
+    "phiM_y",
+    "phiM_bx",
+]
+
+
+# ------------------------------------------------------------------------
+# AS4100 Section 5 Members Subject to Bending ----------------------------
+# ------------------------------------------------------------------------
+
+
+def reference_buckling_moment(sec_type, I_y, J, I_w, l_eb) -> np.ndarray:
+    """AS4100 Cl 5.6.1 M_o reference buckling moment (nan for other section types)"""
+    E, G = MATERIAL_CONSTANTS["E"], MATERIAL_CONSTANTS["G"]
+    sec_type = np.asarray(sec_type, dtype=object)
+    # AS4100 Cl5.6.1.4 hollow sections, I_w = 0
+    I_w = np.where(np.isin(sec_type, HOLLOW_SECTIONS), 0, I_w)
+    M_o = (
+        (np.pi**2 * E * I_y / l_eb**2) * (G * J + (np.pi**2 * E * I_w / l_eb**2))
+    ) ** 0.5
+    return np.where(np.isin(sec_type, OPEN_SECTIONS + HOLLOW_SECTIONS), M_o, np.nan)
+
+
+def alpha_s(M_s, M_oa) -> np.ndarray:
+    """AS4100 Cl 5.6.1.1(iv) slenderness reduction factor"""
+    return 0.6 * (((M_s / M_oa) ** 2 + 3) ** 0.5 - M_s / M_oa)
+
+
+# ------------------------------------------------------------------------
+# AS4100 Section 6 Members subject to axial compression
+# ------------------------------------------------------------------------
+
+
+def alpha_a(lam_n) -> np.ndarray:
+    """AS4100 Cl 6.3.3 calculation parameter"""
+    return 2100 * (lam_n - 13.5) / (lam_n**2 - 15.3 * lam_n + 2050)
+
+
+def eta(lam) -> np.ndarray:
+    """AS4100 Cl 6.3.3 calculation parameter"""
+    return np.maximum(0.00326 * (lam - 13.5), 0)
+
+
+def xi(lam, eta) -> np.ndarray:
+    """AS4100 Cl 6.3.3 calculation parameter"""
+    return ((lam / 90) ** 2 + 1 + eta) / (2 * (lam / 90) ** 2)
+
+
+def alpha_c(xi, lam) -> np.ndarray:
+    """AS4100 Cl 6.3.3 member slenderness reduction factor, compression"""
+    return xi * (1 - (1 - (90 / (xi * lam)) ** 2) ** 0.5)
+
+
+def compression_reduction_factor(l_e, r, k_f, f_y, alpha_b) -> np.ndarray:
+    """AS4100 Cl 6.3.3 alpha_c for effective length l_e about an axis with radius r"""
+    lam_n = (l_e / r) * (k_f * f_y / 250) ** 0.5
+    lam = lam_n + alpha_a(lam_n) * alpha_b
+    return alpha_c(xi(lam, eta(lam)), lam)
+
+
+# ------------------------------------------------------------------------
+# Member capacities
+# ------------------------------------------------------------------------
+
+
+def member_capacities(
+    table: SectionTable,
+    l_ex=0,
+    l_ey=0,
+    l_eb=0,
+    alpha_m=1,
+    rows=None,
+    phi: float = 0.9,
+    k_t: float = 1,
+) -> dict[str, np.ndarray]:
+    """
+    Evaluates SteelMember capacities for arrays of sections and effective lengths.
+
+    Effective lengths and alpha_m are broadcast against the selected section rows, so a
+    single call can evaluate N sections at one length, one section at N lengths, or N
+    arbitrary section/length combinations. Segments with l_eb > 0 are assumed to have
+    both ends fully or partially restrained (AS4100 Cl 5.6.1).
+
+    Args:
+        table: section catalog.
+        l_ex, l_ey, l_eb: effective lengths in mm (0 for full restraint).
+        alpha_m: moment modification factor, AS4100 Cl 5.6.1.1.
+        rows: row numbers of table to evaluate, e.g. np.repeat(...) for many lengths per
+            section. Defaults to every row of table.
+        phi: capacity factor.
+        k_t: end force distribution factor for tension members, AS4100 Cl 7.3.
+
+    Returns:
+        dict of arrays with 'name', 'row', the effective lengths and the SteelMember
+        capacities in CAPACITY_KEYS (kN and kNm). Values are not rounded to significant
+        figures.
+    """
+    if rows is None:
+        rows = np.arange(len(table))
+    rows, l_ex, l_ey, l_eb, alpha_m = np.broadcast_arrays(
+        np.asarray(rows), l_ex, l_ey, l_eb, alpha_m
+    )
+    l_ex, l_ey, l_eb, alpha_m = [
+        np.asarray(v, dtype=float) for v in (l_ex, l_ey, l_eb, alpha_m)
+    ]
+
+    def col(k):
+        return table[k][rows]
+
+    sec_type = col("sec_type")
+    A_g = col("A_g")
+    f_y = col("f_y")
+    f_u = col("f_u")
+    k_f = col("k_f")
+    alpha_b = col("alpha_b")
+
+    out = {"name": col("name"), "row": rows, "l_ex": l_ex, "l_ey": l_ey, "l_eb": l_eb}
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # AS4100 Cl 5.2.1 and 5.6.1
+        M_sx = col("Z_ex") * f_y
+        M_sy = col("Z_ey") * f_y
+        M_o = reference_buckling_moment(
+            sec_type, col("I_y"), col("J"), col("I_w"), l_eb
+        )
+        M_bx = np.where(
+            l_eb > 0, np.minimum(alpha_m * alpha_s(M_sx, M_o) * M_sx, M_sx), M_sx
+        )
+
+        # AS4100 Cl 6.2.1 and 6.3.3
+        N_s = k_f * A_g * f_y
+        alpha_cx = compression_reduction_factor(l_ex, col("r_x"), k_f, f_y, alpha_b)
+        alpha_cy = compression_reduction_factor(l_ey, col("r_y"), k_f, f_y, alpha_b)
+        N_cx = np.where(l_ex > 0, alpha_cx * N_s, N_s)
+        N_cy = np.where(l_ey > 0, alpha_cy * N_s, N_s)
+
+        # AS4100 Cl 5.11
+        V_w = np.where(
+            sec_type == "CHS", 0.36 * f_y * A_g, 0.6 * col("f_yw") * col("A_w")
+        )
+        V_u = np.where(col("web_shear_yield_governs"), V_w, col("alpha_v") * V_w)
+        uniformity = col("shear_stress_uniformity")
+        V_nu = np.minimum(V_u, 2 * V_u / (0.9 + uniformity))
+        V_v = np.where(uniformity == 1, V_u, V_nu)
+
+        # AS4100 Cl 7.2
+        N_t = np.minimum(A_g * f_y, 0.85 * k_t * A_g * f_u)
+
+    out["M_sx"] = M_sx * Nmm_to_kN_m
+    out["M_bx"] = M_bx * Nmm_to_kN_m
+    out["M_sy"] = M_sy * Nmm_to_kN_m
+    out["V_v"] = V_v * N_to_kN
+    out["N_s"] = N_s * N_to_kN
+    out["N_cx"] = N_cx * N_to_kN
+    out["N_cy"] = N_cy * N_to_kN
+    out["N_t"] = N_t * N_to_kN
+
+    out["phiN_t"] = phi * out["N_t"]
+    out["phiN_c"] = phi * np.minimum(out["N_s"], np.minimum(out["N_cx"], out["N_cy"]))
+    out["phiN_s"] = phi * out["N_s"]
+    out["phiV_v"] = phi * out["V_v"]
+    out["phiM_sx"] = phi * out["M_sx"]
+    out["phiM_sy"] = phi * out["M_sy"]
+    out["phiM_y"] = phi * out["M_sy"]
+    out["phiM_bx"] = phi * np.minimum(out["M_bx"], out["M_sx"])
+    return out
+
+
+# ------------------------------------------------------------------------
+# Capacity curves and design tables
+# ------------------------------------------------------------------------
+
+# capacity reported for each curve axis, and the effective length it varies
+CURVE_AXES = {
+    "x": ("phiN_cx", "l_ex"),
+    "y": ("phiN_cy", "l_ey"),
+    "b": ("phiM_bx", "l_eb"),
+}
+
+
+def _compression_curve(N_s, r, k_f, f_y, alpha_b, l_e, phi):
+    """phi * min(N_s, N_c) over effective lengths l_e, AS4100 Cl 6.3.3 (kN)"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        alpha = compression_reduction_factor(l_e, r, k_f, f_y, alpha_b)
+        N_c = np.where(l_e > 0, alpha * N_s, N_s)
+    return phi * np.minimum(N_s, N_c) * N_to_kN
+
+
+def _bending_curve(M_sx, sec_type, I_y, J, I_w, l_eb, alpha_m, phi):
+    """phi * min(M_bx, M_sx) over effective lengths l_eb, AS4100 Cl 5.6.1 (kNm)"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        M_o = reference_buckling_moment(sec_type, I_y, J, I_w, l_eb)
+        M_b = np.minimum(alpha_m * alpha_s(M_sx, M_o) * M_sx, M_sx)
+        M_bx = np.where(l_eb > 0, M_b, M_sx)
+    return phi * np.minimum(M_bx, M_sx) * Nmm_to_kN_m
+
+
+def capacity_curve(
+    section, lengths, axis: str = "x", alpha_m: float = 1, phi: float = 0.9
+) -> np.ndarray:
+    """
+    Evaluates a member design capacity of one section over a grid of effective lengths.
+
+    Section capacities (N_s, M_sx) and slenderness parameters (k_f, alpha_b, r_x, r_y,
+    I_y, J, I_w) are read once from the section; only the length-dependent AS4100
+    Cl 5.6.1 / 6.3.3 reduction factors are evaluated over the grid.
+
+    Args:
+        section: a SteelSection or SectionRow.
+        lengths: effective lengths in mm.
+        axis: 'x' for phiN_c against l_ex, 'y' for phiN_c against l_ey, or 'b' for
+            phiM_bx against l_eb.
+        alpha_m: moment modification factor, AS4100 Cl 5.6.1.1 (axis 'b' only).
+        phi: capacity factor.
+
+    Returns:
+        np.ndarray: design capacities (kN or kNm), one per length. Equal to phiN_c or
+        phiM_bx of a SteelMember with the given length and other lengths equal to zero.
+    """
+    l_e = np.asarray(lengths, dtype=float)
+    if axis in ["x", "y"]:
+        N_s = section.k_f * section.A_n * section.f_y
+        r = section.r_x if axis == "x" else section.r_y
+        return _compression_curve(
+            N_s, r, section.k_f, section.f_y, section.alpha_b, l_e, phi
+        )
+    elif axis == "b":
+        geom = section.geom
+        M_sx = section.Z_ex * section.f_y
+        return _bending_curve(
+            M_sx, section.sec_type, geom.I_y, geom.J, geom.I_w, l_e, alpha_m, phi
+        )
+    raise ValueError(
+        f"unknown capacity curve axis {axis}, use one of {list(CURVE_AXES)}"
+    )
+
+
+def capacity_table(
+    table: SectionTable,
+    lengths,
+    axis: str = "x",
+    alpha_m: float = 1,
+    phi: float = 0.9,
+    path: str | None = None,
+    sig_figs: int | None = None,
+):
+    """
+    Builds an ASI-style member capacity table, with one row per section and one column
+    per effective length, for every section in a SectionTable.
+
+    Args:
+        table: section catalog.
+        lengths: effective lengths in mm (table columns).
+        axis: 'x', 'y' or 'b', see capacity_curve.
+        alpha_m: moment modification factor (axis 'b' only).
+        phi: capacity factor.
+        path: optional output file. Files ending in '.parquet' are written with
+            DataFrame.to_parquet (requires pyarrow or fastparquet), others as CSV.
+        sig_figs: significant figures of the returned and written capacities (default
+            unrounded).
+
+    Returns:
+        pd.DataFrame: design capacities indexed by section name, columns in mm.
+    """
+    import pandas as pd
+
+    if axis not in CURVE_AXES:
+        raise ValueError(
+            f"unknown capacity curve axis {axis}, use one of {list(CURVE_AXES)}"
+        )
+    l_e = np.asarray(lengths, dtype=float)[np.newaxis, :]
+
+    def col(k):
+        return table[k][:, np.newaxis]
+
+    if axis in ["x", "y"]:
+        N_s = col("k_f") * col("A_g") * col("f_y")
+        r = col("r_x") if axis == "x" else col("r_y")
+        caps = _compression_curve(
+            N_s, r, col("k_f"), col("f_y"), col("alpha_b"), l_e, phi
+        )
+    else:
+        M_sx = col("Z_ex") * col("f_y")
+        caps = _bending_curve(
+            M_sx, col("sec_type"), col("I_y"), col("J"), col("I_w"), l_e, alpha_m, phi
+        )
+
+    capacity, length = CURVE_AXES[axis]
+    df = pd.DataFrame(
+        caps,
+        index=pd.Index(table["name"], name="name"),
+        columns=pd.Index(l_e[0], name=length),
+    )
+    df = round_frame(df, sig_figs)
+    df.attrs["capacity"] = capacity
+    if path is not None:
+        if str(path).endswith(".parquet"):
+            # parquet needs string column names; the returned table keeps its lengths
+            out = df.copy(deep=False)
+            out.columns = out.columns.astype(str)
+            out.to_parquet(path)
+        else:
+            df.to_csv(path)
+    return df
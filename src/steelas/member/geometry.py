@@ -9,14 +9,17 @@ Classes:
 Functions:
     import_section_library(): Returns a DataFrame containing the section library defined
     in steelas/data/
+    shape_function(): Returns the shape module used to solve a section type.
+    solve_shapes(): Solves geometric properties for a whole table of sections at once.
 
 """
 
 from __future__ import annotations
 
-from math import floor, log10, isnan
+from math import isnan
 from dataclasses import dataclass, field
 from enum import StrEnum
+from types import ModuleType, SimpleNamespace
 import numpy as np
 
 from steelas.shape import (
@@ -27,8 +30,10 @@ from steelas.shape import (
     tshape,
     rectangleplate,
 )
+from steelas.shape.arrays import where
 
 from steelas.data.io import report
+from steelas.profiling import instrumented
 
 
 class SectionType(StrEnum):
@@ -44,6 +49,32 @@ class SectionType(StrEnum):
     RectPlate = "RectPlate"
 
 
+# shape modules used to solve each section type
+SHAPE_FUNCTIONS: dict[str, ModuleType] = {
+    "CHS": circularhollow,
+    "RHS": rectangularhollow,
+    "SHS": rectangularhollow,
+    "WB": ishape,
+    "WC": ishape,
+    "UB": ishape,
+    "UC": ishape,
+    "PFC": cshape,
+    "BT": tshape,
+    "CT": tshape,
+    "RectPlate": rectangleplate,
+}
+
+
+def shape_function(sec_type: str) -> ModuleType:
+    """returns the shape module used to solve section properties for sec_type"""
+    try:
+        return SHAPE_FUNCTIONS[sec_type]
+    except KeyError:
+        raise NotImplementedError(
+            f"section type: {sec_type} has no shape function"
+        ) from None
+
+
 # list section property keys
 # open_section_keys = ['d', 'b', 't_f', 't_w', 'r']
 # tfb_keys = ['d', 'b', 't_f', 't_w', 'r_r', 'r_f', 'alpha']
@@ -75,7 +106,7 @@ class SectionGeometry:
         I_w (float): Warping constant.
         J (float): Torsional constant.
         x_c, y_c (float): Coordinates of the centroid, default to 0.
-        sig_figs (int): Number of significant figures for rounding calculations, defaults to 4.
+        sig_figs (int): Number of significant figures of reported values, defaults to 4.
     """
 
     name: str = ""
@@ -107,7 +138,7 @@ class SectionGeometry:
     x_c: float = 0
     y_c: float = 0
 
-    # round values to a number of significant figures
+    # significant figures of reported values (calculations are not rounded)
     sig_figs: int = field(repr=False, default=4)
 
     def __post_init__(self):
@@ -117,25 +148,13 @@ class SectionGeometry:
     def report(self, **kwargs):
         return report(self, **kwargs)
 
+    @instrumented("SectionGeometry.solve_shape")
     def solve_shape(self):
-        if self.sec_type in ["CHS"]:
-            shape_fn = circularhollow
-        elif self.sec_type in ["RHS", "SHS"]:
-            shape_fn = rectangularhollow
-        elif self.sec_type in ["WB", "WC", "UB", "UC"]:
-            shape_fn = ishape
-        elif self.sec_type in ["PFC"]:
-            shape_fn = cshape
+        shape_fn = shape_function(self.sec_type)
+        if shape_fn is cshape:
             self.x_c = shape_fn.x_c(self)
-        elif self.sec_type in ["BT", "CT"]:
-            shape_fn = tshape
+        elif shape_fn is tshape:
             self.y_c = shape_fn.y_c(self)
-        elif self.sec_type in ["RectPlate"]:
-            shape_fn = rectangleplate
-        else:
-            raise NotImplementedError(
-                f"section type: {self.sec_type} has no shape function"
-            )
 
         self.A_g = shape_fn.A_g(self)
         self.I_x = shape_fn.I_x(self)
@@ -150,14 +169,6 @@ class SectionGeometry:
         self.r_x = self._r_x()
         self.r_y = self._r_y()
 
-        # round to sig figs
-        if self.sig_figs:
-            for k, v in list(self.__dict__.items()):
-                if isinstance(v, (float, int)) and (not isnan(v)) and (v != 0):
-                    setattr(
-                        self, k, round(v, self.sig_figs - int(floor(log10(abs(v)))) - 1)
-                    )
-
     def _Z_x(self) -> float:
         return self.I_x / self.y_max
 
@@ -294,25 +305,22 @@ class SectionGeometry:
     def Q_c(self) -> float:
         match self.sec_type:
             case "BT" | "CT":
-                if self.y_c >= (self.t_f + self.r_1):
-                    q = (
-                        self.b * self.t_f * (self.y_c - 0.5 * self.t_f)
-                        + 0.4292
-                        * self.r_1**2
-                        * (self.y_c - self.t_f - 0.223 * self.r_1)
-                        + self.t_w * (self.y_c - self.t_f) ** 2 / 2
-                    )
-                elif self.y_c >= self.t_f:
-                    q = (
-                        self.b * self.t_f * (self.y_c - 0.5 * self.t_f)
-                        + self.t_w * (self.y_c - self.t_f) ** 2 / 2
-                    )
-                    # ignore fillet
-                    #
-                else:
+                in_flange = self.y_c < self.t_f
+                if not isinstance(in_flange, np.ndarray) and in_flange:
                     raise NotImplementedError(
                         "Q_c calculation for n.a. within flange of tee-section not implemented"
                     )
+                q = where(
+                    self.y_c >= (self.t_f + self.r_1),
+                    self.b * self.t_f * (self.y_c - 0.5 * self.t_f)
+                    + 0.4292 * self.r_1**2 * (self.y_c - self.t_f - 0.223 * self.r_1)
+                    + self.t_w * (self.y_c - self.t_f) ** 2 / 2,
+                    # ignore fillet
+                    self.b * self.t_f * (self.y_c - 0.5 * self.t_f)
+                    + self.t_w * (self.y_c - self.t_f) ** 2 / 2,
+                )
+                # arrays: nan for sections with the n.a. within the flange
+                q = where(in_flange, np.nan, q)
                 # NOTE: ignore section radius
                 # q = self.b * self.t_f*(self.y_c - 0.5 * self.t_f) + \
                 #    self.t_w * (self.y_c - self.t_f)**2/2
@@ -339,3 +347,133 @@ class SectionGeometry:
                 raise ValueError(
                     f"unknown shear stress distribution for section type {self.sec_type}"
                 )
+
+
+# section dimension keys accepted by solve_shapes
+DIMENSION_KEYS = ["d", "b", "t_f", "t_w", "t", "r_1", "r_2", "alpha", "r_o"]
+# geometric properties returned by solve_shapes
+PROPERTY_KEYS = [
+    "A_g",
+    "I_x",
+    "I_y",
+    "S_x",
+    "S_y",
+    "Z_x",
+    "Z_y",
+    "r_x",
+    "r_y",
+    "I_w",
+    "J",
+    "x_c",
+    "y_c",
+]
+# derived SectionGeometry properties returned by solve_shapes (nan where undefined)
+DERIVED_KEYS = ["d_1", "d_w", "d_p", "b_ff", "A_w", "shear_stress_uniformity"]
+
+
+def solve_shapes(dims, sec_type: str | None = None) -> dict[str, np.ndarray]:
+    """
+    Solves geometric properties for a table of sections in one vectorized pass per
+    section type, using the same shape functions as SectionGeometry.solve_shape.
+
+    Args:
+        dims: a DataFrame, NumPy structured array or dict of arrays with the section
+            dimensions (d, b, t_f, t_w, t, r_1, r_2, alpha, r_o). Missing dimension
+            columns are treated as nan.
+        sec_type: section type of every row. If None, dims must have a 'sec_type' column.
+
+    Returns:
+        dict of arrays, one entry per row of dims, for sec_type, each dimension, each
+        geometric property (A_g, I_x, I_y, S_x, S_y, Z_x, Z_y, r_x, r_y, I_w, J, x_c, y_c)
+        and each derived property in DERIVED_KEYS. Values are not rounded to significant
+        figures.
+    """
+    columns = _column_names(dims)
+    if sec_type is None:
+        sec_types = np.asarray(dims["sec_type"], dtype=object)
+    else:
+        sec_types = np.full(len(dims[columns[0]]), sec_type, dtype=object)
+    n = len(sec_types)
+
+    out = {"sec_type": sec_types}
+    for k in DIMENSION_KEYS:
+        if k in columns:
+            out[k] = np.asarray(dims[k], dtype=float)
+        else:
+            out[k] = np.full(n, np.nan)
+    for k in PROPERTY_KEYS + DERIVED_KEYS:
+        out[k] = np.full(n, np.nan)
+    out["x_c"][:] = 0
+    out["y_c"][:] = 0
+
+    for st in dict.fromkeys(sec_types):
+        rows = sec_types == st
+        props = _solve_shape_arrays(
+            st, _GeometryArrays(**{k: out[k][rows] for k in DIMENSION_KEYS})
+        )
+        for k, v in props.items():
+            out[k][rows] = v
+    return out
+
+
+def _column_names(dims) -> list[str]:
+    """column names of a DataFrame, structured array or dict"""
+    if getattr(dims, "dtype", None) is not None and dims.dtype.names:
+        return list(dims.dtype.names)
+    return list(dims.keys())
+
+
+class _GeometryArrays(SimpleNamespace):
+    """array-valued stand-in for SectionGeometry, for rows sharing one sec_type"""
+
+    d_1 = SectionGeometry.d_1
+    A_w = SectionGeometry.A_w
+    d_w = SectionGeometry.d_w
+    d_p = SectionGeometry.d_p
+    b_ff = SectionGeometry.b_ff
+    Q_c = SectionGeometry.Q_c
+    shear_stress_uniformity = SectionGeometry.shear_stress_uniformity
+
+
+def _solve_shape_arrays(sec_type: str, params: _GeometryArrays) -> dict:
+    """array counterpart of SectionGeometry.solve_shape for a single section type"""
+    shape_fn = shape_function(sec_type)
+    params.sec_type = sec_type
+    n = len(params.d)
+
+    props = {}
+    if shape_fn is cshape:
+        props["x_c"] = params.x_c = shape_fn.x_c(params)
+    elif shape_fn is tshape:
+        props["y_c"] = params.y_c = shape_fn.y_c(params)
+
+    # properties are set on params as they are solved, as in solve_shape
+    for k in ["A_g", "I_x", "I_y", "S_x", "S_y", "J", "I_w"]:
+        v = np.broadcast_to(np.asarray(getattr(shape_fn, k)(params), dtype=float), n)
+        setattr(params, k, v)
+        props[k] = v
+
+    if sec_type == "CHS":
+        x_max = params.d / 2
+    elif shape_fn is cshape:
+        x_max = np.maximum(params.x_c, params.b - params.x_c)
+    else:
+        x_max = params.b / 2
+    if shape_fn is tshape:
+        y_max = np.maximum(params.y_c, params.d - params.y_c)
+    else:
+        y_max = params.d / 2
+
+    props["Z_x"] = params.I_x / y_max
+    props["Z_y"] = params.I_y / x_max
+    props["r_x"] = (params.I_x / params.A_g) ** 0.5
+    props["r_y"] = (params.I_y / params.A_g) ** 0.5
+
+    for k in DERIVED_KEYS:
+        try:
+            v = getattr(params, k)
+        except (ValueError, NotImplementedError):
+            # property undefined for this section type (e.g. A_w for CHS)
+            continue
+        props[k] = np.broadcast_to(np.asarray(v, dtype=float), n)
+    return props
@@ -3,7 +3,9 @@ This module calculate AS steel material properties based on section geometry (us
 """
 
 import numpy as np
-from math import isnan
+from bisect import bisect_left
+from functools import lru_cache
+from math import inf, isnan, nan, nextafter
 from dataclasses import dataclass
 from typing import Callable
 
@@ -132,19 +134,7 @@ class SteelMaterial:
         return self._fy_method()(self.grade, t)
 
     def _res_stress(self) -> str:
-        match self.mat_type:
-            case "HollowSection":
-                r = "CF"
-            # case 'HotRolledFlats'   -> Not Implemented AS1594
-            case "HotRolledPlate":
-                r = "HR"
-            case "HotRolledSection":
-                r = "HR"
-            #'HotRolledBar'     -> Not Implemented AS3679.1
-            #'PressurePlate'    -> AS3597
-            case "WeldedSection":
-                r = "HW"
-        return r
+        return residual_stress_type(self.mat_type)
 
     @classmethod
     def from_dict(cls, **kwargs):
@@ -163,6 +153,163 @@ class SteelMaterial:
         return o
 
 
+# -----------------------------
+#   AS4100 Table 2.1 Lookups
+# -----------------------------
+
+# Table 2.1 values as thickness bands (t_max, value) per standard and grade. A value
+# applies to thicknesses up to and including t_max, with bands in ascending order; strict
+# upper bounds (t < x) use the next float below x. nan marks a band without a tabulated
+# value and None a grade whose value is not implemented.
+YIELD_STRESS = "f_y"
+TENSILE_STRENGTH = "f_u"
+
+
+def _below(t: float) -> float:
+    return nextafter(t, -inf)
+
+
+MATERIAL_TABLES = {
+    YIELD_STRESS: {
+        "AS1163": {
+            "C450": [(inf, 450)],
+            "C350": [(inf, 350)],
+            "C250": [(inf, 250)],
+        },
+        "AS3678": {
+            "GR450": [(20, 450), (32, 420), (50, 400)],
+            "GR400": [(12, 400), (20, 380), (80, 360)],
+            "GR350": [(12, 360), (20, 350), (80, 340), (150, 330)],
+            "WR350": [(50, 340)],
+            "GR300": [(8, 320), (12, 310), (20, 300), (50, 280), (80, 270), (150, 260)],
+            "GR250": [(8, 280), (12, 260), (50, 250), (80, 240), (150, 230)],
+            "GR200": [(12, 200)],
+        },
+        "AS3679.1": {
+            "GR350": [(11, 360), (_below(40), 340), (inf, 330)],
+            "GR300": [(_below(11), 320), (17, 300), (inf, 280)],
+        },
+        "AS3597": {
+            "PR500": [(inf, 500)],
+            "PR600": [(inf, 600)],
+            "PR700": [(5, 650), (_below(65), 690), (_below(110), nan), (inf, 620)],
+        },
+    },
+    TENSILE_STRENGTH: {
+        "AS1163": {
+            "C450": [(inf, 500)],
+            "C350": [(inf, 430)],
+            "C250": [(inf, 320)],
+        },
+        "AS3678": {
+            "GR450": None,  # thickness-dependent
+            "GR400": [(inf, 480)],
+            "GR350": [(inf, 450)],
+            "WR350": [(inf, 450)],
+            "GR300": [(inf, 430)],
+            "GR250": [(inf, 410)],
+            "GR200": [(inf, 300)],
+        },
+        "AS3679.1": {
+            "GR350": [(inf, 480)],
+            "GR300": [(inf, 440)],
+        },
+        "AS3597": {
+            "PR500": [(inf, 590)],
+            "PR600": [(inf, 690)],
+            "PR700": [(5, 750), (_below(65), 790), (_below(110), nan), (inf, 720)],
+        },
+    },
+}
+
+# material type -> standard, see material_type_functions()
+MATERIAL_STANDARDS = {
+    "HollowSection": "AS1163",
+    "HotRolledPlate": "AS3678",
+    "HotRolledSection": "AS3679.1",
+    "PressurePlate": "AS3597",
+    "WeldedSection": "AS3678",
+}
+
+
+def _bands(prop: str, standard: str, grade: str) -> tuple[tuple, tuple] | None:
+    """returns the (t_max, value) bands of a Table 2.1 entry as (bounds, values)"""
+    try:
+        bands = MATERIAL_TABLES[prop][standard][grade]
+    except KeyError:
+        raise ValueError("unknown material grade") from None
+    if bands is None:
+        return None
+    bounds, values = zip(*bands)
+    return bounds, values
+
+
+@lru_cache(maxsize=4096)
+def _lookup(prop: str, standard: str, grade: str, t: float) -> int:
+    bands = _bands(prop, standard, grade)
+    if bands is None:
+        raise NotImplementedError(f"{standard} {grade} {prop} is not implemented")
+    bounds, values = bands
+    if bounds == (inf,):
+        return values[0]
+    if isnan(t):
+        raise ValueError("please provide a plate thickness t")
+    i = bisect_left(bounds, t)
+    if i == len(bounds) or isnan(values[i]):
+        raise ValueError(
+            f"t = {t} is outside the {standard} {grade} range of Table 2.1"
+        )
+    return values[i]
+
+
+def table_2_1(prop: str, standard: str, grade: str, t: float = np.nan) -> int:
+    """returns f_y or f_u (prop) for a standard, grade and thickness from AS4100 Table 2.1"""
+    if t is None or isnan(t):
+        t = nan  # nan != nan, so use one object for lru_cache hits
+    return _lookup(prop, standard, grade, t)
+
+
+def _table_2_1_array(prop: str, mat_type, grade, t) -> np.ndarray:
+    mat_type, grade, t = np.broadcast_arrays(
+        np.asarray(mat_type, dtype=object),
+        np.asarray(grade, dtype=object),
+        np.asarray(t, dtype=float),
+    )
+    out = np.full(t.shape, np.nan)
+    for m, g in set(zip(mat_type.flat, grade.flat)):
+        try:
+            standard = MATERIAL_STANDARDS[m]
+        except KeyError:
+            raise ValueError(f"unknown material type {m}") from None
+        bands = _bands(prop, standard, g)
+        if bands is None:
+            continue
+        mask = (mat_type == m) & (grade == g)
+        bounds, values = bands
+        if bounds == (inf,):
+            out[mask] = values[0]
+        else:
+            i = np.searchsorted(bounds, t[mask], side="left")
+            out[mask] = np.append(values, np.nan)[i]
+    return out
+
+
+def yield_stress(mat_type, grade, t) -> np.ndarray:
+    """
+    vectorized AS4100 Table 2.1 yield stress. mat_type, grade and thickness t are broadcast
+    (e.g. one row per section). Returns nan where t is nan or outside the tabulated range.
+    """
+    return _table_2_1_array(YIELD_STRESS, mat_type, grade, t)
+
+
+def tensile_strength(mat_type, grade, t=np.nan) -> np.ndarray:
+    """
+    vectorized AS4100 Table 2.1 tensile strength, as per yield_stress(). Returns nan where
+    the tensile strength is thickness-dependent and t is nan or outside the tabulated range.
+    """
+    return _table_2_1_array(TENSILE_STRENGTH, mat_type, grade, t)
+
+
 # -----------------------------
 #    AS1163 Hollow Sections
 # -----------------------------
@@ -173,18 +320,7 @@ def AS1163_fy(grade: str, t: float = np.nan) -> int:
     AS1163 (pressure vessel steel)"""
 
     # NOTE - t input is unused - added to suppress as typehint error
-
-    # AS4100 TABLE 2.1
-    match grade:
-        case "C450":
-            fy = 450
-        case "C350":
-            fy = 350
-        case "C250":
-            fy = 250
-        case _:
-            raise ValueError("unknown material grade")
-    return fy
+    return table_2_1(YIELD_STRESS, "AS1163", grade, t)
 
 
 def AS1163_fu(grade: str, t: float = np.nan) -> int:
@@ -192,19 +328,7 @@ def AS1163_fu(grade: str, t: float = np.nan) -> int:
     AS1163 (pressure vessel steel)"""
 
     # NOTE - t input is unused - added to suppress as typehint error
-
-    # AS4100 TABLE 2.1
-    match grade:
-        case "C450":
-            fu = 500
-        case "C350":
-            fu = 430
-        case "C250":
-            fu = 320
-
-        case _:
-            raise ValueError("unknown material grade")
-    return fu
+    return table_2_1(TENSILE_STRENGTH, "AS1163", grade, t)
 
 
 # -----------------------------
@@ -219,75 +343,7 @@ def AS1163_fu(grade: str, t: float = np.nan) -> int:
 def AS3678_fy(grade: str, t: float = np.nan) -> int:  # add grade as variable
     """returns the yield stress fy of steel material grades as per
     AS3678 (hot-rolled plates, floor plates, and slabs"""
-
-    if t is np.nan:
-        raise ValueError("please provide a plate thickness t")
-
-    # AS3678 in AS4100 TABLE 2.1
-    if grade == "GR450":
-        if t <= 20:
-            fy = 450
-        elif t <= 32:
-            fy = 420
-        elif t <= 50:
-            fy = 400
-
-    if grade == "GR400":
-        if t <= 12:
-            fy = 400
-        elif t <= 20:
-            fy = 380
-        elif t <= 80:
-            fy = 360
-
-    elif grade == "GR350":
-        if t <= 12:
-            fy = 360
-        elif t <= 20:
-            fy = 350
-        elif t <= 80:
-            fy = 340
-        elif t <= 150:
-            fy = 330
-
-    elif grade == "WR350":
-        if t <= 50:
-            fy = 340
-
-    elif grade == "GR300":
-        if t <= 8:
-            fy = 320
-        elif t <= 12:
-            fy = 310
-        elif t <= 20:
-            fy = 300
-        elif t <= 50:
-            fy = 280
-        elif t <= 80:
-            fy = 270
-        elif t <= 150:
-            fy = 260
-
-    elif grade == "GR250":
-        if t <= 8:
-            fy = 280
-        elif t <= 12:
-            fy = 260
-        elif t <= 50:
-            fy = 250
-        elif t <= 80:
-            fy = 240
-        elif t <= 150:
-            fy = 230
-
-    elif grade == "GR200":
-        if t <= 12:
-            fy = 200
-
-    else:
-        raise ValueError("unknown material grade")
-
-    return fy
+    return table_2_1(YIELD_STRESS, "AS3678", grade, t)
 
 
 def AS3678_fu(grade: str, t: float = np.nan) -> int:
@@ -295,26 +351,7 @@ def AS3678_fu(grade: str, t: float = np.nan) -> int:
     AS3678 (hot-rolled plates, floor plates, and slabs)"""
 
     # NOTE - t input is unused - added to suppress as typehint error
-
-    # AS3678 in AS4100 TABLE 2.1
-    match grade:
-        case "GR450":
-            raise NotImplementedError  # thickness-dependent
-        case "GR400":
-            fu = 480
-        case "GR350":
-            fu = 450
-        case "WR350":
-            fu = 450
-        case "GR300":
-            fu = 430
-        case "GR250":
-            fu = 410
-        case "GR200":
-            fu = 300
-        case _:
-            raise ValueError("unknown material grade")
-    return fu
+    return table_2_1(TENSILE_STRENGTH, "AS3678", grade, t)
 
 
 # --------------------------------------
@@ -325,28 +362,7 @@ def AS3678_fu(grade: str, t: float = np.nan) -> int:
 def AS3679_sections_fy(grade: str, t: float = np.nan) -> int:
     """returns the yield stress fy of steel material grades as per
     AS3679.1 (hot-rolled sections and bars)"""
-
-    if t is np.nan:
-        raise ValueError("please provide a plate thickness t")
-
-    # AS3679.1 in AS4100 TABLE 2.1
-    if grade == "GR350":
-        if t <= 11:
-            fy = 360
-        elif t < 40:
-            fy = 340
-        elif t >= 40:
-            fy = 330
-    elif grade == "GR300":
-        if t < 11:
-            fy = 320
-        elif t <= 17:
-            fy = 300
-        elif t > 17:
-            fy = 280
-    else:
-        raise ValueError("unknown material grade")
-    return fy
+    return table_2_1(YIELD_STRESS, "AS3679.1", grade, t)
 
 
 def AS3679_sections_fu(grade: str, t: float = np.nan) -> int:
@@ -354,16 +370,7 @@ def AS3679_sections_fu(grade: str, t: float = np.nan) -> int:
     AS3679.1 (hot-rolled sections and bars)"""
 
     # NOTE - t input is unused - added to suppress as typehint error
-
-    # AS3679.1 in AS4100 TABLE 2.1
-    match grade:
-        case "GR350":
-            fu = 480
-        case "GR300":
-            fu = 440
-        case _:
-            raise ValueError("unknown material grade")
-    return fu
+    return table_2_1(TENSILE_STRENGTH, "AS3679.1", grade, t)
 
 
 # -----------------------------
@@ -374,51 +381,13 @@ def AS3679_sections_fu(grade: str, t: float = np.nan) -> int:
 def AS3597_fy(grade: str, t: float = np.nan) -> int:
     """returns the yield stress fy of steel material grades as per
     AS3597 (pressure vessel steel)"""
-
-    # AS3597 in AS4100 TABLE 2.1
-    match grade:
-        case "PR500":
-            fy = 500
-        case "PR600":
-            fy = 600
-        case "PR700":
-            if t is not None:
-                if t <= 5:
-                    fy = 650
-                elif t < 65:
-                    fy = 690
-                elif t >= 110:
-                    fy = 620
-            else:
-                raise ValueError("please provide material thickness")
-        case _:
-            raise ValueError("unknown material grade")
-    return fy
+    return table_2_1(YIELD_STRESS, "AS3597", grade, t)
 
 
 def AS3597_fu(grade: str, t: float = np.nan) -> int:
     """returns the tensile strength fu of steel material grades as per
     AS3597 (pressure vessel steel)"""
-
-    # AS3679.1 in AS4100 TABLE 2.1
-    match grade:
-        case "PR500":
-            fu = 590
-        case "PR600":
-            fu = 690
-        case "PR700":
-            if t is not None:
-                if t <= 5:
-                    fu = 750
-                elif t < 65:
-                    fu = 790
-                elif t >= 110:
-                    fu = 720
-            else:
-                raise ValueError("please provide material thickness")
-        case _:
-            raise ValueError("unknown material grade")
-    return fu
+    return table_2_1(TENSILE_STRENGTH, "AS3597", grade, t)
 
 
 # ----------------
@@ -456,10 +425,29 @@ def material_type_functions(mat_type: str) -> tuple[Callable, Callable]:
             # uses HotRolledPlate
             fy_method = AS3678_fy
             fu_method = AS3678_fu
+        case _:
+            raise ValueError(f"unknown material type {mat_type}")
 
     return fy_method, fu_method
 
 
+def residual_stress_type(mat_type: str) -> str:
+    """returns the residual stress category (AS4100 Table 5.2) for a material type"""
+    match mat_type:
+        case "HollowSection":
+            r = "CF"
+        # case 'HotRolledFlats'   -> Not Implemented AS1594
+        case "HotRolledPlate":
+            r = "HR"
+        case "HotRolledSection":
+            r = "HR"
+        #'HotRolledBar'     -> Not Implemented AS3679.1
+        #'PressurePlate'    -> AS3597
+        case "WeldedSection":
+            r = "HW"
+    return r
+
+
 def calc_mat_prop(mat_type, grade, t):
     if "Section" in mat_type or "Bar" in mat_type:
         f_y = AS3679_sections_fy(grade, t)
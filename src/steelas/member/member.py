@@ -1,16 +1,19 @@
 from __future__ import annotations
+
 # Script to calculate the capacity of few different steel sections
 
 # for pi in member buckling
 import numpy as np
 from dataclasses import dataclass, field
-from math import isnan, floor, log10
+from copy import copy
+from functools import wraps
 
-from steelas.data.io import get_section_from_library, MemberLibrary
+from steelas.data.io import get_section, get_section_from_library, MemberLibrary
 from steelas.member.material import SteelMaterial
 from steelas.member.geometry import SectionGeometry
 from steelas.member.slenderness import SteelSlenderness
 from steelas.data.io import report
+from steelas.profiling import instrumented
 
 
 def reference_buckling_moment(section: SteelSection, l_eb: int) -> float:
@@ -174,6 +177,11 @@ class SteelSection:
 
     """creates a new SteelSection from library import"""
 
+    @classmethod
+    def from_name(cls, name: str) -> SteelSection:
+        """creates a new SteelSection from any registered section library, by name"""
+        return cls.from_section_dict(get_section(name))
+
     @classmethod
     def from_section_dict(cls, section_dict: dict):
         """builds geometry, material, and section classes from section_dict"""
@@ -182,8 +190,57 @@ class SteelSection:
         return cls(geom=geom, mat=mat, slenderness=None)
 
 
+# SteelMember attributes that the capacities are calculated from
+MEMBER_INPUTS = [
+    "section",
+    "l_ex",
+    "l_ey",
+    "l_eb",
+    "alpha_m",
+    "end_i_restraint",
+    "end_j_restraint",
+    "phi",
+    "k_t",
+]
+# member input -> names of the cached calculations that depend on it
+_DEPENDENTS: dict[str, set[str]] = {}
+
+
+def _cached(*inputs: str):
+    """
+    caches a SteelMember calculation (a method without arguments) in member._cache, until
+    one of the member inputs it depends on is assigned a new value.
+    """
+
+    def decorator(fn):
+        name = fn.__name__
+        for k in inputs:
+            _DEPENDENTS.setdefault(k, set()).add(name)
+
+        @wraps(fn)
+        def cached(self):
+            try:
+                return self._cache[name]
+            except KeyError:
+                value = self._cache[name] = fn(self)
+                return value
+
+        return cached
+
+    return decorator
+
+
 @dataclass
 class SteelMember:
+    """
+    Section and member capacities of a steel member, AS4100.
+
+    Intermediate calculations (M_o, alpha_sx, lam_nx, alpha_cx, N_s, ...) are cached on
+    first use. Assigning a new value to one of MEMBER_INPUTS, e.g. member.l_eb = 4000,
+    discards only the cached calculations that depend on it and re-solves the capacities,
+    so section-level results are not recalculated when a length changes.
+    """
+
     section: SteelSection  # includes geom and material and slenderness attrs
     name: str = field(init=False, default="")
     section_name: str = ""  # temp
@@ -224,10 +281,29 @@ class SteelMember:
     phiM_x: float = 0
     phiM_y: float = 0
 
-    # round values to a number of significant figures
+    # significant figures of reported values (calculations are not rounded)
     sig_figs: int = 3
 
+    @instrumented("SteelMember.__post_init__")
     def __post_init__(self):
+        self._cache = {}
+        self._solve()
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # re-solve after an input changes (once the member has been solved)
+        if name in MEMBER_INPUTS and "_cache" in self.__dict__:
+            self._invalidate([name])
+            self._solve()
+
+    def _invalidate(self, inputs: list[str]) -> None:
+        """discards the cached calculations that depend on inputs"""
+        stale = set().union(*[_DEPENDENTS.get(k, ()) for k in inputs])
+        # a new dict, so that shallow copies of this member keep their own cache
+        self._cache = {k: v for k, v in self._cache.items() if k not in stale}
+
+    def _solve(self) -> None:
+        """calculates the capacities, from the cached calculations where available"""
         N_to_kN = 1 / 1e3
         Nmm_to_kn_m = 1 / 1e6
 
@@ -259,13 +335,38 @@ class SteelMember:
 
         self.phiN_c = self.phi * min(self.N_s, self.N_cx, self.N_cy)
 
-        # round to sig figs
-        if self.sig_figs:
-            for k, v in list(self.__dict__.items()):
-                if isinstance(v, (float, int)) and (not isnan(v)) and (v != 0):
-                    setattr(
-                        self, k, round(v, self.sig_figs - int(floor(log10(abs(v)))) - 1)
-                    )
+    def update(self, **inputs) -> SteelMember:
+        """
+        assigns new values to member inputs (MEMBER_INPUTS, e.g. l_eb, alpha_m or
+        end_i_restraint) and re-solves the capacities once. Only the calculations that
+        depend on the changed inputs are repeated; the results are identical to those of
+        a new SteelMember with the same inputs. Returns the member.
+        """
+        unknown = [k for k in inputs if k not in MEMBER_INPUTS]
+        if unknown:
+            raise ValueError(f"unknown member inputs {unknown}, use {MEMBER_INPUTS}")
+        for k, v in inputs.items():
+            # bypass __setattr__, to solve once for all inputs
+            object.__setattr__(self, k, v)
+        self._invalidate(list(inputs))
+        self._solve()
+        return self
+
+    def with_lengths(
+        self,
+        l_ex: float | None = None,
+        l_ey: float | None = None,
+        l_eb: float | None = None,
+        **inputs,
+    ) -> SteelMember:
+        """
+        returns a copy of the member with new effective lengths (and any other
+        MEMBER_INPUTS), sharing the section and its cached section capacities
+        (N_s, M_sx, M_sy, V_v, N_t). Lengths that are None are unchanged.
+        """
+        lengths = {"l_ex": l_ex, "l_ey": l_ey, "l_eb": l_eb}
+        inputs.update({k: v for k, v in lengths.items() if v is not None})
+        return copy(self).update(**inputs)
 
     def report(self, **kwargs) -> None:
         report(self, exclude_attribute_names=["section"], **kwargs)
@@ -274,14 +375,17 @@ class SteelMember:
     # AS4100 Section 5 Members Subject to Bending ----------------------------
     # ------------------------------------------------------------------------
 
+    @_cached("section")
     def _M_sx(self) -> float:
         """AS4100 Cl 5.2.1 Ms nominal section moment capacity"""
         return self.section.Z_ex * self.section.f_y
 
+    @_cached("section")
     def _M_sy(self) -> float:
         """AS4100 Cl 5.2.1 Ms nominal section moment capacity"""
         return self.section.Z_ey * self.section.f_y
 
+    @_cached("section", "l_eb", "alpha_m", "end_i_restraint", "end_j_restraint")
     def _M_bx(self) -> float:
         """AS4100 Cl 5.6, member capacity of segments without full lateral restraint"""
         if self.l_eb > 0:
@@ -304,6 +408,7 @@ class SteelMember:
         # return slenderness_reduction_factor(self.section, M_s, M_oa)
 
     @property
+    @_cached("section", "l_eb")
     def alpha_sx(self) -> float:
         """AS4100 Cl 6.6.1.1(iv) slenderness reduction factor"""
         return self.alpha_s(self._M_sx(), self.M_oa)
@@ -314,6 +419,7 @@ class SteelMember:
         return self.M_o
 
     @property
+    @_cached("section", "l_eb")
     def M_o(self) -> float:
         """AS4100 Cl 5.6.1 M_o reference buckling moment"""
         return reference_buckling_moment(self.section, self.l_eb)
@@ -322,10 +428,12 @@ class SteelMember:
     # AS4100 Section 6 Members subject to axial compression
     # ------------------------------------------------------------------------M_bx
 
+    @_cached("section")
     def _N_s(self) -> float:
         """AS4100 Cl 6.2.1 Nominal section capacity"""
         return self.section.k_f * self.section.A_n * self.section.f_y
 
+    @_cached("section", "l_ex")
     def _N_cx(self) -> float:
         """AS4100 Cl 6.3.3 Nominal section capacity (x axis) of a member of constant cross-section subject to flexural bending"""
         if self.l_ex > 0:
@@ -333,6 +441,7 @@ class SteelMember:
         else:
             return self._N_s()
 
+    @_cached("section", "l_ey")
     def _N_cy(self) -> float:
         """AS4100 Cl 6.3.3 Nominal section capacity (y axis) of a member of constant cross-section subject to flexural bending"""
         if self.l_ey > 0:
@@ -346,11 +455,13 @@ class SteelMember:
         return xi * (1 - (1 - (90 / (xi * lam)) ** 2) ** 0.5)
 
     @property
+    @_cached("section", "l_ex")
     def alpha_cx(self) -> float:
         """AS4100 Cl 6.3.3 member slenderness reduction factor, compression x-axis"""
         return self.alpha_c(self.xi_x, self.lam_x)
 
     @property
+    @_cached("section", "l_ey")
     def alpha_cy(self) -> float:
         """AS4100 Cl 6.3.3 member slenderness reduction factor, compression y-axis"""
         return self.alpha_c(self.xi_y, self.lam_y)
@@ -364,12 +475,14 @@ class SteelMember:
         return ((lam / 90) ** 2 + 1 + eta) / (2 * (lam / 90) ** 2)
 
     @property
+    @_cached("section", "l_ex")
     def xi_x(self) -> float:
         """AS4100 Cl 6.3.3 calculation parameter, x-axis"""
         eta_x = self.eta(self.lam_x)
         return self.xi(self.lam_x, eta_x)
 
     @property
+    @_cached("section", "l_ey")
     def xi_y(self):
         """AS4100 Cl 6.3.3 calculation parameter, y-axis"""
         eta_y = self.eta(self.lam_y)
@@ -381,18 +494,21 @@ class SteelMember:
         return max(0.00326 * (lam - 13.5), 0)
 
     @property
+    @_cached("section", "l_ex")
     def lam_x(self) -> float:
         """AS4100 Cl 6.3.3 slenderness reduction parameter, x-axis"""
         alpha_ax = self.alpha_a(self.lam_nx)
         return self.lam_nx + alpha_ax * self.section.alpha_b
 
     @property
+    @_cached("section", "l_ey")
     def lam_y(self) -> float:
         """AS4100 Cl 6.3.3 slenderness reduction parameter, y-axis"""
         alpha_ay = self.alpha_a(self.lam_ny)
         return self.lam_ny + alpha_ay * self.section.alpha_b
 
     @property
+    @_cached("section", "l_ex")
     def lam_nx(self) -> float:
         """AS4100 Cl 6.3.3 modified member slenderness, x-axis"""
         l = (self.l_ex / self.section.r_x) * (
@@ -401,6 +517,7 @@ class SteelMember:
         return l
 
     @property
+    @_cached("section", "l_ey")
     def lam_ny(self) -> float:
         """AS4100 Cl 6.3.3 modified member slenderness, y-axis"""
         return (self.l_ey / self.section.r_y) * (
@@ -417,15 +534,18 @@ class SteelMember:
     # ------------------------------------------------------------------------
 
     @property
+    @_cached("section")
     def _N_ty(self) -> float:
         """AS4100 Cl 7.2 - tension yield capacity"""
         return self.section.A_g * self.section.f_y
 
     @property
+    @_cached("section", "k_t")
     def _N_tf(self) -> float:
         """AS4100 Cl 7.2 - tension fracture capacity"""
         return 0.85 * self.k_t * self.section.A_n * self.section.f_u
 
+    @_cached("section", "k_t")
     def _N_t(self) -> float:
         """AS4100 Cl 7.2 Nominal section capacity, axial tension"""
         N_t = min(
@@ -479,6 +599,7 @@ class SteelMember:
     # def V_v(self): # pragma: no cover
     #     raise NotImplementedError
 
+    @_cached("section")
     def _V_v(self):
         """AS4100 Cl 5.11.1 shear capacity of web"""
         if self.section.shear_stress_uniformity == 1:
@@ -489,6 +610,7 @@ class SteelMember:
             return self.V_nu
 
     @property
+    @_cached("section")
     def V_u(self):
         """Cl 5.11.2 approximately uniform shear stress distribution"""
         if self.section.web_shear_yield_governs:
@@ -497,6 +619,7 @@ class SteelMember:
             return self.V_b
 
     @property
+    @_cached("section")
     def V_nu(self):
         """Cl 5.11.3 non-uniform shear stress distribution"""
         v_u = self.V_u
@@ -504,6 +627,7 @@ class SteelMember:
         return min(v_u, v_nu)
 
     @property
+    @_cached("section")
     def V_w(self) -> float:
         """AS4100 Cl 5.11.4 shear yield capacity"""
         if self.section.sec_type == "CHS":
@@ -517,6 +641,7 @@ class SteelMember:
                 return 0.6 * self.section.f_y * self.section.A_w
 
     @property
+    @_cached("section")
     def V_b(self) -> float:
         """AS4100 Cl 5.11.5 shear buckling capacity"""
         # NOTE: only implemented for unstiffened web
@@ -0,0 +1,212 @@
+"""
+Lightest-section selection.
+
+This module finds the lightest sections in a catalog that carry a set of design actions
+at given effective lengths. Candidates are checked in order of mass, first against their
+section capacities (phiN_s, phiN_t, phiM_sx, phiV_v), which are upper bounds on the
+member capacities, and only the survivors are checked for member capacities.
+
+Functions:
+    select_lightest(): Returns the k lightest passing sections for each demand case.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import numpy as np
+
+from steelas.data.io import MemberLibrary
+from steelas.member.table import SectionTable
+from steelas.member.capacity import member_capacities
+
+
+@dataclass
+class SelectionResult:
+    """
+    Selected sections for n demand cases.
+
+    Attributes:
+        table (SectionTable): The catalog the sections were selected from.
+        rows (np.ndarray): (n, k) table row numbers of the selected sections, lightest
+            first, or -1 where fewer than k sections pass.
+        n_candidates (int): Number of catalog sections matching sec_types and grades.
+        n_section_checks (np.ndarray): Section capacity checks per demand case.
+        n_member_checks (np.ndarray): Member capacity evaluations per demand case.
+    """
+
+    table: SectionTable
+    rows: np.ndarray
+    n_candidates: int
+    n_section_checks: np.ndarray
+    n_member_checks: np.ndarray
+
+    @property
+    def names(self) -> np.ndarray:
+        """(n, k) names of the selected sections, None where no section passes"""
+        names = np.where(self.rows >= 0, self.table["name"][self.rows], None)
+        return names
+
+    @property
+    def mass(self) -> np.ndarray:
+        """(n, k) mass per unit length (kg/m) of the selected sections"""
+        return np.where(self.rows >= 0, self.table["mass"][self.rows], np.nan)
+
+    @property
+    def stats(self) -> dict:
+        """candidate and evaluation counts, summed over all demand cases"""
+        n_cases = len(self.rows)
+        return {
+            "cases": n_cases,
+            "candidates": self.n_candidates,
+            "section_checks": int(self.n_section_checks.sum()),
+            "member_checks": int(self.n_member_checks.sum()),
+            "pruned": n_cases * self.n_candidates - int(self.n_member_checks.sum()),
+        }
+
+    def to_frame(self):
+        """returns the lightest passing section for each demand case as a DataFrame"""
+        import pandas as pd
+
+        return pd.DataFrame(
+            {
+                "name": self.names[:, 0],
+                "mass": self.mass[:, 0],
+                "member_checks": self.n_member_checks,
+            }
+        )
+
+
+def _satisfied(capacity, demand) -> np.ndarray:
+    """
+    capacity >= demand, or no demand. A nan capacity (e.g. V_v of RHS/SHS sections)
+    only satisfies a zero demand.
+    """
+    with np.errstate(invalid="ignore"):
+        return (demand == 0) | (capacity >= demand)
+
+
+def _values(values) -> list | str | None:
+    """sec_types or grades as values for SectionTable.query(), e.g. a tuple as a list"""
+    if values is None or isinstance(values, str):
+        return values
+    return list(values)
+
+
+def select_lightest(
+    sections: SectionTable | MemberLibrary | str,
+    N_star=0,
+    M_star=0,
+    V_star=0,
+    l_ex=0,
+    l_ey=0,
+    l_eb=0,
+    alpha_m=1,
+    sec_types: list[str] | None = None,
+    grades: list[str] | None = None,
+    k: int = 1,
+    chunk_size: int = 8,
+) -> SelectionResult:
+    """
+    Finds the k lightest sections that satisfy each demand case.
+
+    Each case is checked for compression or tension (phiN_c or phiN_t), major axis
+    bending (phiM_bx) and shear (phiV_v) independently; combined actions are not checked.
+    Demand arguments are broadcast against each other, so thousands of cases can be
+    passed as arrays in one call.
+
+    Args:
+        sections: a SectionTable, or a section library to build one from.
+        N_star: design axial force in kN, negative for compression.
+        M_star: design major axis bending moment in kNm.
+        V_star: design shear force in kN.
+        l_ex, l_ey, l_eb: effective lengths in mm.
+        alpha_m: moment modification factor, AS4100 Cl 5.6.1.1.
+        sec_types: section types to consider, e.g. ['UB', 'UC'] (default all).
+        grades: material grades to consider, e.g. ['GR300'] (default all).
+        k: number of sections returned per demand case.
+        chunk_size: number of section survivors evaluated per case at a time.
+
+    Returns:
+        SelectionResult: selected rows and evaluation counts.
+    """
+    table = sections
+    if not isinstance(table, SectionTable):
+        table = SectionTable.from_library(sections)
+
+    N_star, M_star, V_star, l_ex, l_ey, l_eb, alpha_m = [
+        np.asarray(v, dtype=float)
+        for v in np.broadcast_arrays(N_star, M_star, V_star, l_ex, l_ey, l_eb, alpha_m)
+    ]
+    N_star, M_star, V_star, l_ex, l_ey, l_eb, alpha_m = [
+        np.atleast_1d(v) for v in (N_star, M_star, V_star, l_ex, l_ey, l_eb, alpha_m)
+    ]
+    n_cases = len(N_star)
+
+    # candidates in order of mass. sec_types and grades are sets of values, never a
+    # (lo, hi) range query
+    candidates = table.query(sec_type=_values(sec_types), grade=_values(grades))
+
+    # section capacities are upper bounds on member capacities
+    section_caps = member_capacities(table, rows=candidates)
+    N_c, N_t = -np.minimum(N_star, 0), np.maximum(N_star, 0)
+    section_ok = (
+        _satisfied(section_caps["phiN_s"], N_c[:, None])
+        & _satisfied(section_caps["phiN_t"], N_t[:, None])
+        & _satisfied(section_caps["phiM_sx"], M_star[:, None])
+        & _satisfied(section_caps["phiV_v"], V_star[:, None])
+    )
+
+    rows = np.full((n_cases, k), -1)
+    n_found = np.zeros(n_cases, dtype=int)
+    n_member_checks = np.zeros(n_cases, dtype=int)
+    next_col = np.zeros(n_cases, dtype=int)
+
+    # positions of section survivors, per case, in mass order
+    survivor_pos = [np.flatnonzero(r) for r in section_ok]
+    while True:
+        active = np.flatnonzero(
+            (n_found < k) & (next_col < [len(p) for p in survivor_pos])
+        )
+        if len(active) == 0:
+            break
+
+        cases, positions = [], []
+        for c in active:
+            p = survivor_pos[c][next_col[c] : next_col[c] + chunk_size]
+            cases.append(np.full(len(p), c))
+            positions.append(p)
+            next_col[c] += len(p)
+        cases = np.concatenate(cases)
+        positions = np.concatenate(positions)
+        n_member_checks += np.bincount(cases, minlength=n_cases)
+
+        caps = member_capacities(
+            table,
+            l_ex=l_ex[cases],
+            l_ey=l_ey[cases],
+            l_eb=l_eb[cases],
+            alpha_m=alpha_m[cases],
+            rows=candidates[positions],
+        )
+        passed = (
+            _satisfied(caps["phiN_c"], N_c[cases])
+            & _satisfied(caps["phiN_t"], N_t[cases])
+            & _satisfied(caps["phiM_bx"], M_star[cases])
+            & _satisfied(caps["phiV_v"], V_star[cases])
+        )
+
+        # store passing sections (ordered by case, then mass) up to k per case
+        cases, positions = cases[passed], positions[passed]
+        first = np.searchsorted(cases, cases)
+        rank = np.arange(len(cases)) - first + n_found[cases]
+        keep = rank < k
+        rows[cases[keep], rank[keep]] = candidates[positions[keep]]
+        n_found = np.minimum(n_found + np.bincount(cases, minlength=n_cases), k)
+
+    return SelectionResult(
+        table=table,
+        rows=rows,
+        n_candidates=len(candidates),
+        n_section_checks=np.full(n_cases, len(candidates)),
+        n_member_checks=n_member_checks,
+    )
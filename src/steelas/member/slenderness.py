@@ -10,12 +10,14 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Tuple
 import numpy as np
-from math import pi, isnan, floor, log10
+from math import pi
 
 # from structuraldesigntoolbox.
+from steelas.component.interning import interned, set_derived
 from steelas.member.material import SteelMaterial
 from steelas.member.geometry import SectionGeometry
 from steelas.data.io import report
+from steelas.profiling import instrumented
 
 
 @dataclass(kw_only=True)
@@ -56,7 +58,7 @@ class SteelSlenderness:
 
     slender_section_type_x: int = 1  # determines which equation in Cl 5.2.5 is used
 
-    # round values to a number of significant figures
+    # significant figures of reported values (calculations are not rounded)
     sig_figs: int = 3
 
     def __post_init__(self):
@@ -86,16 +88,7 @@ class SteelSlenderness:
             )
             self.solve_slenderness()
 
-            # round to sig figs
-            if self.sig_figs:
-                for k, v in list(self.__dict__.items()):
-                    if isinstance(v, (float, int)) and (not isnan(v)) and (v != 0):
-                        setattr(
-                            self,
-                            k,
-                            round(v, self.sig_figs - int(floor(log10(abs(v)))) - 1),
-                        )
-
+    @instrumented("SteelSlenderness.solve_slenderness")
     def solve_slenderness(self):
         # compact_x
         # compact_y
@@ -374,7 +367,7 @@ def i_section_components(geom: SectionGeometry, mat: SteelMaterial):
     """populate components required for slenderness evaluation"""
 
     # major axis bending
-    c_flange_x = PlateComponent(
+    c_flange_x = PlateComponent.interned(
         b=geom.b_ff,
         t=geom.t_f,
         f_y=mat.f_y,
@@ -386,7 +379,7 @@ def i_section_components(geom: SectionGeometry, mat: SteelMaterial):
     # verification data uses f_y
     # c_web_x = PlateComponent(b=geom.d_1,  t=geom.t_w, f_y=mat.f_yw,
     #                         edge_sup='Both', load_type='CompToTens', res_stress=mat.res_stress)
-    c_web_x = PlateComponent(
+    c_web_x = PlateComponent.interned(
         b=geom.d_1,
         t=geom.t_w,
         f_y=mat.f_y,
@@ -397,7 +390,7 @@ def i_section_components(geom: SectionGeometry, mat: SteelMaterial):
     components_x = [c_flange_x, c_web_x]
 
     # minor axis bending
-    c_flange_y = PlateComponent(
+    c_flange_y = PlateComponent.interned(
         b=geom.b_ff,
         t=geom.t_f,
         f_y=mat.f_y,
@@ -410,7 +403,7 @@ def i_section_components(geom: SectionGeometry, mat: SteelMaterial):
     components_y = [c_flange_y]  # , c_web_y]
 
     # compression
-    c_flange_c = PlateComponent(
+    c_flange_c = PlateComponent.interned(
         b=geom.b_ff,
         t=geom.t_f,
         f_y=mat.f_y,
@@ -419,7 +412,7 @@ def i_section_components(geom: SectionGeometry, mat: SteelMaterial):
         res_stress=mat.res_stress,
     )
     # TODO - as above, f_y vs f_yw in web slenderness check
-    c_web_c = PlateComponent(
+    c_web_c = PlateComponent.interned(
         b=geom.d_1,
         t=geom.t_w,
         f_y=mat.f_y,
@@ -436,7 +429,7 @@ def c_section_components(geom: SectionGeometry, mat: SteelMaterial):
     """populate components required for Cee section slenderness evaluation"""
 
     # major axis bending
-    c_flange_x = PlateComponent(
+    c_flange_x = PlateComponent.interned(
         b=geom.b_ff,
         t=geom.t_f,
         f_y=mat.f_y,
@@ -448,7 +441,7 @@ def c_section_components(geom: SectionGeometry, mat: SteelMaterial):
     # verification data uses f_y
     # c_web_x = PlateComponent(b=geom.d_1,  t=geom.t_w, f_y=mat.f_yw,
     #                         edge_sup='Both', load_type='CompToTens', res_stress=mat.res_stress)
-    c_web_x = PlateComponent(
+    c_web_x = PlateComponent.interned(
         b=geom.d_1,
         t=geom.t_w,
         f_y=mat.f_y,
@@ -459,7 +452,7 @@ def c_section_components(geom: SectionGeometry, mat: SteelMaterial):
     components_x = [c_flange_x, c_web_x]
 
     # minor axis bending
-    c_flange_y = PlateComponent(
+    c_flange_y = PlateComponent.interned(
         b=geom.b_ff,
         t=geom.t_f,
         f_y=mat.f_y,
@@ -475,7 +468,7 @@ def c_section_components(geom: SectionGeometry, mat: SteelMaterial):
     components_y = [c_flange_y]  # , c_web_y]
 
     # compression
-    c_flange_c = PlateComponent(
+    c_flange_c = PlateComponent.interned(
         b=geom.b_ff,
         t=geom.t_f,
         f_y=mat.f_y,
@@ -484,7 +477,7 @@ def c_section_components(geom: SectionGeometry, mat: SteelMaterial):
         res_stress=mat.res_stress,
     )
     # TODO - as above, f_y vs f_yw in web slenderness check
-    c_web_c = PlateComponent(
+    c_web_c = PlateComponent.interned(
         b=geom.d_1,
         t=geom.t_w,
         f_y=mat.f_y,
@@ -503,7 +496,7 @@ def t_section_components(geom: SectionGeometry, mat: SteelMaterial):
     # major axis bending
     # c_flange_x = PlateComponent(b=geom.b_ff,  t=geom.t_f, f_y=mat.f_y,
     #                            edge_sup='One', load_type='UniformComp', res_stress=mat.res_stress)
-    c_web_x = PlateComponent(
+    c_web_x = PlateComponent.interned(
         b=geom.d_1,
         t=geom.t_w,
         f_y=mat.f_y,
@@ -514,7 +507,7 @@ def t_section_components(geom: SectionGeometry, mat: SteelMaterial):
     components_x = [c_web_x]
 
     # minor axis bending
-    c_flange_y = PlateComponent(
+    c_flange_y = PlateComponent.interned(
         b=geom.b_ff,
         t=geom.t_f,
         f_y=mat.f_y,
@@ -525,7 +518,7 @@ def t_section_components(geom: SectionGeometry, mat: SteelMaterial):
     components_y = [c_flange_y]  # , c_web_y]
 
     # compression
-    c_flange_c = PlateComponent(
+    c_flange_c = PlateComponent.interned(
         b=geom.b_ff,
         t=geom.t_f,
         f_y=mat.f_y,
@@ -534,7 +527,7 @@ def t_section_components(geom: SectionGeometry, mat: SteelMaterial):
         res_stress=mat.res_stress,
     )
     # TODO - as above, f_y vs f_yw in web slenderness check
-    c_web_c = PlateComponent(
+    c_web_c = PlateComponent.interned(
         b=geom.d_1,
         t=geom.t_w,
         f_y=mat.f_y,
@@ -549,7 +542,7 @@ def t_section_components(geom: SectionGeometry, mat: SteelMaterial):
 
 def rhs_section_components(geom: SectionGeometry, mat: SteelMaterial):
     # solve slenderness
-    c_flange_x = PlateComponent(
+    c_flange_x = PlateComponent.interned(
         b=geom.b_ff,
         t=geom.t,
         f_y=mat.f_y,
@@ -557,7 +550,7 @@ def rhs_section_components(geom: SectionGeometry, mat: SteelMaterial):
         load_type="UniformComp",
         res_stress=mat.res_stress,
     )
-    c_web_x = PlateComponent(
+    c_web_x = PlateComponent.interned(
         b=geom.d_1,
         t=geom.t,
         f_y=mat.f_y,
@@ -567,7 +560,7 @@ def rhs_section_components(geom: SectionGeometry, mat: SteelMaterial):
     )
     components_x = [c_flange_x, c_web_x]
 
-    c_flange_y = PlateComponent(
+    c_flange_y = PlateComponent.interned(
         b=geom.b_ff,
         t=geom.t,
         f_y=mat.f_y,
@@ -575,7 +568,7 @@ def rhs_section_components(geom: SectionGeometry, mat: SteelMaterial):
         load_type="CompToTens",
         res_stress=mat.res_stress,
     )
-    c_web_y = PlateComponent(
+    c_web_y = PlateComponent.interned(
         b=geom.d_1,
         t=geom.t,
         f_y=mat.f_y,
@@ -611,7 +604,9 @@ def chs_section_components(
     geom: SectionGeometry, mat: SteelMaterial
 ) -> Tuple[list[RingComponent], list[RingComponent], list[RingComponent]]:
     # solve slenderness
-    c_ring = RingComponent(d_o=geom.d, t=geom.t, f_y=mat.f_y, res_stress=mat.res_stress)
+    c_ring = RingComponent.interned(
+        d_o=geom.d, t=geom.t, f_y=mat.f_y, res_stress=mat.res_stress
+    )
     components_x = [c_ring]
     components_y = [c_ring]
     components_c = [c_ring]
@@ -693,10 +688,12 @@ def ring_element_slenderness_limit(res_stress: str) -> Tuple(
     return val
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class PlateComponent:
     """AS4100 Cl5.2.2 Section slenderness - plate components
     AS4100 Cl 6.2.3 Plate element slenderness for compression
+
+    Immutable; use PlateComponent.interned() to share identical components.
     """
 
     b: float  # clear width of element from supported edge/edges
@@ -716,23 +713,37 @@ class PlateComponent:
     A_e: float = field(init=False)
 
     def __post_init__(self):
-        self.lam_ep, self.lam_ey, _ = plate_element_slenderness_limit(
+        lam_ep, lam_ey, _ = plate_element_slenderness_limit(
             self.edge_sup, self.load_type, self.res_stress
         )
-        self.lam_e = float(self.b / self.t * (self.f_y / 250) ** 0.5)
-        self.lam_e_ratio = self.lam_e / self.lam_ey
+        lam_e = float(self.b / self.t * (self.f_y / 250) ** 0.5)
 
         # AS4100 Cl 6.2.4
-        self.b_e = min(1, self.lam_ey / self.lam_e) * self.b
-        self.A_e = self.b_e * self.t
-        self.A_v = (self.b - self.b_e) * self.t
+        b_e = min(1, lam_ey / lam_e) * self.b
+        set_derived(
+            self,
+            lam_ep=lam_ep,
+            lam_ey=lam_ey,
+            lam_e=lam_e,
+            lam_e_ratio=lam_e / lam_ey,
+            b_e=b_e,
+            A_e=b_e * self.t,
+            A_v=(self.b - b_e) * self.t,
+        )
         # CHS -> Not implemented
 
+    @classmethod
+    def interned(cls, **kwargs) -> PlateComponent:
+        """returns a shared PlateComponent for the given attributes"""
+        return interned(cls, **kwargs)
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, frozen=True, slots=True)
 class RingComponent:
     """AS4100 Cl 5.2.2 Section slenderness - chs components
     AS4100 Cl 6.2.3 chs element slenderness for compression
+
+    Immutable; use RingComponent.interned() to share identical components.
     """
 
     d_o: float  # clear width of element from supported edge/edges
@@ -747,22 +758,168 @@ class RingComponent:
     lam_e_ratio: float = field(init=False)  # component slenderness ratio
 
     d_e: float = field(init=False)  # plate element effective width Cl 6.2.4
-    # A_v: float = field(init=False)
-    # A_e: float = field(init=False)
+    A_v: float = field(init=False, repr=False)
+    A_e: float = field(init=False, repr=False)
 
     def __post_init__(self):
-        self.lam_ep, self.lam_ey, self.lam_eyc, _ = ring_element_slenderness_limit(
-            self.res_stress
+        lam_ep, lam_ey, lam_eyc, _ = ring_element_slenderness_limit(self.res_stress)
+        lam_e = float(self.d_o / self.t * (self.f_y / 250))
+
+        # AS4100 Cl 6.2.4
+        d_e = self.d_o * min(1, (lam_eyc / lam_e) ** 0.5, (3 * lam_eyc / lam_e) ** 2)
+
+        # NOTE: unsure if this is the correct effective area calculation
+        r_o = self.d_o / 2
+        r_i = r_o - self.t
+        A_n = pi * (r_o + r_i) * (r_o - r_i)
+
+        r_e = d_e / 2
+        r_ie = r_e - self.t
+        A_e = pi * (r_e + r_ie) * (r_e - r_ie)
+        set_derived(
+            self,
+            lam_ep=lam_ep,
+            lam_ey=lam_ey,
+            lam_eyc=lam_eyc,
+            lam_e=lam_e,
+            lam_e_ratio=lam_e / lam_ey,
+            d_e=d_e,
+            A_e=A_e,
+            A_v=A_n - A_e,
         )
-        self.lam_e = float(self.d_o / self.t * (self.f_y / 250))
+
+    @classmethod
+    def interned(cls, **kwargs) -> RingComponent:
+        """returns a shared RingComponent for the given attributes"""
+        return interned(cls, **kwargs)
+
+
+# ----------------
+# Vectorized slenderness
+# ----------------
+# element codes used to index PLATE_LIMITS and RING_LIMITS
+EDGE_SUPPORT_CODES = {"One": 0, "Both": 1}
+LOAD_TYPE_CODES = {"UniformComp": 0, "CompToTens": 1}
+RES_STRESS_CODES = {"SR": 0, "HR": 1, "LW": 2, "CF": 3, "HW": 4}
+
+
+def _limits_array(limit_fn, shape: tuple, n_values: int, args) -> np.ndarray:
+    """tabulates a slenderness limit function by code (nan where undefined)"""
+    limits = np.full(shape + (n_values,), np.nan)
+    for index, arg in args:
+        try:
+            limits[index] = limit_fn(*arg)
+        except UnboundLocalError:
+            pass
+    return limits
+
+
+# AS4100 Table 5.2 and 6.2.4 [edge support, load type, residual stress] ->
+# (lam_ep, lam_ey, lam_ed)
+PLATE_LIMITS = _limits_array(
+    plate_element_slenderness_limit,
+    (len(EDGE_SUPPORT_CODES), len(LOAD_TYPE_CODES), len(RES_STRESS_CODES)),
+    3,
+    [
+        ((i, j, k), (e, l, r))
+        for e, i in EDGE_SUPPORT_CODES.items()
+        for l, j in LOAD_TYPE_CODES.items()
+        for r, k in RES_STRESS_CODES.items()
+    ],
+)
+# AS4100 Table 5.2 [residual stress] -> (lam_ep, lam_ey, lam_eyc, lam_ed)
+RING_LIMITS = _limits_array(
+    ring_element_slenderness_limit,
+    (len(RES_STRESS_CODES),),
+    4,
+    [((k,), (r,)) for r, k in RES_STRESS_CODES.items()],
+)
+
+
+def _codes(values, codes: dict) -> np.ndarray:
+    """integer codes of an array of strings"""
+    values = np.asarray(values, dtype=object)
+    out = np.full(values.shape, -1)
+    for k, v in codes.items():
+        out[values == k] = v
+    if np.any(out < 0):
+        raise ValueError(
+            f"unknown value {values[out < 0][0]}, expected one of {list(codes)}"
+        )
+    return out
+
+
+def _min(x, y):
+    """elementwise min(x, y) with the Python builtin's nan handling"""
+    return np.where(y < x, y, x)
+
+
+@dataclass(kw_only=True)
+class PlateComponentArrays:
+    """
+    PlateComponent for arrays of plate elements, with edge_sup, load_type and res_stress
+    given as EDGE_SUPPORT_CODES, LOAD_TYPE_CODES and RES_STRESS_CODES arrays
+    """
+
+    b: np.ndarray
+    t: np.ndarray
+    f_y: np.ndarray
+    edge_sup: np.ndarray
+    res_stress: np.ndarray
+    load_type: np.ndarray
+
+    lam_ey: np.ndarray = field(init=False)
+    lam_ep: np.ndarray = field(init=False)
+    lam_e: np.ndarray = field(init=False)
+    lam_e_ratio: np.ndarray = field(init=False)
+
+    b_e: np.ndarray = field(init=False)
+    A_v: np.ndarray = field(init=False)
+    A_e: np.ndarray = field(init=False)
+
+    def __post_init__(self):
+        limits = PLATE_LIMITS[self.edge_sup, self.load_type, self.res_stress]
+        self.lam_ep, self.lam_ey = limits[..., 0], limits[..., 1]
+        self.lam_e = self.b / self.t * (self.f_y / 250) ** 0.5
         self.lam_e_ratio = self.lam_e / self.lam_ey
 
         # AS4100 Cl 6.2.4
-        self.d_e = self.d_o * min(
-            1, (self.lam_eyc / self.lam_e) ** 0.5, (3 * self.lam_eyc / self.lam_e) ** 2
+        self.b_e = _min(1, self.lam_ey / self.lam_e) * self.b
+        self.A_e = self.b_e * self.t
+        self.A_v = (self.b - self.b_e) * self.t
+
+
+@dataclass(kw_only=True)
+class RingComponentArrays:
+    """RingComponent for arrays of chs elements, with res_stress as RES_STRESS_CODES"""
+
+    d_o: np.ndarray
+    t: np.ndarray
+    f_y: np.ndarray
+    res_stress: np.ndarray
+
+    lam_ey: np.ndarray = field(init=False)
+    lam_eyc: np.ndarray = field(init=False)
+    lam_ep: np.ndarray = field(init=False)
+    lam_e: np.ndarray = field(init=False)
+    lam_e_ratio: np.ndarray = field(init=False)
+
+    d_e: np.ndarray = field(init=False)
+    A_v: np.ndarray = field(init=False)
+    A_e: np.ndarray = field(init=False)
+
+    def __post_init__(self):
+        limits = RING_LIMITS[self.res_stress]
+        self.lam_ep, self.lam_ey, self.lam_eyc = limits.T[:3]
+        self.lam_e = self.d_o / self.t * (self.f_y / 250)
+        self.lam_e_ratio = self.lam_e / self.lam_ey
+
+        # AS4100 Cl 6.2.4
+        self.d_e = self.d_o * _min(
+            _min(1, (self.lam_eyc / self.lam_e) ** 0.5),
+            (3 * self.lam_eyc / self.lam_e) ** 2,
         )
 
-        # NOTE: unsure if this is the correct effective area calculation
         r_o = self.d_o / 2
         r_i = r_o - self.t
         A_n = pi * (r_o + r_i) * (r_o - r_i)
@@ -773,6 +930,242 @@ class RingComponent:
         self.A_v = A_n - self.A_e
 
 
+# plate elements of each section family, as (width, thickness, edge support, load type)
+# for major axis bending (x), minor axis bending (y) and compression (c, with the
+# number of elements), in the order of the *_section_components functions
+_I_FLANGE = ("b_ff", "t_f", "One", "UniformComp")
+_I_WEB = ("d_1", "t_w", "Both", "UniformComp")
+_HOLLOW_FLANGE = ("b_ff", "t", "Both", "UniformComp")
+_HOLLOW_WEB = ("d_1", "t", "Both", "UniformComp")
+SECTION_PLATE_COMPONENTS = {
+    "I": {
+        "x": [_I_FLANGE, ("d_1", "t_w", "Both", "CompToTens")],
+        "y": [("b_ff", "t_f", "One", "CompToTens")],
+        "c": [(_I_WEB, 1), (_I_FLANGE, 4)],
+    },
+    "C": {
+        "x": [_I_FLANGE, ("d_1", "t_w", "Both", "CompToTens")],
+        "y": [("b_ff", "t_f", "One", "CompToTens")],
+        "c": [(_I_WEB, 1), (_I_FLANGE, 2)],
+    },
+    "T": {
+        "x": [("d_1", "t_w", "One", "CompToTens")],
+        "y": [("b_ff", "t_f", "One", "CompToTens")],
+        "c": [(("d_1", "t_w", "One", "UniformComp"), 1), (_I_FLANGE, 2)],
+    },
+    "RHS": {
+        "x": [_HOLLOW_FLANGE, ("d_1", "t", "Both", "CompToTens")],
+        "y": [("b_ff", "t", "Both", "CompToTens"), _HOLLOW_WEB],
+        "c": [(_HOLLOW_WEB, 2), (_HOLLOW_FLANGE, 2)],
+    },
+    "RectPlate": {"x": [], "y": [], "c": []},
+}
+SECTION_FAMILIES = {
+    "UB": "I",
+    "UC": "I",
+    "WB": "I",
+    "WC": "I",
+    "PFC": "C",
+    "TFB": "C",
+    "SHS": "RHS",
+    "RHS": "RHS",
+    "CHS": "CHS",
+    "BT": "T",
+    "CT": "T",
+    "RectPlate": "RectPlate",
+}
+
+
+def solve_slenderness_arrays(columns: dict) -> dict[str, np.ndarray]:
+    """
+    Solves SteelSlenderness for N sections at once, with the plate elements of each
+    section type represented as PlateComponentArrays/RingComponentArrays.
+
+    Args:
+        columns: dict of arrays with sec_type, the SectionGeometry attributes (d, b, t_f,
+            t_w, t, d_1, d_p, b_ff, A_g, I_x, I_y, S_x, S_y, Z_x, Z_y) and the
+            SteelMaterial attributes f_y, f_yw and res_stress.
+
+    Returns:
+        dict of arrays for compact_x, compact_y, lam_s_x, lam_sp_x, lam_sy_x, lam_s_y,
+        lam_sp_y, lam_sy_y, Z_ex, Z_ey, k_f, A_e, alpha_b, web_shear_yield_governs and
+        alpha_v, equal to the SteelSlenderness attributes of each section.
+    """
+    sec_types = np.asarray(columns["sec_type"], dtype=object)
+    n = len(sec_types)
+    lam = {
+        k: np.zeros(n)
+        for k in ["lam_s_x", "lam_sp_x", "lam_sy_x", "lam_s_y", "lam_sp_y", "lam_sy_y"]
+    }
+    slender_type_x = np.ones(n, dtype=int)
+    A_e = np.asarray(columns["A_g"], dtype=float).copy()
+
+    for family in dict.fromkeys(SECTION_FAMILIES.get(st) for st in sec_types):
+        if family is None:
+            unknown = [st for st in sec_types if st not in SECTION_FAMILIES]
+            raise NotImplementedError(f"section type {unknown[0]} not available")
+        rows = np.flatnonzero(
+            np.isin(sec_types, [k for k, v in SECTION_FAMILIES.items() if v == family])
+        )
+        v = {k: np.asarray(columns[k], dtype=float)[rows] for k in _COMPONENT_KEYS}
+        res_stress = _codes(np.asarray(columns["res_stress"])[rows], RES_STRESS_CODES)
+
+        if family == "CHS":
+            ring = RingComponentArrays(
+                d_o=v["d"], t=v["t"], f_y=v["f_y"], res_stress=res_stress
+            )
+            components = {"x": [ring], "y": [ring]}
+            A_e[rows] -= ring.A_v
+        else:
+            spec = SECTION_PLATE_COMPONENTS[family]
+
+            def plate(b, t, edge_sup, load_type):
+                return PlateComponentArrays(
+                    b=v[b],
+                    t=v[t],
+                    f_y=v["f_y"],
+                    edge_sup=EDGE_SUPPORT_CODES[edge_sup],
+                    load_type=LOAD_TYPE_CODES[load_type],
+                    res_stress=res_stress,
+                )
+
+            components = {axis: [plate(*c) for c in spec[axis]] for axis in "xy"}
+            for c, count in spec["c"]:
+                A_v = plate(*c).A_v
+                for _ in range(count):
+                    A_e[rows] -= A_v
+
+        # AS4100 Cl 5.2.2, lam_sp and lam_sy are the values of the element with the
+        # greatest lam_e / lam_ey (the first, for equal ratios)
+        for axis in "xy":
+            if not components[axis]:
+                continue
+            ratio = np.stack([p.lam_e_ratio for p in components[axis]], axis=1)
+            ratio = np.where(ratio > 0, ratio, -np.inf)
+            found = np.isfinite(ratio.max(axis=1))
+            i = np.argmax(ratio, axis=1)[found]
+            for k_s, k_e in [("s", "e"), ("sp", "ep"), ("sy", "ey")]:
+                values = np.stack(
+                    [getattr(p, f"lam_{k_e}") for p in components[axis]], axis=1
+                )
+                lam[f"lam_{k_s}_{axis}"][rows[found]] = values[found, i]
+            if axis == "x" and family == "CHS":
+                slender_type_x[rows[found]] = 3
+            elif axis == "x":
+                type_2 = [
+                    edge_sup == "One" and load_type == "CompToTens"
+                    for _, _, edge_sup, load_type in SECTION_PLATE_COMPONENTS[family][
+                        "x"
+                    ]
+                ]
+                slender_type_x[rows[found]] = np.where(np.array(type_2)[i], 2, 1)
+
+    geom = {k: np.asarray(columns[k], dtype=float) for k in _SECTION_KEYS}
+    f_y = np.asarray(columns["f_y"], dtype=float)
+    hollow = np.isin(sec_types, ["RHS", "SHS"])
+    out = {}
+
+    # AS4100 Cl 5.2.3 - 5.2.5
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for axis, other in [("x", "y"), ("y", "x")]:
+            lam_s, lam_sp, lam_sy = (
+                lam[f"lam_s_{axis}"],
+                lam[f"lam_sp_{axis}"],
+                lam[f"lam_sy_{axis}"],
+            )
+            Z, S = geom[f"Z_{axis}"], geom[f"S_{axis}"]
+            Z_compact = _min(S, 1.5 * Z)
+            Z_noncompact = Z + (lam_sy - lam_s) / (lam_sy - lam_sp) * (Z_compact - Z)
+            # slender RHS and SHS, BS 5950-1 3.6.2.2
+            d, b, t, A = geom["d"], geom["b"], geom["t"], geom["A_g"]
+            if axis == "y":
+                d, b = b, d
+            eps = (275 / f_y) ** 0.5
+            k = b - 35 * t * eps - 5 * t
+            y_eff = (A * d - k * t**2) / (2 * (A - k * t))
+            A_eff = A - k * t
+            I_e = (
+                geom[f"I_{axis}"]
+                - k * t**3 / 12
+                - k * t * (d / 2 - t / 2) ** 2
+                - A_eff * (y_eff - d / 2) ** 2
+            )
+            Z_slender = np.where(hollow, I_e / y_eff, Z * lam_sy / lam_s)
+            if axis == "x":
+                Z_slender = np.select(
+                    [slender_type_x == 1, slender_type_x == 2],
+                    [Z_slender, Z * (lam_sy / lam_s) ** 2],
+                    np.nan,
+                )
+            compact = lam_s <= lam_sp
+            noncompact = ~compact & (lam_s <= lam_sy)
+            out[f"compact_{axis}"] = np.where(
+                compact, "C", np.where(noncompact, "N", "S")
+            ).astype(object)
+            out[f"Z_e{axis}"] = np.select(
+                [compact, noncompact], [Z_compact, Z_noncompact], Z_slender
+            )
+        out.update(lam)
+
+        out["A_e"] = A_e
+        out["k_f"] = out["A_e"] / geom["A_g"]
+        out["alpha_b"] = member_section_constants(sec_types, out["k_f"], geom["t_f"])
+
+        # AS4100 Cl 5.11.2 and 5.11.5.1
+        f_yw = np.asarray(columns.get("f_yw", f_y), dtype=float)
+        ratio = (82 / (f_yw / 250) ** 0.5) / (geom["d_p"] / geom["t_w"])
+        out["web_shear_yield_governs"] = ~(ratio <= 1)
+        out["alpha_v"] = _min(ratio**2, 1)
+    return out
+
+
+# SectionGeometry attributes of the plate elements and of the section
+_COMPONENT_KEYS = ["b_ff", "d_1", "t_f", "t_w", "t", "d", "f_y"]
+_SECTION_KEYS = [
+    "d",
+    "b",
+    "t",
+    "t_f",
+    "t_w",
+    "d_p",
+    "A_g",
+    "I_x",
+    "I_y",
+    "S_x",
+    "S_y",
+    "Z_x",
+    "Z_y",
+]
+
+
+def member_section_constants(sec_types, k_f, t_f) -> np.ndarray:
+    """SteelSlenderness._member_section_constant for arrays, AS4100 Table 6.3.3"""
+    sec_types = np.asarray(sec_types, dtype=object)
+    thin = t_f <= 40
+    # T6.3.3(B), k_f < 1
+    a_B = np.select(
+        [
+            np.isin(sec_types, ["SHS", "RHS", "CHS"]),
+            np.isin(sec_types, ["UB", "UC"]),
+            np.isin(sec_types, ["WB", "WC"]),
+        ],
+        [-0.5, np.where(thin, 0, 0.5), np.where(thin, 0.5, 1.0)],
+        1.0,
+    )
+    # T6.3.3(A), k_f = 1
+    a_A = np.select(
+        [
+            np.isin(sec_types, ["SHS", "RHS", "CHS"]),
+            np.isin(sec_types, ["UB", "UC", "TFB"]),
+            np.isin(sec_types, ["PFC", "BT", "CT"]),
+            np.isin(sec_types, ["WB", "WC"]),
+        ],
+        [-1.0, np.where(thin, 0, 1.0), 0.5, 0.0],
+        0.5,
+    )
+    return np.where(k_f < 1, a_B, a_A)
+
+
 def main():
     from pathlib import Path
     import pandas as pd
@@ -0,0 +1,369 @@
+"""
+Columnar section catalogs.
+
+A SectionTable holds the geometry, material and slenderness properties of N sections as
+contiguous NumPy columns, for whole-catalog calculations that would otherwise construct a
+SectionGeometry, SteelMaterial and SteelSlenderness object (and their plate components)
+per section. Rows can be handed out as lightweight SectionRow views that provide the
+SteelSection attributes used by SteelMember.
+
+Classes:
+    SectionTable: Geometry, material and slenderness columns for a catalog of sections.
+    SectionRow: A single-row view of a SectionTable that quacks like SteelSection.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+import numpy as np
+
+from steelas.data.io import MemberLibrary, import_section_library
+from steelas.data.precision import round_frame
+from steelas.member.geometry import (
+    solve_shapes,
+    DIMENSION_KEYS,
+    PROPERTY_KEYS,
+    DERIVED_KEYS,
+)
+from steelas.member.material import (
+    SteelMaterial,
+    residual_stress_type,
+    tensile_strength,
+    yield_stress,
+)
+from steelas.member.slenderness import solve_slenderness_arrays
+from steelas.profiling import instrumented
+
+NAME_KEYS = ["name", "section", "sec_type", "mat_type", "grade"]
+SOLVED_GEOMETRY_KEYS = DIMENSION_KEYS + PROPERTY_KEYS
+GEOMETRY_KEYS = SOLVED_GEOMETRY_KEYS + DERIVED_KEYS
+MATERIAL_KEYS = ["f_y", "f_yw", "f_u", "res_stress"]
+SLENDERNESS_KEYS = [
+    "compact_x",
+    "compact_y",
+    "Z_ex",
+    "Z_ey",
+    "k_f",
+    "A_e",
+    "alpha_b",
+    "web_shear_yield_governs",
+    "alpha_v",
+]
+# material constants shared by all steel grades
+MATERIAL_CONSTANTS = {
+    k: getattr(SteelMaterial(), k) for k in ["density", "E", "G", "v", "alpha_T"]
+}
+
+
+@dataclass
+class SectionTable:
+    """
+    Geometry, material and slenderness properties for N sections, stored as columns.
+
+    Attributes:
+        columns (dict[str, np.ndarray]): One array of length N per property. String
+            attributes (name, sec_type, grade, res_stress, compact_x, ...) are object
+            arrays; all other attributes are float or bool arrays. Values are not rounded
+            to significant figures. The 'mass' column is the mass per unit length (kg/m).
+    """
+
+    columns: dict[str, np.ndarray]
+
+    # indexes for query(), built on first use of each column: sorted (range queries) and
+    # grouped by value (value queries on string columns)
+    _sorted: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _groups: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __len__(self) -> int:
+        return len(self.columns["sec_type"])
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        return self.columns[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.columns
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.row(i)
+
+    def row(self, i: int) -> SectionRow:
+        """returns a SteelSection-like view of row i"""
+        return SectionRow(self, i)
+
+    def index_of(self, name: str) -> int:
+        """returns the row number of the section with the given name"""
+        rows = np.flatnonzero(self.columns["name"] == name)
+        if len(rows) > 1:
+            raise ValueError(f"Error: non-unique name: {name}")
+        if len(rows) == 0:
+            raise ValueError(f"Error: no sections with name equal to {name}")
+        return int(rows[0])
+
+    def take(self, rows) -> SectionTable:
+        """returns a new table with the selected rows (index array or boolean mask)"""
+        return SectionTable({k: v[rows] for k, v in self.columns.items()})
+
+    def query(self, **criteria) -> np.ndarray:
+        """
+        returns the row numbers of the sections matching all criteria, in order of mass
+        (lightest first), e.g. table.query(sec_type=["UB", "UC"], Z_ex=(1.2e6, None),
+        mass=(None, 80)). Each criterion is a column name with:
+
+            (lo, hi): lo <= value <= hi, where None is an open bound;
+            a list of values: value is one of them;
+            a single value: value equal to it.
+
+        Criteria equal to None are ignored. Use table.take(rows) for a sub-table.
+        """
+        mask = None
+        for key, value in criteria.items():
+            if value is None:
+                continue
+            if isinstance(value, tuple):
+                rows = self._range_rows(key, *value)
+            else:
+                values = value if isinstance(value, list) else [value]
+                rows = self._value_rows(key, values)
+            selected = np.zeros(len(self), dtype=bool)
+            selected[rows] = True
+            mask = selected if mask is None else mask & selected
+        order = self._index("mass")[0]
+        return order if mask is None else order[mask[order]]
+
+    def _index(self, key: str) -> tuple[np.ndarray, np.ndarray]:
+        """(row order, sorted values) of a numeric column, NaN last"""
+        if key not in self._sorted:
+            order = np.argsort(self.columns[key], kind="stable")
+            self._sorted[key] = (order, np.asarray(self.columns[key])[order])
+        return self._sorted[key]
+
+    def _range_rows(self, key: str, lo=None, hi=None) -> np.ndarray:
+        order, values = self._index(key)
+        start = 0 if lo is None else np.searchsorted(values, lo, side="left")
+        stop = np.searchsorted(values, np.inf if hi is None else hi, side="right")
+        return order[start:stop]
+
+    def _value_rows(self, key: str, values: list) -> np.ndarray:
+        """rows whose column value is one of values (string columns are grouped)"""
+        if len(values) == 0:
+            return np.zeros(0, dtype=int)
+        if self.columns[key].dtype != object:
+            return np.concatenate([self._range_rows(key, v, v) for v in values])
+        if key not in self._groups:
+            groups = {}
+            for i, v in enumerate(self.columns[key].tolist()):
+                groups.setdefault(v, []).append(i)
+            self._groups[key] = {k: np.array(v) for k, v in groups.items()}
+        groups = self._groups[key]
+        return np.concatenate([groups.get(v, np.zeros(0, dtype=int)) for v in values])
+
+    def to_frame(self, sig_figs: int | None = None):
+        """returns the table as a pandas DataFrame, optionally rounded to sig_figs"""
+        import pandas as pd
+
+        return round_frame(pd.DataFrame(self.columns), sig_figs)
+
+    @classmethod
+    def from_library(
+        cls, library: MemberLibrary | str, compiled: bool = True
+    ) -> SectionTable:
+        """
+        builds a table from a section library, e.g. MemberLibrary.OpenSections. With
+        compiled=True the table is memory-mapped from the compiled library (see
+        steelas.data.compile), which is built first if missing or out of date.
+        """
+        if compiled:
+            from steelas.data.compile import load_compiled
+
+            table = load_compiled(library)
+            if table is not None:
+                return table
+        return cls.from_frame(import_section_library(library))
+
+    @classmethod
+    @instrumented("SectionTable.from_frame")
+    def from_frame(cls, sections) -> SectionTable:
+        """
+        builds a table from a DataFrame (or dict of arrays) with section library columns:
+        name, section, sec_type, mat_type, grade and the section dimensions.
+        """
+        n = len(sections["sec_type"])
+        columns = {}
+        for k in NAME_KEYS:
+            if k in sections:
+                columns[k] = np.asarray(sections[k], dtype=object)
+            else:
+                columns[k] = np.full(n, "", dtype=object)
+
+        geom = solve_shapes(sections)
+        for k in GEOMETRY_KEYS:
+            columns[k] = geom[k]
+
+        columns.update(_solve_materials(columns))
+        columns.update(_solve_slenderness(columns))
+        # mass per unit length, kg/m
+        columns["mass"] = columns["A_g"] * MATERIAL_CONSTANTS["density"] / 1e6
+        return cls(columns)
+
+
+class SectionRow:
+    """
+    A view of one SectionTable row providing the SteelSection interface used by
+    SteelMember, e.g. SteelMember(section=table.row(i)). The geom, mat and slenderness
+    attributes are simple namespaces of the row values, built on first access.
+    """
+
+    __slots__ = ("table", "i", "_geom", "_mat", "_slenderness")
+
+    def __init__(self, table: SectionTable, i: int):
+        self.table = table
+        self.i = i
+        self._geom = None
+        self._mat = None
+        self._slenderness = None
+
+    def __repr__(self) -> str:
+        return f"SectionRow({self.name!r})"
+
+    def _value(self, key: str):
+        return self.table.columns[key].item(self.i)
+
+    def _namespace(self, keys: list[str]) -> SimpleNamespace:
+        return SimpleNamespace(**{k: self._value(k) for k in keys})
+
+    @property
+    def geom(self) -> SimpleNamespace:
+        if self._geom is None:
+            self._geom = self._namespace(
+                ["name", "section", "sec_type"] + GEOMETRY_KEYS
+            )
+        return self._geom
+
+    @property
+    def mat(self) -> SimpleNamespace:
+        if self._mat is None:
+            self._mat = self._namespace(
+                ["name", "grade", "mat_type"] + MATERIAL_KEYS + ["t", "t_f", "t_w"]
+            )
+            self._mat.__dict__.update(MATERIAL_CONSTANTS)
+        return self._mat
+
+    @property
+    def slenderness(self) -> SimpleNamespace:
+        if self._slenderness is None:
+            self._slenderness = self._namespace(
+                ["name", "section", "grade"] + SLENDERNESS_KEYS
+            )
+        return self._slenderness
+
+    def to_section(self):
+        """materializes the row as a SteelSection (e.g. for FeaturedMember coping)"""
+        from steelas.member.member import SteelSection
+
+        section_dict = {k: self._value(k) for k in NAME_KEYS + DIMENSION_KEYS}
+        return SteelSection.from_section_dict(section_dict)
+
+    # ----------------
+    # SteelSection Attrs
+    # ----------------
+    @property
+    def name(self):
+        return self._value("name")
+
+    @property
+    def sec_type(self):
+        return self._value("sec_type")
+
+    @property
+    def A_g(self):
+        return self._value("A_g")
+
+    @property
+    def A_n(self):
+        return self._value("A_g")
+
+    @property
+    def A_w(self):
+        return self._value("A_w")
+
+    @property
+    def r_x(self):
+        return self._value("r_x")
+
+    @property
+    def r_y(self):
+        return self._value("r_y")
+
+    @property
+    def f_u(self):
+        return self._value("f_u")
+
+    @property
+    def f_y(self):
+        return self._value("f_y")
+
+    @property
+    def f_yw(self):
+        return self._value("f_yw")
+
+    @property
+    def section_name(self):
+        return self._value("section")
+
+    @property
+    def material_name(self):
+        return self._value("grade")
+
+    @property
+    def Z_ex(self):
+        return self._value("Z_ex")
+
+    @property
+    def Z_ey(self):
+        return self._value("Z_ey")
+
+    @property
+    def k_f(self):
+        return self._value("k_f")
+
+    @property
+    def alpha_b(self):
+        return self._value("alpha_b")
+
+    @property
+    def web_shear_yield_governs(self):
+        return self._value("web_shear_yield_governs")
+
+    @property
+    def alpha_v(self):
+        return self._value("alpha_v")
+
+    @property
+    def shear_stress_uniformity(self):
+        return self._value("shear_stress_uniformity")
+
+
+def _solve_materials(columns: dict) -> dict:
+    """material columns f_y, f_yw, f_u and res_stress, as per SteelMaterial.solve_mat"""
+    mat_type, grade = columns["mat_type"], columns["grade"]
+    # f_y from the flange thickness of open sections, otherwise the plate thickness
+    t = np.where(np.isnan(columns["t_f"]), columns["t"], columns["t_f"])
+    # 0 (the SteelMaterial default) where there is no thickness, nan where t is outside
+    # the Table 2.1 range (SteelMaterial raises)
+    f_y = np.where(np.isnan(t), 0.0, yield_stress(mat_type, grade, t))
+    # f_yw only for open sections, nan for closed sections (no t_w)
+    t_w = columns["t_w"]
+    f_yw = np.where(np.isnan(t_w), np.nan, yield_stress(mat_type, grade, t_w))
+    f_u = tensile_strength(mat_type, grade, t)
+    res_stress = np.empty(len(mat_type), dtype=object)
+    for m in set(mat_type):
+        res_stress[mat_type == m] = residual_stress_type(m)
+    return {"f_y": f_y, "f_yw": f_yw, "f_u": f_u, "res_stress": res_stress}
+
+
+def _solve_slenderness(columns: dict) -> dict:
+    """slenderness columns, as per SteelSlenderness"""
+    out = solve_slenderness_arrays(columns)
+    return {k: out[k] for k in SLENDERNESS_KEYS}
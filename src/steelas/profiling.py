@@ -0,0 +1,159 @@
+"""
+Opt-in profiling of the calculation pipeline.
+
+The main stages of the object model (library import, geometry solving, slenderness,
+member capacities, coping and connection checks) are decorated with instrumented(). While
+a profile is active, each call of an instrumented stage is counted and timed; otherwise
+the decorator only checks whether a profile is active and calls the stage.
+
+    with steelas.profile() as p:
+        run_connection_schedule()
+    print(p)            # or p.report(), p.to_frame()
+
+Stage times are inclusive (total) and exclusive (self, i.e. less the time spent in
+nested instrumented stages, e.g. SteelMember.__post_init__ within FeaturedMember._cope_me).
+A profile records only the thread that started it (profiling state is thread-local), and
+only that process: stages run in other threads or in steelas.batch worker processes are
+not recorded.
+
+Classes:
+    Profile: Call counts and times per stage, recorded while active.
+
+Functions:
+    profile(): Returns a new Profile, for use as a context manager.
+    instrumented(): Decorates a pipeline stage for profiling.
+"""
+
+from __future__ import annotations
+
+from functools import wraps
+import threading
+import time
+
+# per thread: the profiles recording calls (active, innermost last), and the time spent
+# in nested stages for each running instrumented call (nested)
+_local = threading.local()
+
+
+def _active() -> list[Profile]:
+    try:
+        return _local.active
+    except AttributeError:
+        _local.active, _local.nested = [], []
+        return _local.active
+
+
+class Profile:
+    """
+    Call counts and cumulative times of the instrumented stages, recorded while the
+    profile is active (within its with block, or between start() and stop()).
+
+    Attributes:
+        stages (dict[str, list]): stage name -> [calls, total time, self time], in
+            order of first call. Times are in seconds.
+        wall_time (float): Elapsed time while active (s).
+    """
+
+    def __init__(self):
+        self.stages: dict[str, list] = {}
+        self.wall_time = 0.0
+        self._t0 = None
+        self._thread = None
+
+    def __enter__(self) -> Profile:
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def start(self) -> Profile:
+        if self._t0 is not None:
+            raise RuntimeError("profile is already active")
+        _active().append(self)
+        self._thread = threading.get_ident()
+        self._t0 = time.perf_counter()
+        return self
+
+    def stop(self) -> Profile:
+        if self._t0 is None:
+            raise RuntimeError("profile is not active")
+        if self._thread != threading.get_ident():
+            raise RuntimeError("profile must be stopped by the thread that started it")
+        self.wall_time += time.perf_counter() - self._t0
+        self._t0 = None
+        _active().remove(self)
+        return self
+
+    def _record(self, stage: str, total: float, own: float) -> None:
+        s = self.stages.get(stage)
+        if s is None:
+            self.stages[stage] = [1, total, own]
+        else:
+            s[0] += 1
+            s[1] += total
+            s[2] += own
+
+    def report(self) -> dict[str, dict]:
+        """stage -> calls, total time, self time and mean time per call (s)"""
+        return {
+            k: {"calls": n, "time": t, "self_time": t_self, "per_call": t / n}
+            for k, (n, t, t_self) in self.stages.items()
+        }
+
+    def to_frame(self):
+        """returns the report as a pandas DataFrame, by descending self time"""
+        import pandas as pd
+
+        df = pd.DataFrame.from_dict(
+            self.report(),
+            orient="index",
+            columns=["calls", "time", "self_time", "per_call"],
+        )
+        df.index.name = "stage"
+        return df.sort_values("self_time", ascending=False)
+
+    def __str__(self) -> str:
+        rows = sorted(self.report().items(), key=lambda r: -r[1]["self_time"])
+        width = max([len(k) for k, _ in rows] + [5])
+        lines = [f"{'stage':{width}}  {'calls':>8}  {'time (s)':>9}  {'self (s)':>9}"]
+        for k, r in rows:
+            lines.append(
+                f"{k:{width}}  {r['calls']:>8}  {r['time']:>9.4f}  {r['self_time']:>9.4f}"
+            )
+        lines.append(f"wall time {self.wall_time:.4f} s")
+        return "\n".join(lines)
+
+
+def profile() -> Profile:
+    """returns a new profile, for use as a context manager: with profile() as p: ..."""
+    return Profile()
+
+
+def instrumented(stage: str):
+    """
+    decorates a pipeline stage, recording its calls under stage name while a profile is
+    active
+    """
+
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            active = _active()
+            if not active:
+                return fn(*args, **kwargs)
+            nested = _local.nested
+            nested.append(0.0)
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                total = time.perf_counter() - t0
+                own = total - nested.pop()
+                if nested:
+                    nested[-1] += total
+                for p in active:
+                    p._record(stage, total, own)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,30 @@
+"""
+Helpers that let the shape functions evaluate either a single section (float attributes)
+or a whole catalog of sections at once (NumPy array attributes).
+
+Scalar inputs take the plain Python path so that single-section results are unchanged.
+"""
+
+import math
+import numpy as np
+
+
+def nan_to_zero(x):
+    """returns 0 where x is nan (e.g. a missing root radius)"""
+    if isinstance(x, np.ndarray):
+        return np.where(np.isnan(x), 0.0, x)
+    return 0 if math.isnan(x) else x
+
+
+def where(condition, x, y):
+    """elementwise x if condition else y"""
+    if isinstance(condition, np.ndarray):
+        return np.where(condition, x, y)
+    return x if condition else y
+
+
+def round_to(x, decimals: int):
+    """round(x, decimals), elementwise for arrays"""
+    if isinstance(x, np.ndarray):
+        return np.round(x, decimals)
+    return round(x, decimals)
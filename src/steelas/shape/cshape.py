@@ -1,6 +1,8 @@
 
 import math
 
+from steelas.shape.arrays import where
+
 def x_c(params: dict) -> float:
     '''centroid distance from left-hand side'''
     b_w=params.d-2*params.t_f
@@ -10,10 +12,9 @@ def x_c(params: dict) -> float:
 
 def x_pna(params:dict) -> float:
     '''plastic neutral axis distance from left-hand side'''
-    if params.t_w < A_g(params)/(2*params.d):
-        x= params.b-A_g(params)/(4*params.t_f)
-    else:
-        x=A_g(params)/(2*params.d)
+    x = where(params.t_w < A_g(params)/(2*params.d),
+              params.b-A_g(params)/(4*params.t_f),
+              A_g(params)/(2*params.d))
     return x
 
 def A_g(params: dict) -> float:
@@ -51,21 +52,19 @@ def S_y(params: dict) -> float:
     b_w=params.d-2*params.t_f
     #NOTE -> plastic neutral axis, not centroid
     x_cur = x_pna(params)
-    if x_cur>params.t_w:
+    S_y = where(x_cur>params.t_w,
         #https://calcresource.com/cross-section-channel.html
         #NOTE: neglects corner fillets
-        S_y = params.t_f * b_f**2/2 + params.b * params.d * params.t_w/2 - params.d**2 * params.t_w**2/8/params.t_f 
-    else:
-        S_y = 1/(4*params.d)*(4*params.t_f*params.b**2*(params.d-params.t_f)+params.t_w**2*(params.d**2-4*params.t_f**2)-4*params.b*params.t_f*b_w*params.t_w)
+        params.t_f * b_f**2/2 + params.b * params.d * params.t_w/2 - params.d**2 * params.t_w**2/8/params.t_f,
+        1/(4*params.d)*(4*params.t_f*params.b**2*(params.d-params.t_f)+params.t_w**2*(params.d**2-4*params.t_f**2)-4*params.b*params.t_f*b_w*params.t_w))
     
     #add fillet material
     x_rad = (1-0.776)*params.r_1 
-    if x_cur > (params.t_w +x_rad):
-        x_fillet = (x_cur-params.t_w-x_rad)
+    x_fillet = where(x_cur > (params.t_w +x_rad),
+        (x_cur-params.t_w-x_rad),
     #elif x_cur > params.t_w:
     #    x_fillet = 0
-    else:
-        x_fillet = (params.t_w-x_cur)+x_rad
+        (params.t_w-x_cur)+x_rad)
     
     S_y_extra = 2*  (1-math.pi/4)*params.r_1**2 *x_fillet
     S_y = S_y + S_y_extra
@@ -1,9 +1,11 @@
 import math
 
+from steelas.shape.arrays import nan_to_zero
+
 def A_g(params: dict) -> float:
     '''Gross area'''
     b_w=(params.d-2*params.t_f)
-    r_1 = 0 if math.isnan(params.r_1) else params.r_1
+    r_1 = nan_to_zero(params.r_1)
     A_g = 2*params.b*params.t_f + params.t_w*b_w+ 4*(1-math.pi/4)*r_1**2
     return A_g
     #return math.pi*((params.d/2)**2 - ((params.d/2)-params.t)**2)   
@@ -11,7 +13,7 @@ def A_g(params: dict) -> float:
 def I_x(params: dict) -> float:
     '''Moment of inertia - major axis'''
     b_w=(params.d-2*params.t_f)
-    r_1 = 0 if math.isnan(params.r_1) else params.r_1
+    r_1 = nan_to_zero(params.r_1)
     I_x =2*(params.b*params.t_f**3/12+params.b*params.t_f*((params.d-params.t_f)/2)**2)+params.t_w*b_w**3/12+ 4*(0.01825*r_1**4 + (1-math.pi/4)*r_1**2*(0.776*r_1 - r_1 +params.d/2 - params.t_f)**2)
     return I_x
     #return math.pi/64 * (params.d**4 - (params.d-2*params.t)**4)
@@ -19,7 +21,7 @@ def I_x(params: dict) -> float:
 def I_y(params: dict) -> float:
     '''Moment of inertia - minor axis'''
     b_w=(params.d-2*params.t_f)
-    r_1 = 0 if math.isnan(params.r_1) else params.r_1
+    r_1 = nan_to_zero(params.r_1)
     I_y =b_w*params.t_w**3/12+2*(params.t_f*params.b**3/12)+4*(0.01825*r_1**4 + (1-math.pi/4)*r_1**2*(r_1-0.776*r_1 + params.t_w/2)**2)
     return I_y
     #return I_x(params)
@@ -27,14 +29,14 @@ def I_y(params: dict) -> float:
 def S_x(params: dict) -> float:
     '''Plastic section modulus - major axis'''
     b_w=(params.d-2*params.t_f)
-    r_1 = 0 if math.isnan(params.r_1) else params.r_1
+    r_1 = nan_to_zero(params.r_1)
     S_x =2*(params.t_w*(b_w/2)**2/2 + params.t_f*params.b*(params.d-params.t_f)/2) + 4*  (1-math.pi/4)*r_1**2*(0.776*r_1 - r_1 +params.d/2 - params.t_f)
     return S_x
 
 def S_y(params: dict) -> float:
     '''Plastic section modulus - minor axis'''
     b_w=(params.d-2*params.t_f)
-    r_1 = 0 if math.isnan(params.r_1) else params.r_1
+    r_1 = nan_to_zero(params.r_1)
     S_y =2*(b_w*(params.t_w/2)**2/2 + 2*params.t_f*(params.b/2)**2/2)+ 4*  (1-math.pi/4)*r_1**2*(-0.776*r_1 + r_1 +params.t_w/2)
     return S_y
 
@@ -44,7 +46,7 @@ def I_w(params: dict) -> float:
 
 def J(params: dict) -> float:
     '''Torsion constant'''
-    r_1 = 0 if math.isnan(params.r_1) else params.r_1
+    r_1 = nan_to_zero(params.r_1)
     #params.darwish and Johnston, 1965
     D_1 = ((params.t_f + r_1)**2 + params.t_w *
             (r_1 + params.t_w/4))/(2*r_1 + params.t_f)
@@ -1,5 +1,7 @@
 import math
 
+from steelas.shape.arrays import nan_to_zero, where
+
 def y_c(params:dict)-> float:
     '''distance to centroid to outside of flange'''
     b_w=(params.d-params.t_f)
@@ -12,10 +14,9 @@ def y_c(params:dict)-> float:
 
 def y_pna(params:dict) -> float:
     '''plastic neutral axis distance from outside of flange'''
-    if params.t_f < A_g(params)/(2*params.b):
-        y= params.d-A_g(params)/(4*params.t_w)
-    else:
-        y=A_g(params)/(2*params.b)
+    y = where(params.t_f < A_g(params)/(2*params.b),
+              params.d-A_g(params)/(4*params.t_w),
+              A_g(params)/(2*params.b))
     return y
 
 
@@ -40,7 +41,7 @@ def I_x(params: dict) -> float:
 def I_y(params: dict) -> float:
     '''Moment of inertia - minor axis'''
     b_w=(params.d/2-params.t_f)
-    r_1 = 0 if math.isnan(params.r_1) else params.r_1
+    r_1 = nan_to_zero(params.r_1)
     I_y =b_w*params.t_w**3/12+(params.t_f*params.b**3/12)+2*(0.01825*r_1**4 + (1-math.pi/4)*r_1**2*(r_1-0.776*r_1 + params.t_w/2)**2)
     return I_y
     #return I_x(params)
@@ -48,22 +49,20 @@ def I_y(params: dict) -> float:
 def S_x(params: dict) -> float:
     '''Plastic section modulus - major axis'''
     #y_cur = y_pna(params)
-    if params.t_f < A_g(params)/(2*params.b):
-        
-        S_x = params.t_w * (params.d-params.t_f)**2/4 + \
+    S_x = where(params.t_f < A_g(params)/(2*params.b),
+            params.t_w * (params.d-params.t_f)**2/4 + \
             params.b * params.d * params.t_f / 2 - \
-            params.b**2*params.t_f**2/(4*params.t_w)
-    else:
-        S_x =  params.t_w * params.d**2/2 + params.b * params.t_f **2/4 - \
+            params.b**2*params.t_f**2/(4*params.t_w),
+            params.t_w * params.d**2/2 + params.b * params.t_f **2/4 - \
             params.d*params.t_f*params.t_w/2 -\
-            (params.d-params.t_f)**2 *params.t_w**2 / (4 * params.b)
+            (params.d-params.t_f)**2 *params.t_w**2 / (4 * params.b))
 
     return S_x
 
 def S_y(params: dict) -> float:
     '''Plastic section modulus - minor axis'''
     b_w=(params.d-params.t_f)
-    r_1 = 0 if math.isnan(params.r_1) else params.r_1
+    r_1 = nan_to_zero(params.r_1)
     S_y =2*b_w*(params.t_w/2)**2/2 + 2*params.t_f*(params.b/2)**2/2+ 2*  (1-math.pi/4)*r_1**2*(-0.776*r_1 + r_1 +params.t_w/2)
     return S_y
 